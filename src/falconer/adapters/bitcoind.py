@@ -1,7 +1,7 @@
 """Bitcoin Knots RPC adapter for Falconer."""
 
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 from pydantic import BaseModel
@@ -9,7 +9,7 @@ from pydantic import BaseModel
 from ..config import Config
 from ..exceptions import BitcoinAdapterError, BitcoinRPCError
 from ..logging import get_logger
-from ..utils import retry_on_network_error
+from ..utils import get_shared_client, retry_on_network_error
 
 logger = get_logger(__name__)
 
@@ -22,6 +22,28 @@ class BitcoinRPCResponse(BaseModel):
     id: Optional[str] = None
 
 
+class BlockchainInfo(BaseModel):
+    """Subset of ``getblockchaininfo`` fields, with defaults for missing keys."""
+
+    blocks: int = 0
+    headers: int = 0
+    chain: str = "main"
+    difficulty: float = 0.0
+    size_on_disk: int = 0
+    pruned: bool = False
+
+
+class MempoolInfo(BaseModel):
+    """Subset of ``getmempoolinfo`` fields, with defaults for missing keys."""
+
+    loaded: bool = False
+    size: int = 0
+    bytes: int = 0
+    usage: int = 0
+    maxmempool: int = 0
+    mempoolminfee: float = 0.0
+
+
 class BitcoinAdapter:
     """Adapter for Bitcoin Knots RPC interface."""
 
@@ -34,7 +56,9 @@ class BitcoinAdapter:
         self.config = config
         self.base_url = config.bitcoind_url
         self.auth = (config.bitcoind_rpc_user, config.bitcoind_rpc_pass)
-        self.client = httpx.Client(base_url=self.base_url, auth=self.auth, timeout=30.0)
+        self.client = get_shared_client(
+            self.base_url, config.rpc_pool_size, auth=self.auth, timeout=30.0
+        )
 
     @retry_on_network_error(max_attempts=3, base_delay=2.0)
     def _make_rpc_call(
@@ -81,6 +105,64 @@ class BitcoinAdapter:
             logger.error("Bitcoin Knots RPC call failed", method=method, error=str(e))
             raise BitcoinAdapterError(f"RPC call failed for method {method}: {e}")
 
+    @retry_on_network_error(max_attempts=3, base_delay=2.0)
+    def _post_batch(self, payload: List[Dict[str, Any]]) -> httpx.Response:
+        """POST a JSON-RPC batch, leaving network errors to the retry decorator."""
+        response = self.client.post("/", json=payload)
+        response.raise_for_status()
+        return response
+
+    def batch_call(self, calls: List[Tuple[str, List[Any]]]) -> List[Any]:
+        """Make several RPC calls in a single JSON-RPC batch request.
+
+        Args:
+            calls: (method, params) pairs to execute
+
+        Returns:
+            Call results, in the same order as ``calls``
+
+        Raises:
+            BitcoinAdapterError: If the request fails after retries or the reply
+                is malformed
+            BitcoinRPCError: If any call in the batch returns an error
+        """
+        payload = [
+            {"jsonrpc": "2.0", "method": method, "params": params or [], "id": str(i)}
+            for i, (method, params) in enumerate(calls)
+        ]
+        methods = [method for method, _ in calls]
+
+        try:
+            response = self._post_batch(payload)
+        except httpx.HTTPError as e:
+            logger.error("Bitcoin Knots RPC HTTP error", error=str(e))
+            raise BitcoinAdapterError(f"HTTP error connecting to Bitcoin Core: {e}")
+
+        try:
+            # bitcoind may answer batch entries in any order, so match on id
+            rpc_responses = {}
+            for item in response.json():
+                rpc_response = BitcoinRPCResponse(**item)
+                rpc_responses[rpc_response.id] = rpc_response
+        except Exception as e:
+            logger.error(
+                "Bitcoin Knots RPC batch failed", methods=methods, error=str(e)
+            )
+            raise BitcoinAdapterError(f"RPC batch failed for methods {methods}: {e}")
+
+        results = []
+        for i, method in enumerate(methods):
+            rpc_response = rpc_responses.get(str(i))
+            if rpc_response is None:
+                raise BitcoinAdapterError(f"RPC batch reply has no result for {method}")
+            if rpc_response.error:
+                raise BitcoinRPCError(
+                    f"Bitcoin Knots RPC error in {method}: {rpc_response.error}"
+                )
+            results.append(rpc_response.result)
+
+        return results
+
     def get_blockchain_info(self) -> Dict[str, Any]:
         """Get blockchain information.
 
@@ -213,5 +295,8 @@ class BitcoinAdapter:
         return response.result
 
     def close(self) -> None:
-        """Close the HTTP client."""
-        self.client.close()
+        """Release the adapter.
+
+        The pooled HTTP client is shared with other adapters and stays open for
+        reuse; it is closed at interpreter exit.
+        """
@@ -8,7 +8,7 @@ from pydantic import BaseModel
 from ..config import Config
 from ..exceptions import ElectrsAdapterError
 from ..logging import get_logger
-from ..utils import retry_on_network_error
+from ..utils import get_shared_client, retry_on_network_error
 
 logger = get_logger(__name__)
 
@@ -24,7 +24,9 @@ class ElectrsAdapter:
         """
         self.config = config
         self.base_url = config.electrs_url
-        self.client = httpx.Client(base_url=self.base_url, timeout=30.0)
+        self.client = get_shared_client(
+            self.base_url, config.rpc_pool_size, timeout=30.0
+        )
 
     @retry_on_network_error(max_attempts=3, base_delay=2.0)
     def _make_request(self, method: str, endpoint: str, **kwargs) -> Any:
@@ -188,5 +190,8 @@ class ElectrsAdapter:
         return self._make_request("POST", "/tx", content=hexstring)
 
     def close(self) -> None:
-        """Close the HTTP client."""
-        self.client.close()
+        """Release the adapter.
+
+        The pooled HTTP client is shared with other adapters and stays open for
+        reuse; it is closed at interpreter exit.
+        """
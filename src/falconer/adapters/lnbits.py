@@ -8,7 +8,7 @@ from pydantic import BaseModel
 from ..config import Config
 from ..exceptions import LNbitsAdapterError
 from ..logging import get_logger
-from ..utils import retry_on_network_error
+from ..utils import get_shared_client, retry_on_network_error
 
 logger = get_logger(__name__)
 
@@ -50,8 +50,9 @@ class LNbitsAdapter:
         self.api_key = config.lnbits_api_key
         self.wallet_id = config.lnbits_wallet_id
 
-        self.client = httpx.Client(
-            base_url=self.base_url,
+        self.client = get_shared_client(
+            self.base_url,
+            config.rpc_pool_size,
             headers={"X-Api-Key": self.api_key, "Content-Type": "application/json"},
             timeout=30.0,
         )
@@ -201,5 +202,8 @@ class LNbitsAdapter:
         return self._make_request("GET", f"/api/v1/extensions/{extension}")
 
     def close(self) -> None:
-        """Close the HTTP client."""
-        self.client.close()
+        """Release the adapter.
+
+        The pooled HTTP client is shared with other adapters and stays open for
+        reuse; it is closed at interpreter exit.
+        """
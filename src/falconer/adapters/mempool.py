@@ -1,8 +1,9 @@
 # src/falconer/adapters/mempool.py
 from __future__ import annotations
 
+import asyncio
 import os
-from typing import Optional, Union
+from typing import Dict, Optional, Union
 
 import httpx
 
@@ -48,6 +49,23 @@ class MempoolAdapter:
         # SOCKS proxy for Tor (e.g. socks5h://127.0.0.1:9050)
         self.tor_socks = _env("TOR_SOCKS_URL")
 
+        # One keep-alive client per route, created on first use
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        # Event loop the clients were created on; close() has to run there
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._close_task: Optional[asyncio.Task] = None
+
+    def _client(self, route: str) -> httpx.AsyncClient:
+        client = self._clients.get(route)
+        if client is None or client.is_closed:
+            if route == "tor":
+                client = httpx.AsyncClient(timeout=30, proxy=self.tor_socks)
+            else:
+                client = httpx.AsyncClient(timeout=20)
+            self._clients[route] = client
+            self._loop = asyncio.get_running_loop()
+        return client
+
     async def _get_json(
         self, client: httpx.AsyncClient, url: str
     ) -> Union[dict, list, str, int]:
@@ -71,8 +89,7 @@ class MempoolAdapter:
         if self.mode in ("auto", "lan") and self.lan_base:
             url = f"{self.lan_base.rstrip('/')}{path}"
             try:
-                async with httpx.AsyncClient(timeout=20) as c:
-                    data = await self._get_json(c, url)
+                data = await self._get_json(self._client("lan"), url)
                 log.info("Mempool tip via LAN", extra={"url": url})
                 return int(data) if isinstance(data, str) else int(data)
             except Exception as e:
@@ -91,16 +108,32 @@ class MempoolAdapter:
                     "MEMPOOL_TOR_URL not set but mode requires Tor"
                 )
             url = f"{self.tor_base.rstrip('/')}{path}"
-            proxies = None
-            if self.tor_socks:
-                proxies = {"http": self.tor_socks, "https": self.tor_socks}
-            async with httpx.AsyncClient(timeout=30, proxies=proxies) as c:
-                data = await self._get_json(c, url)
+            data = await self._get_json(self._client("tor"), url)
             log.info("Mempool tip via Tor", extra={"url": url})
             return int(data) if isinstance(data, str) else int(data)
 
         raise MempoolAdapterError("Mempool unreachable (no LAN/Tor succeeded)")
 
+    async def aclose(self) -> None:
+        """Close the pooled HTTP clients."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            await client.aclose()
+
     def close(self) -> None:
-        # Placeholder for symmetry with other adapters
-        pass
+        """Close the pooled HTTP clients from synchronous code.
+
+        The clients are closed on the event loop that created them. Async code
+        should await aclose() instead.
+        """
+        loop, self._loop = self._loop, None
+        if not self._clients:
+            return
+        if loop is None or loop.is_closed():
+            # Their connections went away with the loop; nothing left to close
+            self._clients.clear()
+        elif loop.is_running():
+            self._close_task = loop.create_task(self.aclose())
+        else:
+            loop.run_until_complete(self.aclose())
@@ -0,0 +1,71 @@
+"""Shared adapter instances for a single Falconer invocation."""
+
+from typing import Any, Callable, Dict, Optional
+
+from ..config import Config
+from ..logging import get_logger
+from .bitcoind import BitcoinAdapter
+from .electrs import ElectrsAdapter
+from .lnbits import LNbitsAdapter
+from .mempool import MempoolAdapter
+
+logger = get_logger(__name__)
+
+_ADAPTER_FACTORIES: Dict[str, Callable[[Config], Any]] = {
+    "bitcoin": BitcoinAdapter,
+    "electrs": ElectrsAdapter,
+    "lnbits": LNbitsAdapter,
+    "mempool": lambda config: MempoolAdapter(),
+}
+
+
+class AdapterRegistry:
+    """Construct adapters on first use and hand out the same instance afterwards."""
+
+    def __init__(
+        self,
+        config: Config,
+        factories: Optional[Dict[str, Callable[[Config], Any]]] = None,
+    ):
+        """Initialize the registry.
+
+        Args:
+            config: Falconer configuration passed to every adapter
+            factories: Adapter constructors by name; defaults to the built-in adapters
+        """
+        self.config = config
+        self._factories = factories if factories is not None else _ADAPTER_FACTORIES
+        self._adapters: Dict[str, Any] = {}
+
+    def __enter__(self) -> "AdapterRegistry":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close_all()
+
+    def get(self, name: str) -> Any:
+        """Return the adapter registered under ``name``, creating it if needed.
+
+        Args:
+            name: Registered adapter name, e.g. "bitcoin", "electrs", "lnbits" or
+                "mempool"
+
+        Returns:
+            The shared adapter instance
+
+        Raises:
+            KeyError: If no adapter is registered under ``name``
+        """
+        adapter = self._adapters.get(name)
+        if adapter is None:
+            adapter = self._adapters[name] = self._factories[name](self.config)
+        return adapter
+
+    def close_all(self) -> None:
+        """Close every adapter handed out so far."""
+        for name, adapter in self._adapters.items():
+            try:
+                adapter.close()
+            except Exception as e:
+                logger.error("Failed to close adapter", adapter=name, error=str(e))
+        self._adapters.clear()
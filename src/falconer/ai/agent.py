@@ -162,8 +162,8 @@ class AIAgent:
                 self.proposal_manager.should_create_proposal(self.state.current_balance_sats)):
                 
                 # Check if we're under the max pending limit
-                pending_proposals = self.proposal_manager.list_proposals(status="pending")
-                if len(pending_proposals) < self.config.funding_proposal_max_pending:
+                pending_count = self.persistence.count_proposals(status="pending")
+                if pending_count < self.config.funding_proposal_max_pending:
                     await self._generate_and_send_funding_proposal(market_data)
             
         except Exception as e:
@@ -12,6 +12,7 @@ from ..adapters.bitcoind import BitcoinAdapter
 from ..adapters.electrs import ElectrsAdapter
 from ..adapters.mempool import MempoolAdapter
 from ..config import Config
+from ..http_cache import read_cached, write_cached
 from ..logging import get_logger
 
 logger = get_logger(__name__)
@@ -44,13 +45,20 @@ class EarningOpportunity(BaseModel):
 class MarketAnalyzer:
     """AI-powered market analyzer for Bitcoin earning opportunities."""
     
-    def __init__(self, config: Config):
+    def __init__(
+        self, config: Config, cache_ttl: float = 0.0, refresh_cache: bool = False
+    ):
         """Initialize the market analyzer.
         
         Args:
             config: Falconer configuration
+            cache_ttl: Seconds to reuse on-disk market data snapshots; 0 disables
+                the cache
+            refresh_cache: Fetch fresh data on the first call and overwrite the snapshot
         """
         self.config = config
+        self.cache_ttl = cache_ttl
+        self.refresh_cache = refresh_cache
         self.bitcoin_adapter = BitcoinAdapter(config)
         self.electrs_adapter = ElectrsAdapter(config)
         self.mempool_adapter = MempoolAdapter()
@@ -113,6 +121,18 @@ class MarketAnalyzer:
     async def _gather_market_data(self) -> Dict[str, Any]:
         """Gather current market data from various sources."""
         data = {}
+        cache_params = {
+            "bitcoind": self.config.bitcoind_url,
+            "mempool": self.mempool_adapter.mode,
+        }
+
+        cached = None
+        if not self.refresh_cache:
+            cached = read_cached("market_data", cache_params, self.cache_ttl)
+        if cached is not None and "timestamp" in cached:
+            # Report when the snapshot was captured, not when it was reused
+            cached["timestamp"] = datetime.fromisoformat(cached["timestamp"])
+            return cached
 
         try:
             # Get Bitcoin Core data (using asyncio.to_thread to avoid blocking)
@@ -137,8 +157,11 @@ class MarketAnalyzer:
                 "mempool_info": mempool_info,
                 "fee_estimates": fee_estimates,
                 "mempool_tip": mempool_tip,
-                "timestamp": datetime.utcnow()
+                "timestamp": datetime.utcnow(),
             })
+            if self.cache_ttl > 0:
+                await asyncio.to_thread(write_cached, "market_data", cache_params, data)
+                self.refresh_cache = False
             
         except Exception as e:
             logger.error("Failed to gather market data", error=str(e))
@@ -428,5 +451,15 @@ class MarketAnalyzer:
         try:
             self.bitcoin_adapter.close()
             self.electrs_adapter.close()
+            self.mempool_adapter.close()
+        except Exception as e:
+            logger.error("Failed to close market analyzer", error=str(e))
+    
+    async def aclose(self) -> None:
+        """Close adapters from async code, awaiting the Mempool clients."""
+        try:
+            self.bitcoin_adapter.close()
+            self.electrs_adapter.close()
+            await self.mempool_adapter.aclose()
         except Exception as e:
             logger.error("Failed to close market analyzer", error=str(e))
@@ -1,59 +1,127 @@
 """FastAPI test endpoints for OpenClaw integration PoC."""
 
+import asyncio
+import hashlib
+import hmac
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional
 
 from fastapi import FastAPI, Request, HTTPException, Header, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.security import APIKeyHeader
 import uvicorn
 
 from .. import __version__
 from ..config import Config
 from ..logging import get_logger
-from ..adapters.bitcoind import BitcoinAdapter
+from ..adapters.bitcoind import BitcoinAdapter, BlockchainInfo, MempoolInfo
 from ..adapters.electrs import ElectrsAdapter
 from ..adapters.mempool import MempoolAdapter
+from ..adapters.registry import AdapterRegistry
+from ..utils import json_dumps, json_loads
 
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _error_body_prefix(status_code: int, error: str) -> bytes:
+    """Encode the static part of an error body once per distinct error."""
+    # Drop the closing brace so the per-response timestamp can be appended.
+    return json_dumps({"error": error, "status_code": status_code})[:-1]
+
+
+def _error_response(status_code: int, error: Any) -> Response:
+    """Build the standard error response from a cached body prefix."""
+    timestamp = datetime.utcnow().isoformat().encode()
+    if isinstance(error, str):
+        body = (
+            _error_body_prefix(status_code, error)
+            + b',"timestamp":"'
+            + timestamp
+            + b'"}'
+        )
+    else:
+        body = json_dumps(
+            {
+                "error": error,
+                "status_code": status_code,
+                "timestamp": timestamp.decode(),
+            }
+        )
+    return Response(
+        content=body, status_code=status_code, media_type="application/json"
+    )
+
+
 def create_api_app(config: Config) -> FastAPI:
     """Factory function to create configured FastAPI app with dependency injection."""
+    # Adapters are built on first use and shared by every request; the classes
+    # are resolved at call time so module-level replacements take effect.
+    adapters = AdapterRegistry(
+        config,
+        {
+            "bitcoin": lambda cfg: BitcoinAdapter(cfg),
+            "electrs": lambda cfg: ElectrsAdapter(cfg),
+        },
+    )
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        yield
+        adapters.close_all()
+
     app = FastAPI(
         title="Falconer Test API",
         description="Test API for OpenClaw integration PoC",
         version=__version__,
+        lifespan=lifespan,
     )
     app.state.config = config
+    app.state.response_cache = {}
+    app.state.neg_cache = {}
+    app.state.adapters = adapters
 
-    # Security and middleware setup
+    # Security and middleware setup. Explicit method/header lists let Starlette
+    # precompute the preflight response; credentials are only allowed for an
+    # explicit origin list since browsers reject them alongside "*".
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_origins=config.cors_origins,
+        allow_credentials="*" not in config.cors_origins,
+        allow_methods=["GET", "POST"],
+        allow_headers=["X-API-Key", "Content-Type"],
     )
 
     # API key security for OpenClaw integration
-    api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
-
-    async def get_api_key(api_key: str = Depends(api_key_header)):
-        """Validate API key for OpenClaw integration."""
-        # If OpenClaw integration is disabled, allow access without API key for backward compatibility
-        if not config.openclaw_enabled:
+    if not config.openclaw_enabled:
+        # Integration disabled: allow access without API key for backward
+        # compatibility, and skip header parsing entirely.
+        async def get_api_key() -> None:
+            """Allow access when OpenClaw integration is disabled."""
             return None
-        
-        # If API key is configured, validate it
-        if config.openclaw_api_key:
-            if not api_key:
-                raise HTTPException(status_code=401, detail="API key required")
-            if api_key != config.openclaw_api_key:
-                raise HTTPException(status_code=401, detail="Invalid API key")
-        
-        return api_key
+
+    else:
+        api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
+        expected_api_key = (
+            config.openclaw_api_key.encode() if config.openclaw_api_key else None
+        )
+
+        async def get_api_key(
+            api_key: Optional[str] = Depends(api_key_header),
+        ) -> Optional[str]:
+            """Validate API key for OpenClaw integration."""
+            # If API key is configured, validate it
+            if expected_api_key is not None:
+                if not api_key:
+                    raise HTTPException(status_code=401, detail="API key required")
+                if not hmac.compare_digest(api_key.encode(), expected_api_key):
+                    raise HTTPException(status_code=401, detail="Invalid API key")
+
+            return api_key
 
     @app.middleware("http")
     async def log_requests(request: Request, call_next):
@@ -85,27 +153,55 @@ def create_api_app(config: Config) -> FastAPI:
     async def http_exception_handler(request: Request, exc: HTTPException):
         """Handle HTTP exceptions with consistent error format."""
         logger.error("HTTP Exception", error=str(exc.detail), status_code=exc.status_code)
-        return JSONResponse(
-            status_code=exc.status_code,
-            content={
-                "error": exc.detail,
-                "status_code": exc.status_code,
-                "timestamp": datetime.utcnow().isoformat(),
-            },
-        )
+        return _error_response(exc.status_code, exc.detail)
 
     @app.exception_handler(Exception)
     async def general_exception_handler(request: Request, exc: Exception):
         """Handle unexpected exceptions."""
         logger.error("Unexpected error", error=str(exc), exc_info=True)
-        return JSONResponse(
-            status_code=500,
-            content={
-                "error": "Internal server error",
-                "status_code": 500,
-                "timestamp": datetime.utcnow().isoformat(),
-            },
-        )
+        return _error_response(500, "Internal server error")
+
+    def cached_json_response(
+        request: Request, key: str, build: Callable[[], Dict[str, Any]]
+    ) -> Response:
+        """Serve a short-lived cached JSON body, answering If-None-Match with 304."""
+        now = time.monotonic()
+        entry = app.state.response_cache.get(key)
+        if entry is None or now - entry[0] > config.api_cache_ttl_seconds:
+            body = json_dumps(build())
+            etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+            entry = (now, body, etag)
+            app.state.response_cache[key] = entry
+
+        _, body, etag = entry
+        headers = {
+            "ETag": etag,
+            "Cache-Control": f"max-age={config.api_cache_ttl_seconds}",
+        }
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    def call_upstream(key: str, call: Callable[[], Any], trip: bool = True) -> Any:
+        """Run an upstream call, failing fast with 503 shortly after a failure.
+
+        Lookups driven by caller input pass ``trip=False`` so a bad address or
+        txid does not mark the whole upstream as unavailable.
+        """
+        failed_at = app.state.neg_cache.get(key)
+        if (
+            failed_at is not None
+            and time.monotonic() - failed_at < config.api_upstream_backoff_seconds
+        ):
+            raise HTTPException(status_code=503, detail="Upstream unavailable")
+        try:
+            result = call()
+        except Exception:
+            if trip:
+                app.state.neg_cache[key] = time.monotonic()
+            raise
+        app.state.neg_cache.pop(key, None)
+        return result
 
     @app.get("/api/health")
     async def health_check():
@@ -134,79 +230,81 @@ def create_api_app(config: Config) -> FastAPI:
     @app.post("/api/test/echo")
     async def echo_test(request: Request):
         """Echo back request payload to test request/response cycle."""
+        raw = await request.body()
         try:
-            body = await request.json()
-        except Exception:
+            body = json_loads(raw) if raw else {}
+        except ValueError:
             body = {}
-        return JSONResponse(status_code=200, content={"echo": body})
+        return Response(
+            content=json_dumps({"echo": body}), media_type="application/json"
+        )
 
     @app.get("/api/bitcoin/blockchain-info")
-    async def get_blockchain_info(api_key: str = Depends(get_api_key)):
+    async def get_blockchain_info(
+        request: Request, api_key: str = Depends(get_api_key)
+    ):
         """Get current blockchain information from Bitcoin node."""
-        try:
-            bitcoin_adapter = BitcoinAdapter(config)
-            info = bitcoin_adapter.get_blockchain_info()
-            bitcoin_adapter.close()
-            
-            return JSONResponse(
-                status_code=200,
-                content={
-                    "blocks": info.get("blocks", 0),
-                    "headers": info.get("headers", 0),
-                    "chain": info.get("chain", "main"),
-                    "difficulty": info.get("difficulty", 0),
-                    "size_on_disk": info.get("size_on_disk", 0),
-                    "pruned": info.get("pruned", False),
-                    "timestamp": datetime.utcnow().isoformat(),
-                },
+
+        def build() -> Dict[str, Any]:
+            bitcoin_adapter = adapters.get("bitcoin")
+            info = BlockchainInfo.model_validate(
+                call_upstream("bitcoind", bitcoin_adapter.get_blockchain_info)
             )
+
+            return {**info.model_dump(), "timestamp": datetime.utcnow().isoformat()}
+
+        try:
+            return cached_json_response(request, "blockchain-info", build)
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error("Failed to get blockchain info", error=str(e))
             raise HTTPException(status_code=500, detail="Failed to get blockchain info")
 
     @app.get("/api/bitcoin/mempool-info")
-    async def get_mempool_info(api_key: str = Depends(get_api_key)):
+    async def get_mempool_info(request: Request, api_key: str = Depends(get_api_key)):
         """Get current mempool information."""
-        try:
-            bitcoin_adapter = BitcoinAdapter(config)
-            mempool_info = bitcoin_adapter.get_mempool_info()
-            bitcoin_adapter.close()
-            
-            return JSONResponse(
-                status_code=200,
-                content={
-                    "loaded": mempool_info.get("loaded", False),
-                    "size": mempool_info.get("size", 0),
-                    "bytes": mempool_info.get("bytes", 0),
-                    "usage": mempool_info.get("usage", 0),
-                    "maxmempool": mempool_info.get("maxmempool", 0),
-                    "mempoolminfee": mempool_info.get("mempoolminfee", 0),
-                    "timestamp": datetime.utcnow().isoformat(),
-                },
+
+        def build() -> Dict[str, Any]:
+            bitcoin_adapter = adapters.get("bitcoin")
+            mempool_info = MempoolInfo.model_validate(
+                call_upstream("bitcoind", bitcoin_adapter.get_mempool_info)
             )
+
+            return {
+                **mempool_info.model_dump(),
+                "timestamp": datetime.utcnow().isoformat(),
+            }
+
+        try:
+            return cached_json_response(request, "mempool-info", build)
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error("Failed to get mempool info", error=str(e))
             raise HTTPException(status_code=500, detail="Failed to get mempool info")
 
     @app.get("/api/bitcoin/fee-estimates")
-    async def get_fee_estimates(api_key: str = Depends(get_api_key)):
+    async def get_fee_estimates(request: Request, api_key: str = Depends(get_api_key)):
         """Get current fee estimates for different confirmation targets."""
+
+        def build() -> Dict[str, Any]:
+            bitcoin_adapter = adapters.get("bitcoin")
+            estimates = call_upstream("bitcoind", bitcoin_adapter.estimate_fee_rates)
+
+            return {
+                "fast": estimates.get("fast", 10),
+                "medium": estimates.get("medium", 5),
+                "slow": estimates.get("slow", 2),
+                "economical": estimates.get("economical", 1),
+                "minimum": estimates.get("minimum", 1),
+                "timestamp": datetime.utcnow().isoformat(),
+            }
+
         try:
-            bitcoin_adapter = BitcoinAdapter(config)
-            estimates = bitcoin_adapter.estimate_fee_rates()
-            bitcoin_adapter.close()
-            
-            return JSONResponse(
-                status_code=200,
-                content={
-                    "fast": estimates.get("fast", 10),
-                    "medium": estimates.get("medium", 5),
-                    "slow": estimates.get("slow", 2),
-                    "economical": estimates.get("economical", 1),
-                    "minimum": estimates.get("minimum", 1),
-                    "timestamp": datetime.utcnow().isoformat(),
-                },
-            )
+            return cached_json_response(request, "fee-estimates", build)
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error("Failed to get fee estimates", error=str(e))
             raise HTTPException(status_code=500, detail="Failed to get fee estimates")
@@ -215,35 +313,42 @@ def create_api_app(config: Config) -> FastAPI:
     async def get_network_stats(api_key: str = Depends(get_api_key)):
         """Get Bitcoin network statistics and health indicators."""
         try:
-            bitcoin_adapter = BitcoinAdapter(config)
-            electrs_adapter = ElectrsAdapter(config)
-            
-            # Get blockchain info
-            blockchain_info = bitcoin_adapter.get_blockchain_info()
-            
-            # Get mempool info
-            mempool_info = bitcoin_adapter.get_mempool_info()
-            
-            # Get tip height from Electrs
-            tip_height = electrs_adapter.get_tip_height()
-            
-            bitcoin_adapter.close()
-            electrs_adapter.close()
+            bitcoin_adapter = adapters.get("bitcoin")
+            electrs_adapter = adapters.get("electrs")
+
+            # Query blockchain info, mempool info and the Electrs tip concurrently
+            raw_blockchain_info, raw_mempool_info, tip_height = await asyncio.gather(
+                asyncio.to_thread(
+                    call_upstream, "bitcoind", bitcoin_adapter.get_blockchain_info
+                ),
+                asyncio.to_thread(
+                    call_upstream, "bitcoind", bitcoin_adapter.get_mempool_info
+                ),
+                asyncio.to_thread(
+                    call_upstream, "electrs", electrs_adapter.get_tip_height
+                ),
+            )
+            blockchain_info = BlockchainInfo.model_validate(raw_blockchain_info)
+            mempool_info = MempoolInfo.model_validate(raw_mempool_info)
             
             return JSONResponse(
                 status_code=200,
                 content={
-                    "network": blockchain_info.get("chain", "main"),
-                    "block_height": blockchain_info.get("blocks", 0),
+                    "network": blockchain_info.chain,
+                    "block_height": blockchain_info.blocks,
                     "electrs_tip_height": tip_height,
-                    "difficulty": blockchain_info.get("difficulty", 0),
-                    "mempool_size": mempool_info.get("size", 0),
-                    "mempool_bytes": mempool_info.get("bytes", 0),
-                    "hash_rate": blockchain_info.get("difficulty", 0) * 2**32 / 600,  # Approximate
-                    "is_synced": blockchain_info.get("blocks", 0) == blockchain_info.get("headers", 0),
+                    "difficulty": blockchain_info.difficulty,
+                    "mempool_size": mempool_info.size,
+                    "mempool_bytes": mempool_info.bytes,
+                    "hash_rate": blockchain_info.difficulty
+                    * 2**32
+                    / 600,  # Approximate
+                    "is_synced": blockchain_info.blocks == blockchain_info.headers,
                     "timestamp": datetime.utcnow().isoformat(),
                 },
             )
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error("Failed to get network stats", error=str(e))
             raise HTTPException(status_code=500, detail="Failed to get network stats")
@@ -275,12 +380,12 @@ def create_api_app(config: Config) -> FastAPI:
     async def get_address_info(address: str, api_key: str = Depends(get_api_key)):
         """Get information about a Bitcoin address."""
         try:
-            electrs_adapter = ElectrsAdapter(config)
-            
+            electrs_adapter = adapters.get("electrs")
+
             # Get address info from Electrs
-            address_info = electrs_adapter.get_address_info(address)
-            
-            electrs_adapter.close()
+            address_info = call_upstream(
+                "electrs", lambda: electrs_adapter.get_address_info(address), trip=False
+            )
             
             return JSONResponse(
                 status_code=200,
@@ -292,6 +397,8 @@ def create_api_app(config: Config) -> FastAPI:
                     "timestamp": datetime.utcnow().isoformat(),
                 },
             )
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error("Failed to get address info", error=str(e), address=address)
             raise HTTPException(status_code=400, detail=f"Invalid address or error: {str(e)}")
@@ -300,12 +407,12 @@ def create_api_app(config: Config) -> FastAPI:
     async def get_transaction(tx_id: str, api_key: str = Depends(get_api_key)):
         """Get information about a Bitcoin transaction."""
         try:
-            bitcoin_adapter = BitcoinAdapter(config)
-            
+            bitcoin_adapter = adapters.get("bitcoin")
+
             # Get transaction info
-            tx_info = bitcoin_adapter.get_transaction(tx_id)
-            
-            bitcoin_adapter.close()
+            tx_info = call_upstream(
+                "bitcoind", lambda: bitcoin_adapter.get_transaction(tx_id), trip=False
+            )
             
             return JSONResponse(
                 status_code=200,
@@ -319,6 +426,8 @@ def create_api_app(config: Config) -> FastAPI:
                     "timestamp": datetime.utcnow().isoformat(),
                 },
             )
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error("Failed to get transaction info", error=str(e), tx_id=tx_id)
             raise HTTPException(status_code=404, detail=f"Transaction not found: {str(e)}")
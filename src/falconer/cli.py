@@ -1,61 +1,40 @@
 """Command-line interface for Falconer."""
 
-import json
-from pathlib import Path
+import atexit
+import os
+import sys
+from functools import lru_cache, wraps
 from typing import Optional
 
 import click
 from dotenv import load_dotenv
 
-from .adapters.bitcoind import BitcoinAdapter
-from .adapters.electrs import ElectrsAdapter
-from .adapters.lnbits import LNbitsAdapter
-from .ai.agent import AIAgent
-from .ai.market_analyzer import MarketAnalyzer
-from .ai.earning_strategies import EarningStrategyManager
+# Adapter, AI, wallet, server and HTTP utility modules are imported inside the commands
+# that use them so `falconer --help` and light commands start quickly.
 from .config import Config
-from .persistence import PersistenceManager
-from .exceptions import (
-    AddressValidationError,
-    BitcoinRPCError,
-    FalconerError,
-    InsufficientFundsError,
-    PolicyViolationError,
-    PSBTError,
-)
+from .exceptions import AddressValidationError, FalconerError
 from .logging import get_logger, setup_logging
-from .policy.engine import PolicyEngine
-from .policy.schema import Policy
-from .tasks.fee_brief import FeeBriefTask
-from .validation import validate_bitcoin_address
-from .wallet.psbt import PSBTManager
-
-# Import funding modules here to avoid circular imports
-try:
-    from .funding.manager import FundingProposalManager
-    from .funding.n8n_adapter import N8nAdapter
-    from .funding.webhook_server import create_webhook_app, run_webhook_server
-except ImportError:
-    # Handle case where funding module is not available
-    FundingProposalManager = None
-    N8nAdapter = None
-    create_webhook_app = None
-    run_webhook_server = None
-
-# Import API module for OpenClaw integration
-try:
-    from .api.test_endpoints import run_api_server
-except ImportError:
-    run_api_server = None
-
-# Load environment variables
-load_dotenv()
+
+# Load environment variables once per process tree; child processes (e.g.
+# uvicorn workers) inherit the already-populated environment. Set
+# FALCONER_SKIP_DOTENV=1 when the environment is managed externally.
+if not (
+    os.environ.get("FALCONER_DOTENV_LOADED")
+    or os.environ.get("FALCONER_SKIP_DOTENV") == "1"
+):
+    load_dotenv()
+    os.environ["FALCONER_DOTENV_LOADED"] = "1"
 
 logger = get_logger(__name__)
 
 
 @click.group()
-@click.option("--config", "-c", help="Configuration file path")
+@click.option(
+    "--config",
+    "-c",
+    type=click.Path(exists=True, dir_okay=False, resolve_path=True),
+    help="Configuration file path",
+)
 @click.option("--log-level", default="INFO", help="Log level")
 @click.pass_context
 def main(ctx, config: Optional[str], log_level: str):
@@ -63,49 +42,168 @@ def main(ctx, config: Optional[str], log_level: str):
     # Setup logging
     setup_logging(log_level=log_level)
 
-    # Load configuration
-    if config:
-        config_path = Path(config)
-        if config_path.exists():
-            load_dotenv(config_path)
+    # Load configuration; click has already checked and resolved the path
+    config_mtime = os.stat(config).st_mtime if config else None
 
     ctx.ensure_object(dict)
-    ctx.obj["config"] = Config()
+    ctx.obj["config_path"] = config
+    ctx.obj["config"] = _load_config(config, config_mtime)
+
+
+def _load_config(config_file: Optional[str], config_mtime: Optional[float]) -> Config:
+    """Load and validate configuration for one invocation.
+
+    Without a config file the environment is read afresh every time. A config
+    file is parsed once per version, and each invocation gets its own copy so
+    that in-place overrides do not leak into later commands.
+    """
+    if not config_file:
+        return Config()
+    return _load_file_config(config_file, config_mtime).model_copy(deep=True)
+
+
+@lru_cache(maxsize=4)
+def _load_file_config(config_file: str, config_mtime: float) -> Config:
+    """Load and validate a config file once per file version."""
+    load_dotenv(config_file)
+    return Config()
+
+
+def _get_persistence(ctx):
+    """Return the persistence manager shared by commands in this invocation."""
+    if "persistence" not in ctx.obj:
+        from .persistence import PersistenceManager
+
+        ctx.obj["persistence"] = PersistenceManager()
+    return ctx.obj["persistence"]
+
+
+def _get_adapter(ctx, name: str):
+    """Return the adapter shared by commands in this invocation."""
+    if "adapters" not in ctx.obj:
+        from .adapters.registry import AdapterRegistry
+
+        registry = ctx.obj["adapters"] = AdapterRegistry(ctx.obj["config"])
+        ctx.find_root().call_on_close(registry.close_all)
+    return ctx.obj["adapters"].get(name)
+
+
+def _get_policy_engine(ctx):
+    """Return the policy engine built from the config limits for this invocation."""
+    if "policy_engine" not in ctx.obj:
+        from .policy.engine import PolicyEngine
+        from .policy.schema import Policy
+
+        config = ctx.obj["config"]
+        ctx.obj["policy_engine"] = PolicyEngine(
+            Policy(
+                max_daily_spend_sats=config.max_daily_spend_sats,
+                max_single_tx_sats=config.max_single_tx_sats,
+                allowed_destinations=config.allowed_destinations,
+            )
+        )
+    return ctx.obj["policy_engine"]
+
+
+@lru_cache(maxsize=1)
+def _funding_import_error() -> Optional[ImportError]:
+    """Import the funding modules once; return the ImportError if unavailable."""
+    try:
+        from .funding import manager, n8n_adapter  # noqa: F401
+    except ImportError as e:
+        return e
+    return None
+
+
+def _get_proposal_manager(ctx):
+    """Return the shared funding proposal manager, or None if funding is unavailable."""
+    if "proposal_manager" not in ctx.obj:
+        if _funding_import_error() is not None:
+            # Handle case where funding module is not available
+            ctx.obj["proposal_manager"] = None
+            return None
+        from .funding.manager import FundingProposalManager
+
+        ctx.obj["proposal_manager"] = FundingProposalManager(
+            ctx.obj["config"], _get_persistence(ctx), _get_adapter(ctx, "lnbits")
+        )
+    return ctx.obj["proposal_manager"]
+
+
+def cli_errors(message: str, catch_all: bool = True, abort: bool = True):
+    """Log, report and abort on errors raised by a command.
+
+    Falconer errors are reported as ``Error: ...``; anything else as
+    ``Unexpected error: ...``. Click's own exceptions pass through untouched.
+    With ``catch_all=False`` only Falconer, network and timeout errors are
+    reported and any other exception propagates with its traceback.
+    With ``abort=False`` the command returns after reporting the error, so
+    the process still exits with status 0; the proposal, webhook and API
+    server commands rely on this.
+    """
+
+    def report(label: str, error: str) -> None:
+        logger.error(message, error=error)
+        click.echo(f"{label}: {error}", err=True)
+        if abort:
+            raise click.Abort()
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except (click.ClickException, click.Abort, click.exceptions.Exit):
+                raise
+            except FalconerError as e:
+                report("Error", str(e))
+            except Exception as e:
+                if catch_all:
+                    label = "Unexpected error"
+                elif _is_backend_error(e):
+                    label = "Error"
+                else:
+                    raise
+                report(label, _describe_error(e))
+            return None
+
+        return wrapper
+
+    return decorator
 
 
 @main.command()
 @click.option("--output", "-o", help="Output file path")
 @click.pass_context
+@cli_errors("Failed to generate fee brief", catch_all=False)
 def fee_brief(ctx, output: Optional[str]):
     """Generate a fee intelligence brief."""
-    config = ctx.obj["config"]
-
-    try:
-        # Initialize adapters
-        bitcoin_adapter = BitcoinAdapter(config)
-        electrs_adapter = ElectrsAdapter(config)
+    from .tasks.fee_brief import FeeBriefTask
+    from .utils import dump_model_json
 
-        # Create fee brief task
-        fee_task = FeeBriefTask(config, bitcoin_adapter, electrs_adapter)
+    config = ctx.obj["config"]
 
-        # Generate brief
-        brief = fee_task.generate_fee_brief()
+    # Initialize adapters
+    bitcoin_adapter = _get_adapter(ctx, "bitcoin")
+    electrs_adapter = _get_adapter(ctx, "electrs")
 
-        # Output results
-        if output:
-            fee_task.save_fee_brief(brief, output)
-            click.echo(f"Fee brief saved to {output}")
-        else:
-            click.echo(json.dumps(brief.dict(), indent=2, default=str))
+    # Create fee brief task
+    fee_task = FeeBriefTask(config, bitcoin_adapter, electrs_adapter)
 
-        # Cleanup
-        bitcoin_adapter.close()
-        electrs_adapter.close()
+    # Generate brief
+    brief = fee_task.generate_fee_brief()
 
-    except Exception as e:
-        logger.error("Failed to generate fee brief", error=str(e))
-        click.echo(f"Error: {e}", err=True)
-        raise click.Abort()
+    # Output results
+    if output:
+        fee_task.save_fee_brief(brief, output)
+        click.echo(f"Fee brief saved to {output}")
+    else:
+        # Write the encoded bytes straight to the binary stdout stream; the
+        # newline goes separately so the document is not copied to append it
+        stdout = click.get_binary_stream("stdout")
+        stdout.write(dump_model_json(brief, indent=True))
+        stdout.write(b"\n")
+        stdout.flush()
 
 
 @main.command()
@@ -115,6 +213,7 @@ def fee_brief(ctx, output: Optional[str]):
 @click.option("--description", help="Transaction description")
 @click.option("--dry-run", is_flag=True, help="Create PSBT without broadcasting")
 @click.pass_context
+@cli_errors("Transaction failed")
 def send(
     ctx,
     address: str,
@@ -124,183 +223,246 @@ def send(
     dry_run: bool,
 ):
     """Create and optionally broadcast a Bitcoin transaction."""
-    config = ctx.obj["config"]
+    from .validation import validate_bitcoin_address
 
+    # Validate Bitcoin address before loading the wallet stack or touching any backend
     try:
-        # Initialize adapters
-        bitcoin_adapter = BitcoinAdapter(config)
-
-        # Create policy engine
-        policy = Policy(
-            max_daily_spend_sats=config.max_daily_spend_sats,
-            max_single_tx_sats=config.max_single_tx_sats,
-            allowed_destinations=config.allowed_destinations,
-        )
-        policy_engine = PolicyEngine(policy)
+        validate_bitcoin_address(address)
+    except AddressValidationError as e:
+        click.echo(f"Invalid Bitcoin address: {e}", err=True)
+        raise click.Abort()
 
-        # Create PSBT manager
-        psbt_manager = PSBTManager(config, bitcoin_adapter)
+    from .policy.schema import TransactionRequest
+    from .wallet.psbt import PSBTManager
 
-        # Validate Bitcoin address
-        try:
-            validate_bitcoin_address(address)
-        except AddressValidationError as e:
-            click.echo(f"Invalid Bitcoin address: {e}", err=True)
-            raise click.Abort()
+    config = ctx.obj["config"]
 
-        # Create transaction request
-        from .policy.schema import TransactionRequest
+    # Initialize adapters
+    bitcoin_adapter = _get_adapter(ctx, "bitcoin")
 
-        request = TransactionRequest(
-            destination=address,
-            amount_sats=amount,
-            fee_rate_sats_per_vbyte=fee_rate,
-            description=description,
-        )
+    policy_engine = _get_policy_engine(ctx)
 
-        # Validate transaction against policy
-        violations = policy_engine.validate_transaction(request)
-        if violations:
-            click.echo("Policy violations detected:", err=True)
-            for violation in violations:
-                click.echo(
-                    f"  - {violation.violation_type}: {violation.message}", err=True
-                )
-            raise click.Abort()
+    # Create PSBT manager
+    psbt_manager = PSBTManager(config, bitcoin_adapter)
 
-        # Create PSBT
-        psbt_tx = psbt_manager.create_psbt(request)
-
-        click.echo(f"PSBT created successfully:")
-        click.echo(f"  Fee: {psbt_tx.fee} sats")
-        click.echo(f"  Fee rate: {psbt_tx.fee_rate:.2f} sats/vbyte")
-        click.echo(f"  Size: {psbt_tx.size} bytes")
-        click.echo(f"  PSBT: {psbt_tx.psbt}")
-
-        if not dry_run:
-            # Broadcast transaction
-            txid = psbt_manager.broadcast_psbt(psbt_tx.psbt)
-            click.echo(f"Transaction broadcast: {txid}")
-
-            # Record transaction in policy engine
-            policy_engine.record_transaction(request, txid)
-
-        # Cleanup
-        bitcoin_adapter.close()
-
-    except (
-        BitcoinRPCError,
-        PSBTError,
-        InsufficientFundsError,
-        PolicyViolationError,
-    ) as e:
-        logger.error("Transaction failed", error=str(e))
-        click.echo(f"Error: {e}", err=True)
-        raise click.Abort()
-    except Exception as e:
-        logger.error("Unexpected error during transaction", error=str(e))
-        click.echo(f"Unexpected error: {e}", err=True)
+    # Create transaction request
+    request = TransactionRequest(
+        destination=address,
+        amount_sats=amount,
+        fee_rate_sats_per_vbyte=fee_rate,
+        description=description,
+    )
+
+    # Validate transaction against policy
+    violations = policy_engine.validate_transaction(request)
+    if violations:
+        click.echo("Policy violations detected:", err=True)
+        for violation in violations:
+            click.echo(
+                f"  - {violation.violation_type}: {violation.message}", err=True
+            )
         raise click.Abort()
 
+    # Create PSBT
+    psbt_tx = psbt_manager.create_psbt(request)
+
+    click.echo(f"PSBT created successfully:")
+    click.echo(f"  Fee: {psbt_tx.fee} sats")
+    click.echo(f"  Fee rate: {psbt_tx.fee_rate:.2f} sats/vbyte")
+    click.echo(f"  Size: {psbt_tx.size} bytes")
+    click.echo(f"  PSBT: {psbt_tx.psbt}")
+
+    if not dry_run:
+        # Broadcast transaction
+        txid = psbt_manager.broadcast_psbt(psbt_tx.psbt)
+        click.echo(f"Transaction broadcast: {txid}")
+
+        # Record transaction in policy engine
+        policy_engine.record_transaction(request, txid)
+
+
+def _write_lines(lines) -> None:
+    """Write plain output lines straight to stdout, skipping click.echo per line."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+_event_loop = None
+
+
+def _new_event_loop():
+    """Create an event loop, preferring uvloop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        import asyncio
+
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
+
+
+def run_async(coro):
+    """Run a coroutine on the CLI's shared event loop."""
+    import asyncio
+
+    global _event_loop
+    if _event_loop is None or _event_loop.is_closed():
+        _event_loop = _new_event_loop()
+        asyncio.set_event_loop(_event_loop)
+        atexit.register(_close_event_loop)
+    return _event_loop.run_until_complete(coro)
+
+
+def _close_event_loop() -> None:
+    """Finalize async generators and close the CLI event loop at exit."""
+    if _event_loop is not None and not _event_loop.is_closed():
+        _event_loop.run_until_complete(_event_loop.shutdown_asyncgens())
+        _event_loop.close()
+
+
+async def _run_blocking(call, timeout: float):
+    """Run a blocking adapter call in a worker thread, bounded by a timeout."""
+    import asyncio
+
+    return await asyncio.wait_for(asyncio.to_thread(call), timeout=timeout)
+
+
+def _is_backend_error(error: BaseException) -> bool:
+    """Return True for network and timeout failures raised outside the adapters."""
+    from asyncio import TimeoutError as AsyncTimeoutError
+
+    import httpx
+
+    # Before Python 3.11 asyncio.wait_for raises asyncio.TimeoutError, not the builtin
+    return isinstance(
+        error, (httpx.HTTPError, TimeoutError, AsyncTimeoutError, ConnectionError)
+    )
+
+
+def _describe_error(error: BaseException) -> str:
+    """Return a printable message for a failed probe."""
+    from asyncio import TimeoutError as AsyncTimeoutError
+
+    if isinstance(error, AsyncTimeoutError):
+        return "timed out"
+    return str(error) or type(error).__name__
+
 
 @main.command()
 @click.pass_context
+@cli_errors("Failed to get balance", catch_all=False)
 def balance(ctx):
     """Get wallet balance information."""
-    config = ctx.obj["config"]
+    import asyncio
 
-    try:
-        # Initialize adapters
-        bitcoin_adapter = BitcoinAdapter(config)
-        lnbits_adapter = LNbitsAdapter(config)
+    config = ctx.obj["config"]
 
-        # Get Bitcoin balance
-        btc_balance = bitcoin_adapter.get_balance()
+    # Initialize adapters
+    bitcoin_adapter = _get_adapter(ctx, "bitcoin")
+    lnbits_adapter = _get_adapter(ctx, "lnbits")
+
+    async def _run():
+        timeout = config.status_timeout_seconds
+        # Query both wallets concurrently; collect every result so no task
+        # error is left unretrieved, then surface the first failure
+        results = await asyncio.gather(
+            _run_blocking(bitcoin_adapter.get_balance, timeout),
+            _run_blocking(lnbits_adapter.get_wallet_balance, timeout),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        btc_balance, ln_balance = results
         click.echo(f"Bitcoin balance: {btc_balance:.8f} BTC")
-
-        # Get Lightning balance
-        ln_balance = lnbits_adapter.get_wallet_balance()
         click.echo(f"Lightning balance: {ln_balance.get('balance', 0)} sats")
 
-        # Cleanup
-        bitcoin_adapter.close()
-        lnbits_adapter.close()
-
-    except Exception as e:
-        logger.error("Failed to get balance", error=str(e))
-        click.echo(f"Error: {e}", err=True)
-        raise click.Abort()
+    run_async(_run())
 
 
 @main.command()
 @click.pass_context
+@cli_errors("Failed to get status", catch_all=False)
 def status(ctx):
     """Get system status and connectivity."""
+    import asyncio
+
     config = ctx.obj["config"]
 
-    try:
-        # Initialize adapters
-        bitcoin_adapter = BitcoinAdapter(config)
-        electrs_adapter = ElectrsAdapter(config)
-        lnbits_adapter = LNbitsAdapter(config)
+    # Initialize adapters
+    bitcoin_adapter = _get_adapter(ctx, "bitcoin")
+    electrs_adapter = _get_adapter(ctx, "electrs")
+    lnbits_adapter = _get_adapter(ctx, "lnbits")
+
+    async def _run():
+        timeout = config.status_timeout_seconds
+        # Probe all backends concurrently so a slow one does not hold up the rest
+        bitcoin_result, electrs_result, lnbits_result = await asyncio.gather(
+            # Bitcoin Knots status needs one batched round-trip
+            _run_blocking(
+                lambda: bitcoin_adapter.batch_call(
+                    [
+                        ("getblockchaininfo", []),
+                        ("getnetworkinfo", []),
+                        ("getmempoolinfo", []),
+                    ]
+                ),
+                timeout,
+            ),
+            _run_blocking(electrs_adapter.get_tip_height, timeout),
+            _run_blocking(lnbits_adapter.get_wallet_balance, timeout),
+            return_exceptions=True,
+        )
 
-        # Check Bitcoin Knots
-        try:
-            blockchain_info = bitcoin_adapter.get_blockchain_info()
-            click.echo(
-                f"✓ Bitcoin Knots: {blockchain_info['blocks']} blocks, {blockchain_info['chain']} chain"
+        # Report in a fixed order regardless of completion order, one write per stream
+        out, err = [], []
+        if isinstance(bitcoin_result, BaseException):
+            err.append(f"✗ Bitcoin Knots: {_describe_error(bitcoin_result)}")
+        else:
+            blockchain_info, network_info, mempool_info = bitcoin_result
+            out.append(
+                f"✓ Bitcoin Knots: {blockchain_info['blocks']} blocks, "
+                f"{blockchain_info['chain']} chain, "
+                f"{network_info.get('connections', 0)} peers, "
+                f"{mempool_info.get('size', 0)} mempool txs"
             )
-        except Exception as e:
-            click.echo(f"✗ Bitcoin Knots: {e}", err=True)
 
-        # Check Electrs
-        try:
-            tip_height = electrs_adapter.get_tip_height()
-            click.echo(f"✓ Electrs: {tip_height} blocks")
-        except Exception as e:
-            click.echo(f"✗ Electrs: {e}", err=True)
+        if isinstance(electrs_result, BaseException):
+            err.append(f"✗ Electrs: {_describe_error(electrs_result)}")
+        else:
+            out.append(f"✓ Electrs: {electrs_result} blocks")
 
-        # Check LNbits
-        try:
-            ln_balance = lnbits_adapter.get_wallet_balance()
-            click.echo(f"✓ LNbits: {ln_balance.get('balance', 0)} sats")
-        except Exception as e:
-            click.echo(f"✗ LNbits: {e}", err=True)
-
-        # Cleanup
-        bitcoin_adapter.close()
-        electrs_adapter.close()
-        lnbits_adapter.close()
-
-    except Exception as e:
-        logger.error("Failed to get status", error=str(e))
-        click.echo(f"Error: {e}", err=True)
-        raise click.Abort()
+        if isinstance(lnbits_result, BaseException):
+            err.append(f"✗ LNbits: {_describe_error(lnbits_result)}")
+        else:
+            out.append(f"✓ LNbits: {lnbits_result.get('balance', 0)} sats")
+
+        if out:
+            click.echo("\n".join(out))
+        if err:
+            click.echo("\n".join(err), err=True)
+
+    run_async(_run())
 
 
 @main.command()
 @click.pass_context
+@cli_errors("Failed to get mempool health", catch_all=False)
 def mempool_health(ctx):
     """Check Mempool reachability and tip height without touching Core RPC."""
-    from asyncio import run as asyncio_run
+    adapter = _get_adapter(ctx, "mempool")
 
-    from .adapters.mempool import MempoolAdapter
-
-    try:
-
-        async def _run():
-            adapter = MempoolAdapter()
+    async def _run():
+        try:
             tip = await adapter.tip_height()
-            click.echo("Mempool Health")
-            click.echo("================")
-            click.echo(f"Mode: {adapter.mode}")
-            click.echo(f"Tip height: {tip}")
-
-        asyncio_run(_run())
-    except Exception as e:
-        logger.error("Failed to get mempool health", error=str(e))
-        click.echo(f"Error: {e}", err=True)
-        raise click.Abort()
+        finally:
+            await adapter.aclose()
+        click.echo("Mempool Health")
+        click.echo("================")
+        click.echo(f"Mode: {adapter.mode}")
+        click.echo(f"Tip height: {tip}")
+
+    run_async(_run())
 
 
 @main.command()
@@ -311,9 +473,10 @@ def mempool_health(ctx):
     help="vLLM OpenAI-compatible API base URL",
 )
 @click.pass_context
+@cli_errors("Failed to start AI agent")
 def ai_start(ctx, model: str, base_url: str):
     """Start the AI agent in autonomous earning mode."""
-    from asyncio import run as asyncio_run
+    from .ai.agent import AIAgent
 
     config = ctx.obj["config"]
 
@@ -336,66 +499,63 @@ def ai_start(ctx, model: str, base_url: str):
             # Start autonomous mode
             await ai_agent.start_autonomous_mode()
         
-        asyncio_run(_run())
+        run_async(_run())
         
     except KeyboardInterrupt:
         click.echo("\n🛑 AI Agent stopped by user")
-    except Exception as e:
-        logger.error("Failed to start AI agent", error=str(e))
-        click.echo(f"Error: {e}", err=True)
-        raise click.Abort()
 
 
 @main.command()
 @click.pass_context
+@cli_errors("Failed to get AI status")
 def ai_status(ctx):
     """Get status of the AI agent."""
-    from asyncio import run as asyncio_run
+    from .ai.agent import AIAgent
     
     config = ctx.obj["config"]
     
-    try:
-        async def _run():
-            ai_agent = AIAgent(config)
-            status = await ai_agent.get_agent_status()
-            
-            click.echo("🤖 Falconer AI Agent Status")
-            click.echo("==========================")
-            click.echo(f"Active: {status['is_active']}")
-            click.echo(f"Model: {status['model']}")
-            click.echo(f"Host: {status['host']}")
-            click.echo(f"Current Balance: {status['state']['current_balance_sats']} sats")
-            click.echo(f"Daily Earnings: {status['state']['daily_earnings_sats']} sats")
-            click.echo(f"Risk Level: {status['state']['risk_level']}")
-            click.echo(f"Confidence Score: {status['state']['confidence_score']:.2f}")
-            click.echo(f"Recent Decisions: {status['recent_decisions_count']}")
-            click.echo(f"Last Decision: {status['last_decision_time']}")
-        
-        asyncio_run(_run())
-        
-    except Exception as e:
-        logger.error("Failed to get AI status", error=str(e))
-        click.echo(f"Error: {e}", err=True)
-        raise click.Abort()
+    async def _run():
+        ai_agent = AIAgent(config)
+        status = await ai_agent.get_agent_status()
+        
+        click.echo("🤖 Falconer AI Agent Status")
+        click.echo("==========================")
+        click.echo(f"Active: {status['is_active']}")
+        click.echo(f"Model: {status['model']}")
+        click.echo(f"Host: {status['host']}")
+        click.echo(f"Current Balance: {status['state']['current_balance_sats']} sats")
+        click.echo(f"Daily Earnings: {status['state']['daily_earnings_sats']} sats")
+        click.echo(f"Risk Level: {status['state']['risk_level']}")
+        click.echo(f"Confidence Score: {status['state']['confidence_score']:.2f}")
+        click.echo(f"Recent Decisions: {status['recent_decisions_count']}")
+        click.echo(f"Last Decision: {status['last_decision_time']}")
+    
+    run_async(_run())
 
 
 @main.command()
+@click.option("--skip-cache", is_flag=True, help="Ignore cached market data")
+@click.option(
+    "--ttl", default=60, show_default=True, help="Seconds to reuse cached market data"
+)
 @click.pass_context
-def ai_analyze(ctx):
+@cli_errors("Failed to perform AI analysis")
+def ai_analyze(ctx, skip_cache: bool, ttl: int):
     """Perform AI-powered market analysis."""
-    from asyncio import run as asyncio_run
+    from .ai.market_analyzer import MarketAnalyzer
     
     config = ctx.obj["config"]
     
-    try:
-        async def _run():
-            market_analyzer = MarketAnalyzer(config)
-            
+    async def _run():
+        market_analyzer = MarketAnalyzer(
+            config, cache_ttl=ttl, refresh_cache=skip_cache
+        )
+        try:
             click.echo("🔍 Performing AI Market Analysis...")
-            
+        
             # Analyze current conditions
             condition = await market_analyzer.analyze_current_conditions()
-            
+        
             click.echo("\n📊 Market Analysis Results")
             click.echo("=========================")
             click.echo(f"Timestamp: {condition.timestamp}")
@@ -404,14 +564,14 @@ def ai_analyze(ctx):
             click.echo(f"Network Activity: {condition.network_activity}")
             click.echo(f"Opportunity Score: {condition.opportunity_score:.2f}")
             click.echo(f"Confidence: {condition.confidence:.2f}")
-            
+        
             click.echo("\n💡 Recommended Actions:")
             for i, action in enumerate(condition.recommended_actions, 1):
                 click.echo(f"  {i}. {action}")
-            
+        
             # Identify earning opportunities
             opportunities = await market_analyzer.identify_earning_opportunities()
-            
+        
             if opportunities:
                 click.echo(f"\n💰 Earning Opportunities ({len(opportunities)}):")
                 for i, opp in enumerate(opportunities, 1):
@@ -421,411 +581,410 @@ def ai_analyze(ctx):
                     click.echo(f"     Risk Level: {opp.risk_level}")
                     click.echo(f"     Confidence: {opp.confidence:.2f}")
                     click.echo()
-            
-            market_analyzer.close()
-        
-        asyncio_run(_run())
-        
-    except Exception as e:
-        logger.error("Failed to perform AI analysis", error=str(e))
-        click.echo(f"Error: {e}", err=True)
-        raise click.Abort()
+        finally:
+            await market_analyzer.aclose()
+    
+    run_async(_run())
 
 
 @main.command()
 @click.pass_context
+@cli_errors("Failed to list strategies")
 def ai_strategies(ctx):
     """List available AI earning strategies."""
-    from asyncio import run as asyncio_run
+    from .ai.earning_strategies import EarningStrategyManager
     
     config = ctx.obj["config"]
     
-    try:
-        async def _run():
-            strategy_manager = EarningStrategyManager(config)
-            
-            click.echo("🎯 Available AI Earning Strategies")
-            click.echo("==================================")
-            
-            strategies = strategy_manager.get_available_strategies()
-            
-            for strategy in strategies:
-                click.echo(f"\n📋 {strategy['name'].replace('_', ' ').title()}")
-                click.echo(f"   Description: {strategy['description']}")
-                click.echo(f"   Current Price: {strategy['current_price_sats']} sats")
-                click.echo(f"   Price Range: {strategy['min_price_sats']}-{strategy['max_price_sats']} sats")
-                click.echo(f"   Risk Level: {strategy['risk_level']}")
-                click.echo(f"   Time to Complete: {strategy['time_to_complete_minutes']} minutes")
-                click.echo(f"   Success Rate: {strategy['success_rate']:.2f}")
-                click.echo(f"   Total Earnings: {strategy['total_earnings']} sats")
-                click.echo(f"   Total Uses: {strategy['total_uses']}")
-            
-            strategy_manager.close()
-        
-        asyncio_run(_run())
+    async def _run():
+        strategy_manager = EarningStrategyManager(config)
+        
+        click.echo("🎯 Available AI Earning Strategies")
+        click.echo("==================================")
+        
+        strategies = strategy_manager.get_available_strategies()
+        
+        _write_lines(
+            f"\n📋 {strategy['name'].replace('_', ' ').title()}\n"
+            f"   Description: {strategy['description']}\n"
+            f"   Current Price: {strategy['current_price_sats']} sats\n"
+            f"   Price Range: {strategy['min_price_sats']}-"
+            f"{strategy['max_price_sats']} sats\n"
+            f"   Risk Level: {strategy['risk_level']}\n"
+            f"   Time to Complete: {strategy['time_to_complete_minutes']} minutes\n"
+            f"   Success Rate: {strategy['success_rate']:.2f}\n"
+            f"   Total Earnings: {strategy['total_earnings']} sats\n"
+            f"   Total Uses: {strategy['total_uses']}"
+            for strategy in strategies
+        )
         
-    except Exception as e:
-        logger.error("Failed to list strategies", error=str(e))
-        click.echo(f"Error: {e}", err=True)
-        raise click.Abort()
+        strategy_manager.close()
+    
+    run_async(_run())
 
 
 @main.command()
 @click.option("--strategy", required=True, help="Strategy to execute")
 @click.option("--dry-run", is_flag=True, help="Simulate execution without creating services")
 @click.pass_context
+@cli_errors("Failed to execute strategy")
 def ai_execute(ctx, strategy: str, dry_run: bool):
     """Execute a specific AI earning strategy."""
-    from asyncio import run as asyncio_run
+    from .ai.earning_strategies import EarningStrategyManager
     
     config = ctx.obj["config"]
     
-    try:
-        async def _run():
-            strategy_manager = EarningStrategyManager(config)
-            
-            click.echo(f"🚀 Executing Strategy: {strategy}")
-            if dry_run:
-                click.echo("🔍 DRY RUN MODE - No actual services will be created")
-            
-            # Execute strategy
-            execution = await strategy_manager.execute_strategy(strategy, {"dry_run": dry_run})
-            
-            click.echo("\n📊 Execution Results")
-            click.echo("===================")
-            click.echo(f"Strategy: {execution.strategy_name}")
-            click.echo(f"Success: {execution.success}")
-            click.echo(f"Price Charged: {execution.price_charged_sats} sats")
-            click.echo(f"Earnings: {execution.earnings_sats} sats")
-            click.echo(f"Execution Time: {execution.execution_time_seconds:.2f} seconds")
-            
-            if execution.error_message:
-                click.echo(f"Error: {execution.error_message}")
-            
-            strategy_manager.close()
+    async def _run():
+        strategy_manager = EarningStrategyManager(config)
         
-        asyncio_run(_run())
+        click.echo(f"🚀 Executing Strategy: {strategy}")
+        if dry_run:
+            click.echo("🔍 DRY RUN MODE - No actual services will be created")
         
-    except Exception as e:
-        logger.error("Failed to execute strategy", error=str(e))
-        click.echo(f"Error: {e}", err=True)
-        raise click.Abort()
+        # Execute strategy
+        execution = await strategy_manager.execute_strategy(
+            strategy, {"dry_run": dry_run}
+        )
+        
+        click.echo("\n📊 Execution Results")
+        click.echo("===================")
+        click.echo(f"Strategy: {execution.strategy_name}")
+        click.echo(f"Success: {execution.success}")
+        click.echo(f"Price Charged: {execution.price_charged_sats} sats")
+        click.echo(f"Earnings: {execution.earnings_sats} sats")
+        click.echo(f"Execution Time: {execution.execution_time_seconds:.2f} seconds")
+        
+        if execution.error_message:
+            click.echo(f"Error: {execution.error_message}")
+        
+        strategy_manager.close()
+    
+    run_async(_run())
+
+
+_PROPOSAL_TABLE_HEADER = (
+    f"{'ID':<12} {'Created':<20} {'Status':<12} {'Amount (sats)':<15} {'Justification'}"
+)
+_PROPOSAL_TABLE_SEPARATOR = "-" * 80
+_PROPOSAL_ROW_TEMPLATE = (
+    "{id:<12} {created:<20} {status:<12} {amount:<15,} {justification}..."
+)
+_PROPOSAL_DATE_FORMAT = "%Y-%m-%d %H:%M"
+
+
+async def _send_and_close(n8n_adapter, proposal):
+    """Send a proposal to n8n and close the adapter's client on the same loop."""
+    try:
+        return await n8n_adapter.send_proposal(proposal)
+    finally:
+        await n8n_adapter.aclose()
 
 
 @main.group()
-def proposals():
+@click.pass_context
+def proposals(ctx):
     """Manage funding proposals."""
-    pass
+    # Build the manager once; every subcommand reads it from ctx.obj
+    _get_proposal_manager(ctx)
 
 
 @proposals.command("list")
-@click.option("--status", help="Filter by status (pending, approved, rejected, executed, expired)")
+@click.option(
+    "--status", help="Filter by status (pending, approved, rejected, executed, expired)"
+)
 @click.option("--limit", default=20, help="Maximum number of proposals to show")
+@click.option(
+    "--cursor", help="Cursor printed by a previous page to continue listing from"
+)
 @click.pass_context
-def proposals_list(ctx, status: Optional[str], limit: int):
+@cli_errors("Failed to list proposals", abort=False)
+def proposals_list(ctx, status: Optional[str], limit: int, cursor: Optional[str]):
     """List funding proposals."""
-    try:
-        config = ctx.obj["config"]
-        persistence = PersistenceManager()
-        
-        if not FundingProposalManager:
-            click.echo("Funding proposal module not available", err=True)
-            return
-        
-        proposal_manager = FundingProposalManager(config, persistence, LNbitsAdapter(config))
-        proposals = proposal_manager.list_proposals(status=status, limit=limit)
-        
-        if not proposals:
-            click.echo("No proposals found")
-            return
-        
-        # Display proposals in table format
-        click.echo(f"{'ID':<12} {'Created':<20} {'Status':<12} {'Amount (sats)':<15} {'Justification'}")
-        click.echo("-" * 80)
-        
-        for proposal in proposals:
-            created_str = proposal.created_at.strftime("%Y-%m-%d %H:%M")
-            click.echo(
-                f"{proposal.proposal_id[:8]:<12} "
-                f"{created_str:<20} "
-                f"{proposal.status:<12} "
-                f"{proposal.requested_amount_sats:<15,} "
-                f"{proposal.justification[:50]}..."
-            )
-            
-    except Exception as e:
-        logger.error("Failed to list proposals", error=str(e))
-        click.echo(f"Error: {e}", err=True)
+    proposal_manager = ctx.obj["proposal_manager"]
+    if proposal_manager is None:
+        click.echo(
+            f"Funding proposal module not available: {_funding_import_error()}",
+            err=True,
+        )
+        return
+    
+    proposals, next_cursor = proposal_manager.list_proposals(
+        status=status, limit=limit, cursor=cursor
+    )
+    
+    if not proposals:
+        click.echo("No proposals found")
+        return
+    
+    # Display proposals in table format; rows bypass click.echo
+    click.echo(f"{_PROPOSAL_TABLE_HEADER}\n{_PROPOSAL_TABLE_SEPARATOR}")
+    row = _PROPOSAL_ROW_TEMPLATE.format
+    rows = [
+        row(
+            # Leading UUIDv7 digits are a timestamp; the tail tells proposals apart
+            id=proposal.proposal_id[-8:],
+            created=proposal.created_at.strftime(_PROPOSAL_DATE_FORMAT),
+            status=proposal.status,
+            amount=proposal.requested_amount_sats,
+            justification=proposal.justification[:50],
+        )
+        for proposal in proposals
+    ]
+    if next_cursor:
+        rows.append(f"\nMore proposals available: --cursor {next_cursor}")
+    _write_lines(rows)
 
 
 @proposals.command("show")
 @click.argument("proposal_id")
 @click.pass_context
+@cli_errors("Failed to show proposal", abort=False)
 def proposals_show(ctx, proposal_id: str):
     """Show detailed information for a specific proposal."""
-    try:
-        config = ctx.obj["config"]
-        persistence = PersistenceManager()
-        
-        if not FundingProposalManager:
-            click.echo("Funding proposal module not available", err=True)
-            return
-        
-        proposal_manager = FundingProposalManager(config, persistence, LNbitsAdapter(config))
-        proposal = proposal_manager.get_proposal(proposal_id)
-        
-        if not proposal:
-            click.echo(f"Proposal {proposal_id} not found", err=True)
-            return
-        
-        # Display proposal details
-        click.echo(f"Proposal ID: {proposal.proposal_id}")
-        click.echo(f"Created: {proposal.created_at}")
-        click.echo(f"Status: {proposal.status}")
-        click.echo(f"Requested Amount: {proposal.requested_amount_sats:,} sats")
-        click.echo(f"Current Balance: {proposal.current_balance_sats:,} sats")
-        click.echo(f"Expected ROI: {proposal.expected_roi_sats:,} sats")
-        click.echo(f"Risk Assessment: {proposal.risk_assessment}")
-        click.echo(f"Time Horizon: {proposal.time_horizon_days} days")
-        click.echo(f"Strategies: {', '.join(proposal.strategies_to_execute)}")
-        click.echo(f"\nJustification:\n{proposal.justification}")
-        click.echo(f"\nIntended Use:\n{proposal.intended_use}")
-        
-        if proposal.approved_at:
-            click.echo(f"\nApproved: {proposal.approved_at} by {proposal.approved_by}")
-        
-        if proposal.executed_at:
-            click.echo(f"Executed: {proposal.executed_at}")
-            click.echo(f"Transaction ID: {proposal.execution_txid}")
-        
-        if proposal.n8n_workflow_id:
-            click.echo(f"n8n Workflow ID: {proposal.n8n_workflow_id}")
-            
-    except Exception as e:
-        logger.error("Failed to show proposal", error=str(e))
-        click.echo(f"Error: {e}", err=True)
+    proposal_manager = ctx.obj["proposal_manager"]
+    if proposal_manager is None:
+        click.echo(
+            f"Funding proposal module not available: {_funding_import_error()}",
+            err=True,
+        )
+        return
+    
+    proposal = proposal_manager.get_proposal(proposal_id)
+    
+    if not proposal:
+        click.echo(f"Proposal {proposal_id} not found", err=True)
+        return
+    
+    # Display proposal details
+    click.echo(f"Proposal ID: {proposal.proposal_id}")
+    click.echo(f"Created: {proposal.created_at}")
+    click.echo(f"Status: {proposal.status}")
+    click.echo(f"Requested Amount: {proposal.requested_amount_sats:,} sats")
+    click.echo(f"Current Balance: {proposal.current_balance_sats:,} sats")
+    click.echo(f"Expected ROI: {proposal.expected_roi_sats:,} sats")
+    click.echo(f"Risk Assessment: {proposal.risk_assessment}")
+    click.echo(f"Time Horizon: {proposal.time_horizon_days} days")
+    click.echo(f"Strategies: {', '.join(proposal.strategies_to_execute)}")
+    click.echo(f"\nJustification:\n{proposal.justification}")
+    click.echo(f"\nIntended Use:\n{proposal.intended_use}")
+    
+    if proposal.approved_at:
+        click.echo(f"\nApproved: {proposal.approved_at} by {proposal.approved_by}")
+    
+    if proposal.executed_at:
+        click.echo(f"Executed: {proposal.executed_at}")
+        click.echo(f"Transaction ID: {proposal.execution_txid}")
+    
+    if proposal.n8n_workflow_id:
+        click.echo(f"n8n Workflow ID: {proposal.n8n_workflow_id}")
 
 
 @proposals.command("approve")
 @click.argument("proposal_id")
 @click.option("--notes", help="Approval notes")
 @click.pass_context
+@cli_errors("Failed to approve proposal", abort=False)
 def proposals_approve(ctx, proposal_id: str, notes: Optional[str]):
     """Manually approve a proposal (for testing or manual workflow)."""
-    try:
-        config = ctx.obj["config"]
-        persistence = PersistenceManager()
-        
-        if not FundingProposalManager:
-            click.echo("Funding proposal module not available", err=True)
-            return
-        
-        proposal_manager = FundingProposalManager(config, persistence, LNbitsAdapter(config))
-        proposal = proposal_manager.approve_proposal(proposal_id, "manual_cli", notes)
-        
-        click.echo(f"Proposal {proposal_id} approved successfully")
-        click.echo(f"Status: {proposal.status}")
-        click.echo("Note: In production, approvals come via n8n webhook")
-        
-    except Exception as e:
-        logger.error("Failed to approve proposal", error=str(e))
-        click.echo(f"Error: {e}", err=True)
+    proposal_manager = ctx.obj["proposal_manager"]
+    if proposal_manager is None:
+        click.echo(
+            f"Funding proposal module not available: {_funding_import_error()}",
+            err=True,
+        )
+        return
+    
+    proposal = proposal_manager.approve_proposal(proposal_id, "manual_cli", notes)
+    
+    click.echo(f"Proposal {proposal_id} approved successfully")
+    click.echo(f"Status: {proposal.status}")
+    click.echo("Note: In production, approvals come via n8n webhook")
 
 
 @proposals.command("reject")
 @click.argument("proposal_id")
 @click.option("--reason", required=True, help="Rejection reason")
 @click.pass_context
+@cli_errors("Failed to reject proposal", abort=False)
 def proposals_reject(ctx, proposal_id: str, reason: str):
     """Manually reject a proposal."""
-    try:
-        config = ctx.obj["config"]
-        persistence = PersistenceManager()
-        
-        if not FundingProposalManager:
-            click.echo("Funding proposal module not available", err=True)
-            return
-        
-        proposal_manager = FundingProposalManager(config, persistence, LNbitsAdapter(config))
-        proposal = proposal_manager.reject_proposal(proposal_id, "manual_cli", reason)
-        
-        click.echo(f"Proposal {proposal_id} rejected successfully")
-        click.echo(f"Status: {proposal.status}")
-        
-    except Exception as e:
-        logger.error("Failed to reject proposal", error=str(e))
-        click.echo(f"Error: {e}", err=True)
+    proposal_manager = ctx.obj["proposal_manager"]
+    if proposal_manager is None:
+        click.echo(
+            f"Funding proposal module not available: {_funding_import_error()}",
+            err=True,
+        )
+        return
+    
+    proposal = proposal_manager.reject_proposal(proposal_id, "manual_cli", reason)
+    
+    click.echo(f"Proposal {proposal_id} rejected successfully")
+    click.echo(f"Status: {proposal.status}")
 
 
 @proposals.command("stats")
 @click.pass_context
+@cli_errors("Failed to get proposal statistics", abort=False)
 def proposals_stats(ctx):
     """Show proposal statistics."""
-    try:
-        config = ctx.obj["config"]
-        persistence = PersistenceManager()
-        
-        if not FundingProposalManager:
-            click.echo("Funding proposal module not available", err=True)
-            return
-        
-        proposal_manager = FundingProposalManager(config, persistence, LNbitsAdapter(config))
-        stats = proposal_manager.get_proposal_statistics()
-        
-        click.echo("Funding Proposal Statistics:")
-        click.echo(f"Total Proposals: {stats['total_proposals']}")
-        click.echo(f"Total Requested: {stats['total_requested_sats']:,} sats")
-        click.echo(f"Total Approved: {stats['total_approved_sats']:,} sats")
-        click.echo(f"Approval Rate: {stats['approval_rate']:.1%}")
-        click.echo(f"Average Requested Amount: {stats['average_requested_amount']:,} sats")
-        
-        click.echo("\nBy Status:")
-        for status, count in stats['by_status'].items():
-            click.echo(f"  {status}: {count}")
-            
-    except Exception as e:
-        logger.error("Failed to get proposal statistics", error=str(e))
-        click.echo(f"Error: {e}", err=True)
+    proposal_manager = ctx.obj["proposal_manager"]
+    if proposal_manager is None:
+        click.echo(
+            f"Funding proposal module not available: {_funding_import_error()}",
+            err=True,
+        )
+        return
+    
+    stats = proposal_manager.get_proposal_statistics()
+    
+    click.echo("Funding Proposal Statistics:")
+    click.echo(f"Total Proposals: {stats['total_proposals']}")
+    click.echo(f"Total Requested: {stats['total_requested_sats']:,} sats")
+    click.echo(f"Total Approved: {stats['total_approved_sats']:,} sats")
+    click.echo(f"Approval Rate: {stats['approval_rate']:.1%}")
+    click.echo(f"Average Requested Amount: {stats['average_requested_amount']:,} sats")
+    
+    click.echo("\nBy Status:")
+    for status, count in stats['by_status'].items():
+        click.echo(f"  {status}: {count}")
 
 
 @proposals.command("expire")
 @click.pass_context
+@cli_errors("Failed to expire proposals", abort=False)
 def proposals_expire(ctx):
     """Manually trigger expiration of old proposals."""
-    try:
-        config = ctx.obj["config"]
-        persistence = PersistenceManager()
-        
-        if not FundingProposalManager:
-            click.echo("Funding proposal module not available", err=True)
-            return
-        
-        proposal_manager = FundingProposalManager(config, persistence, LNbitsAdapter(config))
-        expired_count = proposal_manager.expire_old_proposals()
-        
-        click.echo(f"Expired {expired_count} old proposals")
-        
-    except Exception as e:
-        logger.error("Failed to expire proposals", error=str(e))
-        click.echo(f"Error: {e}", err=True)
+    proposal_manager = ctx.obj["proposal_manager"]
+    if proposal_manager is None:
+        click.echo(
+            f"Funding proposal module not available: {_funding_import_error()}",
+            err=True,
+        )
+        return
+    
+    expired_count = proposal_manager.expire_old_proposals()
+    
+    click.echo(f"Expired {expired_count} old proposals")
 
 
 @main.command("webhook-server")
 @click.pass_context
+@cli_errors("Failed to start webhook server", abort=False)
 def webhook_server(ctx):
     """Start the webhook server to receive approval notifications from n8n."""
+    config = ctx.obj["config"]
+    
+    proposal_manager = _get_proposal_manager(ctx)
+    if proposal_manager is None:
+        click.echo(
+            f"Webhook server components not available: {_funding_import_error()}",
+            err=True,
+        )
+        return
     try:
-        config = ctx.obj["config"]
-        
-        if not all([FundingProposalManager, N8nAdapter, run_webhook_server]):
-            click.echo("Webhook server components not available", err=True)
-            return
-        
-        if not config.webhook_server_enabled:
-            click.echo("Webhook server is disabled in configuration", err=True)
-            return
-        
-        persistence = PersistenceManager()
-        proposal_manager = FundingProposalManager(config, persistence, LNbitsAdapter(config))
-        n8n_adapter = N8nAdapter(config)
-        
-        click.echo(f"Starting webhook server on {config.webhook_server_host}:{config.webhook_server_port}")
-        click.echo("Press Ctrl+C to stop")
-        
-        try:
-            run_webhook_server(config, proposal_manager, n8n_adapter)
-        except KeyboardInterrupt:
-            click.echo("\nWebhook server stopped")
-            
-    except Exception as e:
-        logger.error("Failed to start webhook server", error=str(e))
-        click.echo(f"Error: {e}", err=True)
+        from .funding.webhook_server import run_webhook_server
+    except ImportError as e:
+        click.echo(f"Webhook server components not available: {e}", err=True)
+        return
+    from .funding.n8n_adapter import N8nAdapter
+    
+    if not config.webhook_server_enabled:
+        click.echo("Webhook server is disabled in configuration", err=True)
+        return
+    
+    n8n_adapter = N8nAdapter(config)
+    
+    click.echo(
+        "Starting webhook server on "
+        f"{config.webhook_server_host}:{config.webhook_server_port}"
+    )
+    click.echo("Press Ctrl+C to stop")
+    
+    try:
+        run_webhook_server(config, proposal_manager, n8n_adapter)
+    except KeyboardInterrupt:
+        click.echo("\nWebhook server stopped")
 
 
 @main.command("api-server")
 @click.option("--host", default="0.0.0.0", help="Host to bind the API server")
 @click.option("--port", default=8000, type=int, help="Port for the API server")
 @click.pass_context
+@cli_errors("Failed to start API server", abort=False)
 def api_server(ctx, host: str, port: int):
     """Start the test API server for OpenClaw integration."""
-    try:
-        config = ctx.obj["config"]
-
-        if run_api_server is None:
-            click.echo("API server module not available", err=True)
-            return
+    config = ctx.obj["config"]
 
-        click.echo(f"Starting test API server on {host}:{port}")
-        click.echo("Press Ctrl+C to stop")
+    try:
+        from .api.test_endpoints import run_api_server
+    except ImportError as e:
+        click.echo(f"API server module not available: {e}", err=True)
+        return
 
-        try:
-            run_api_server(config, host=host, port=port)
-        except KeyboardInterrupt:
-            click.echo("\nAPI server stopped")
+    click.echo(f"Starting test API server on {host}:{port}")
+    click.echo("Press Ctrl+C to stop")
 
-    except Exception as e:
-        logger.error("Failed to start API server", error=str(e))
-        click.echo(f"Error: {e}", err=True)
+    try:
+        run_api_server(config, host=host, port=port)
+    except KeyboardInterrupt:
+        click.echo("\nAPI server stopped")
 
 
 @main.command("proposal-test")
-@click.option("--amount", default=100000, help="Test proposal amount in sats")
+@click.option(
+    "--amount",
+    default=None,
+    type=int,
+    help=(
+        "Test proposal amount in sats "
+        "(defaults to FUNDING_PROPOSAL_DEFAULT_AMOUNT_SATS)"
+    ),
+)
 @click.pass_context
-def proposal_test(ctx, amount: int):
+@cli_errors("Failed to test proposal", abort=False)
+def proposal_test(ctx, amount: Optional[int]):
     """Test funding proposal generation and n8n integration."""
-    try:
-        config = ctx.obj["config"]
-        persistence = PersistenceManager()
-        
-        if not all([FundingProposalManager, N8nAdapter]):
-            click.echo("Funding proposal components not available", err=True)
-            return
-        
-        proposal_manager = FundingProposalManager(config, persistence, LNbitsAdapter(config))
-        n8n_adapter = N8nAdapter(config)
-        
-        # Create test AI context
-        ai_context = {
-            "current_balance_sats": 25000,  # Below threshold
-            "market_conditions": {"opportunity_score": 0.8, "volatility": 0.3},
-            "active_strategies": ["market_making", "arbitrage"],
-            "recent_performance": {
-                "daily_earnings": 5000,
-                "success_rate": 0.75,
-                "risk_level": "medium",
-            },
-            "decision_history": [],
-        }
-        
-        # Generate test proposal
-        proposal = proposal_manager.generate_proposal(ai_context)
-        
-        # Override the amount if specified
-        if amount != 100000:  # Only override if different from default
-            proposal.requested_amount_sats = amount
-            # Recalculate expected ROI based on new amount
-            proposal.expected_roi_sats = int(amount * 0.05)  # 5% ROI
-            # Persist the updated proposal
-            persistence.save_funding_proposal(proposal)
-        
-        click.echo(f"Generated test proposal: {proposal.proposal_id}")
-        click.echo(f"Requested amount: {proposal.requested_amount_sats:,} sats")
-        click.echo(f"Justification: {proposal.justification[:100]}...")
-        
-        # Send to n8n if configured
-        if config.n8n_webhook_url:
-            try:
-                import asyncio
-                response = asyncio.run(n8n_adapter.send_proposal(proposal))
-                click.echo(f"Sent to n8n successfully: {response}")
-            except Exception as e:
-                click.echo(f"Failed to send to n8n: {e}")
-        else:
-            click.echo("n8n webhook URL not configured - skipping n8n test")
-            
-    except Exception as e:
-        logger.error("Failed to test proposal", error=str(e))
-        click.echo(f"Error: {e}", err=True)
+    config = ctx.obj["config"]
+    
+    proposal_manager = _get_proposal_manager(ctx)
+    if proposal_manager is None:
+        click.echo(
+            f"Funding proposal components not available: {_funding_import_error()}",
+            err=True,
+        )
+        return
+    from .funding.n8n_adapter import N8nAdapter
+    
+    n8n_adapter = N8nAdapter(config)
+    
+    # Create test AI context
+    ai_context = {
+        "current_balance_sats": 25000,  # Below threshold
+        "market_conditions": {"opportunity_score": 0.8, "volatility": 0.3},
+        "active_strategies": ["market_making", "arbitrage"],
+        "recent_performance": {
+            "daily_earnings": 5000,
+            "success_rate": 0.75,
+            "risk_level": "medium",
+        },
+        "decision_history": [],
+    }
+    
+    # Generate test proposal (persisted once, with the requested amount)
+    proposal = proposal_manager.generate_proposal(
+        ai_context, override_amount_sats=amount
+    )
+    
+    click.echo(f"Generated test proposal: {proposal.proposal_id}")
+    click.echo(f"Requested amount: {proposal.requested_amount_sats:,} sats")
+    click.echo(f"Justification: {proposal.justification[:100]}...")
+    
+    # Send to n8n if configured
+    if config.n8n_webhook_url:
+        response = run_async(_send_and_close(n8n_adapter, proposal))
+        click.echo(f"Sent to n8n successfully: {response}")
+    else:
+        click.echo("n8n webhook URL not configured - skipping n8n test")
 
 
 if __name__ == "__main__":
@@ -1,10 +1,18 @@
 """Configuration management for Falconer."""
 
+import json
 import os
-from typing import List, Optional
+from typing import Annotated, Any, List, Mapping, Optional
 
-from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings
+from pydantic import Field, PrivateAttr, field_validator
+from pydantic_settings import BaseSettings, NoDecode
+
+# Fields that make up the service URLs; assigning any of them rebuilds the URLs
+_SERVICE_URL_FIELDS = frozenset(
+    f"{service}_{part}"
+    for service in ("bitcoind", "electrs", "lnbits")
+    for part in ("scheme", "host_ip", "port")
+)
 
 
 class Config(BaseSettings):
@@ -35,13 +43,18 @@ class Config(BaseSettings):
     lnbits_api_key: str = Field(default="", env="LNBITS_API_KEY")
     lnbits_wallet_id: str = Field(default="", env="LNBITS_WALLET_ID")
 
+    # HTTP Connection Pooling (shared by the Bitcoin Knots, Electrs and LNbits adapters)
+    rpc_pool_size: int = Field(default=4, env="RPC_POOL_SIZE")
+
     # Policy Configuration
     policy_path: str = Field(default="policy/dev.policy.json", env="POLICY_PATH")
 
     # Spending Limits (can be overridden by policy file)
     max_daily_spend_sats: int = Field(default=100000, env="MAX_DAILY_SPEND_SATS")
     max_single_tx_sats: int = Field(default=50000, env="MAX_SINGLE_TX_SATS")
-    allowed_destinations: List[str] = Field(default=[], env="ALLOWED_DESTINATIONS")
+    allowed_destinations: Annotated[List[str], NoDecode] = Field(
+        default_factory=list, env="ALLOWED_DESTINATIONS"
+    )
 
     # AI Configuration (vLLM, OpenAI-compatible API)
     vllm_model: str = Field(default="llama3.1:8b", env="VLLM_MODEL")
@@ -69,40 +82,17 @@ class Config(BaseSettings):
     webhook_server_port: int = Field(default=8080, env="WEBHOOK_SERVER_PORT")
     webhook_server_reload: bool = Field(default=False, env="WEBHOOK_SERVER_RELOAD")
 
-    # n8n Integration Configuration
-    n8n_webhook_url: Optional[str] = Field(default=None, env="N8N_WEBHOOK_URL")
-    n8n_webhook_secret: Optional[str] = Field(default=None, env="N8N_WEBHOOK_SECRET")
-
-    # Logging Configuration
-    log_level: str = Field(default="INFO", env="LOG_LEVEL")
-    log_file: Optional[str] = Field(default=None, env="LOG_FILE")
-
-    # OpenClaw Integration (PoC)
-=======
-    # Funding Proposal Configuration
-    funding_proposal_enabled: bool = Field(default=False, env="FUNDING_PROPOSAL_ENABLED")
-    funding_proposal_threshold_sats: int = Field(default=50000, env="FUNDING_PROPOSAL_THRESHOLD_SATS")
-    funding_proposal_max_pending: int = Field(default=3, env="FUNDING_PROPOSAL_MAX_PENDING")
-    funding_proposal_default_amount_sats: int = Field(default=100000, env="FUNDING_PROPOSAL_DEFAULT_AMOUNT_SATS")
-    funding_proposal_expiry_hours: int = Field(default=24, env="FUNDING_PROPOSAL_EXPIRY_HOURS")
+    # Test API Server Configuration
+    cors_origins: Annotated[List[str], NoDecode] = Field(
+        default=["*"], env="CORS_ORIGINS"
+    )
+    api_cache_ttl_seconds: int = Field(default=5, env="API_CACHE_TTL_SECONDS")
+    api_upstream_backoff_seconds: float = Field(
+        default=5.0, env="API_UPSTREAM_BACKOFF_SECONDS"
+    )
 
-    # n8n Integration Configuration
-    n8n_webhook_url: Optional[str] = Field(default=None, env="N8N_WEBHOOK_URL")
-    n8n_webhook_secret: Optional[str] = Field(default=None, env="N8N_WEBHOOK_SECRET")
-=======
-    # Wallet Configuration
-    change_address: Optional[str] = Field(default=None, env="CHANGE_ADDRESS")
-
-    # Funding Proposal Configuration
-    funding_proposal_enabled: bool = Field(default=False, env="FUNDING_PROPOSAL_ENABLED")
-    funding_proposal_threshold_sats: int = Field(default=50000, env="FUNDING_PROPOSAL_THRESHOLD_SATS")
-    funding_proposal_max_pending: int = Field(default=3, env="FUNDING_PROPOSAL_MAX_PENDING")
-    funding_proposal_default_amount_sats: int = Field(default=100000, env="FUNDING_PROPOSAL_DEFAULT_AMOUNT_SATS")
-    funding_proposal_expiry_hours: int = Field(default=24, env="FUNDING_PROPOSAL_EXPIRY_HOURS")
-
-    # n8n Integration Configuration
-    n8n_webhook_url: Optional[str] = Field(default=None, env="N8N_WEBHOOK_URL")
-    n8n_webhook_secret: Optional[str] = Field(default=None, env="N8N_WEBHOOK_SECRET")
+    # CLI Configuration
+    status_timeout_seconds: float = Field(default=10.0, env="STATUS_TIMEOUT_SECONDS")
 
     # Logging Configuration
     log_level: str = Field(default="INFO", env="LOG_LEVEL")
@@ -112,77 +102,14 @@ class Config(BaseSettings):
     openclaw_enabled: bool = Field(default=False, env="OPENCLAW_ENABLED")
     openclaw_api_key: str = Field(default="", env="OPENCLAW_API_KEY")
     openclaw_webhook_url: str = Field(default="", env="OPENCLAW_WEBHOOK_URL")
-=======
-    # n8n Integration Configuration
-    n8n_webhook_url: Optional[str] = Field(default=None, env="N8N_WEBHOOK_URL")
-    n8n_webhook_secret: Optional[str] = Field(default=None, env="N8N_WEBHOOK_SECRET")
-
-    # Logging Configuration
-    log_level: str = Field(default="INFO", env="LOG_LEVEL")
-    log_file: Optional[str] = Field(default=None, env="LOG_FILE")
-
-    # OpenClaw Integration (PoC)
-=======
-    # Funding Proposal Configuration
-    funding_proposal_enabled: bool = Field(default=False, env="FUNDING_PROPOSAL_ENABLED")
-    funding_proposal_threshold_sats: int = Field(default=50000, env="FUNDING_PROPOSAL_THRESHOLD_SATS")
-    funding_proposal_max_pending: int = Field(default=3, env="FUNDING_PROPOSAL_MAX_PENDING")
-    funding_proposal_default_amount_sats: int = Field(default=100000, env="FUNDING_PROPOSAL_DEFAULT_AMOUNT_SATS")
-    funding_proposal_expiry_hours: int = Field(default=24, env="FUNDING_PROPOSAL_EXPIRY_HOURS")
-
-    # n8n Integration Configuration
-    n8n_webhook_url: Optional[str] = Field(default=None, env="N8N_WEBHOOK_URL")
-    n8n_webhook_secret: Optional[str] = Field(default=None, env="N8N_WEBHOOK_SECRET")
 
-    # Logging Configuration
-    log_level: str = Field(default="INFO", env="LOG_LEVEL")
-    log_file: Optional[str] = Field(default=None, env="LOG_FILE")
-
-    # OpenClaw Integration (PoC)
-    openclaw_enabled: bool = Field(default=False, env="OPENCLAW_ENABLED")
-    openclaw_api_key: str = Field(default="", env="OPENCLAW_API_KEY")
-    openclaw_webhook_url: str = Field(default="", env="OPENCLAW_WEBHOOK_URL")
-=======
-    # Ollama AI Configuration
-=======
-    # n8n Integration Configuration
-    n8n_webhook_url: Optional[str] = Field(default=None, env="N8N_WEBHOOK_URL")
-    n8n_webhook_secret: Optional[str] = Field(default=None, env="N8N_WEBHOOK_SECRET")
-
-    # Logging Configuration
-    log_level: str = Field(default="INFO", env="LOG_LEVEL")
-    log_file: Optional[str] = Field(default=None, env="LOG_FILE")
-
-    # OpenClaw Integration (PoC)
-    openclaw_enabled: bool = Field(default=False, env="OPENCLAW_ENABLED")
-    openclaw_api_key: str = Field(default="", env="OPENCLAW_API_KEY")
-    openclaw_webhook_url: str = Field(default="", env="OPENCLAW_WEBHOOK_URL")
-=======
-    # Logging Configuration
-    log_level: str = Field(default="INFO", env="LOG_LEVEL")
-    log_file: Optional[str] = Field(default=None, env="LOG_FILE")
+    # Wallet Configuration
+    change_address: Optional[str] = Field(default=None, env="CHANGE_ADDRESS")
 
-    # OpenClaw Integration (PoC)
-    openclaw_enabled: bool = Field(default=False, env="OPENCLAW_ENABLED")
-    openclaw_api_key: str = Field(default="", env="OPENCLAW_API_KEY")
-    openclaw_webhook_url: str = Field(default="", env="OPENCLAW_WEBHOOK_URL")
-=======
     # Ollama AI Configuration
     ollama_model: str = Field(default="llama3.1:8b", env="OLLAMA_MODEL")
     ollama_host: str = Field(default="http://localhost:11434", env="OLLAMA_HOST")
 
-    # Funding Proposal Configuration
-    funding_proposal_enabled: bool = Field(default=False, env="FUNDING_PROPOSAL_ENABLED")
-    funding_proposal_threshold_sats: int = Field(default=50000, env="FUNDING_PROPOSAL_THRESHOLD_SATS")
-    funding_proposal_max_pending: int = Field(default=3, env="FUNDING_PROPOSAL_MAX_PENDING")
-    funding_proposal_default_amount_sats: int = Field(default=100000, env="FUNDING_PROPOSAL_DEFAULT_AMOUNT_SATS")
-    funding_proposal_expiry_hours: int = Field(default=24, env="FUNDING_PROPOSAL_EXPIRY_HOURS")
-
-    # n8n Integration Configuration
-    n8n_webhook_url: Optional[str] = Field(default=None, env="N8N_WEBHOOK_URL")
-    n8n_webhook_secret: Optional[str] = Field(default=None, env="N8N_WEBHOOK_SECRET")
->>>>>>> b1a116d3a98b001a8622efcbb26f8c7486c0b6b6
-
     @field_validator("max_single_tx_sats")
     @classmethod
     def single_tx_less_than_daily(cls, v, info):
@@ -197,13 +124,18 @@ class Config(BaseSettings):
             )
         return v
 
-    @field_validator("allowed_destinations", mode="before")
+    @field_validator("allowed_destinations", "cors_origins", mode="before")
     @classmethod
     def parse_allowed_destinations(cls, v):
-        """Parse comma-separated allowed destinations from environment."""
-        if isinstance(v, str):
-            return [dest.strip() for dest in v.split(",") if dest.strip()]
-        return v or []
+        """Parse list settings given as a JSON array or comma-separated string."""
+        if not isinstance(v, str):
+            return v if v else []
+        v = v.strip()
+        if v.startswith("["):
+            return json.loads(v)
+        if "," in v:
+            return list(filter(None, map(str.strip, v.split(","))))
+        return [v] if v else []
 
     @field_validator("funding_proposal_threshold_sats")
     @classmethod
@@ -254,6 +186,11 @@ class Config(BaseSettings):
             raise ValueError("webhook_server_port must be between 1 and 65535")
         return v
 
+    # Service URLs, built from the scheme/host/port fields in model_post_init
+    _bitcoind_url: str = PrivateAttr(default="")
+    _electrs_url: str = PrivateAttr(default="")
+    _lnbits_url: str = PrivateAttr(default="")
+
     model_config = {
         "env_file": ".env",
         "env_file_encoding": "utf-8",
@@ -261,17 +198,45 @@ class Config(BaseSettings):
         "extra": "ignore",
     }
 
+    def model_post_init(self, __context: Any) -> None:
+        """Build the service URLs once, right after validation."""
+        self._set_service_urls()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in _SERVICE_URL_FIELDS:
+            self._set_service_urls()
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> "Config":
+        """Copy the config, rebuilding service URLs so updated fields take effect."""
+        copied = super().model_copy(update=update, deep=deep)
+        copied._set_service_urls()
+        return copied
+
+    def _set_service_urls(self) -> None:
+        self._bitcoind_url = (
+            f"{self.bitcoind_scheme}://{self.bitcoind_host_ip}:{self.bitcoind_port}"
+        )
+        self._electrs_url = (
+            f"{self.electrs_scheme}://{self.electrs_host_ip}:{self.electrs_port}"
+        )
+        self._lnbits_url = (
+            f"{self.lnbits_scheme}://{self.lnbits_host_ip}:{self.lnbits_port}"
+        )
+
     @property
     def bitcoind_url(self) -> str:
         """Get Bitcoin Knots RPC URL."""
-        return f"{self.bitcoind_scheme}://{self.bitcoind_host_ip}:{self.bitcoind_port}"
+        return self._bitcoind_url
 
     @property
     def electrs_url(self) -> str:
         """Get Electrs base URL."""
-        return f"{self.electrs_scheme}://{self.electrs_host_ip}:{self.electrs_port}"
+        return self._electrs_url
 
     @property
     def lnbits_url(self) -> str:
         """Get LNbits base URL."""
-        return f"{self.lnbits_scheme}://{self.lnbits_host_ip}:{self.lnbits_port}"
+        return self._lnbits_url
@@ -1,16 +1,23 @@
-"""Funding proposal management for autonomous Bitcoin earning."""
+"""Funding proposal management for autonomous Bitcoin earning.
+
+The FastAPI webhook server lives in ``falconer.funding.webhook_server`` and is
+not imported here, so using the proposal manager does not load FastAPI/uvicorn.
+"""
 
 from .manager import FundingProposalManager
 from .n8n_adapter import N8nAdapter
-from .schema import FundingProposal, ProposalApproval, ProposalSummary
-from .webhook_server import create_webhook_app, run_webhook_server
+from .schema import (
+    ApprovalWebhookPayload,
+    FundingProposal,
+    ProposalApproval,
+    ProposalSummary,
+)
 
 __all__ = [
     "FundingProposalManager",
-    "N8nAdapter", 
+    "N8nAdapter",
     "FundingProposal",
     "ProposalApproval",
     "ProposalSummary",
-    "create_webhook_app",
-    "run_webhook_server",
+    "ApprovalWebhookPayload",
 ]
@@ -1,13 +1,45 @@
 """Funding proposal manager for handling proposal lifecycle."""
 
+import base64
+import json
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..config import Config
 from ..persistence import PersistenceManager
 from ..adapters.lnbits import LNbitsAdapter
 from .schema import FundingProposal, ProposalSummary
 
+# Base expected return over a 30-day horizon, before performance adjustments
+BASE_ROI_RATE = 0.05
+
+# Expected ROI timeframe in days, by lower-cased strategy name
+DEFAULT_HORIZON_DAYS = 30
+STRATEGY_HORIZON_DAYS = MappingProxyType({
+    "market_making": 7,
+    "arbitrage": 1,
+    "yield_farming": 30,
+    "liquidity_provision": 14,
+})
+
+
+def _encode_cursor(summary: ProposalSummary) -> str:
+    """Encode the (created_at, proposal_id) key of the last listed proposal."""
+    payload = json.dumps(
+        {"ts": summary.created_at.isoformat(), "id": summary.proposal_id}
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Decode a cursor produced by _encode_cursor."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(payload["ts"]), payload["id"]
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Invalid proposal cursor: {cursor}") from e
+
 
 class FundingProposalManager:
     """Manages funding proposal lifecycle and operations."""
@@ -26,11 +58,15 @@ class FundingProposalManager:
         threshold = self.config.funding_proposal_threshold_sats
         return current_balance_sats < threshold
     
-    def generate_proposal(self, ai_context: Dict[str, Any]) -> FundingProposal:
-        """Create a new funding proposal using AI context."""
+    def generate_proposal(
+        self, ai_context: Dict[str, Any], override_amount_sats: Optional[int] = None
+    ) -> FundingProposal:
+        """Create a funding proposal from AI context, optionally for a given amount."""
         # Check if we're at max pending proposals
-        pending_proposals = self.list_proposals(status="pending")
-        if len(pending_proposals) >= self.config.funding_proposal_max_pending:
+        if (
+            self.persistence.count_proposals(status="pending")
+            >= self.config.funding_proposal_max_pending
+        ):
             raise ValueError(f"Maximum pending proposals ({self.config.funding_proposal_max_pending}) reached")
         
         # Extract context data
@@ -40,7 +76,10 @@ class FundingProposalManager:
         recent_performance = ai_context.get("recent_performance", {})
         
         # Calculate requested amount
-        requested_amount = self.config.funding_proposal_default_amount_sats
+        if override_amount_sats is not None:
+            requested_amount = override_amount_sats
+        else:
+            requested_amount = self.config.funding_proposal_default_amount_sats
         
         # Generate justification based on AI context
         justification = self._generate_justification(
@@ -77,27 +116,31 @@ class FundingProposalManager:
         """Load proposal from persistence by ID."""
         return self.persistence.load_funding_proposal(proposal_id)
     
-    def list_proposals(self, status: Optional[str] = None, limit: int = 50) -> List[ProposalSummary]:
-        """List proposals, optionally filtered by status."""
-        proposals = self.persistence.load_funding_proposals(status=status, limit=limit)
+    def list_proposals(
+        self,
+        status: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[ProposalSummary], Optional[str]]:
+        """List proposals newest first, returning the page and the next cursor."""
+        before = _decode_cursor(cursor) if cursor else None
+        # Fetch one extra row to tell whether another page follows
+        rows = self.persistence.load_funding_proposal_summaries(
+            status=status, limit=limit + 1, before=before
+        )
         
         summaries = []
-        for proposal in proposals:
+        for row in rows[:limit]:
             # Truncate justification to 200 chars
-            justification = proposal.justification
+            justification = row["justification"]
             if len(justification) > 200:
-                justification = justification[:197] + "..."
+                row["justification"] = justification[:197] + "..."
             
-            summary = ProposalSummary(
-                proposal_id=proposal.proposal_id,
-                created_at=proposal.created_at,
-                status=proposal.status,
-                requested_amount_sats=proposal.requested_amount_sats,
-                justification=justification,
-            )
-            summaries.append(summary)
-        
-        return summaries
+            # Rows come from our own store, so skip re-validating them
+            summaries.append(ProposalSummary.model_construct(**row))
+        
+        next_cursor = _encode_cursor(summaries[-1]) if len(rows) > limit else None
+        return summaries, next_cursor
     
     def approve_proposal(self, proposal_id: str, approved_by: str, notes: Optional[str] = None) -> FundingProposal:
         """Update proposal status to 'approved'."""
@@ -154,50 +197,46 @@ class FundingProposalManager:
     
     def expire_old_proposals(self, max_age_hours: int = 24) -> int:
         """Find proposals in 'pending' status older than max_age_hours and mark as 'expired'."""
-        cutoff_time = datetime.utcnow() - timedelta(hours=max_age_hours)
-        pending_proposals = self.persistence.load_funding_proposals(status="pending")
-        
-        expired_count = 0
-        for proposal in pending_proposals:
-            if proposal.created_at < cutoff_time:
-                proposal.status = "expired"
-                self.persistence.save_funding_proposal(proposal)
-                expired_count += 1
-        
-        return expired_count
+        now = datetime.utcnow()
+        expired_ids = self.persistence.load_funding_proposal_ids(
+            status="pending", created_before=now - timedelta(hours=max_age_hours)
+        )
+        return self.persistence.update_funding_proposal_status(
+            expired_ids, "expired", expired_at=now
+        )
     
     def get_proposal_statistics(self) -> Dict[str, Any]:
         """Return statistics about proposals."""
-        all_proposals = self.persistence.load_funding_proposals()
+        status_totals = self.persistence.get_proposal_stats()
+        total_proposals = sum(bucket["count"] for bucket in status_totals.values())
         
         stats = {
-            "total_proposals": len(all_proposals),
-            "by_status": {},
-            "total_requested_sats": 0,
-            "total_approved_sats": 0,
+            "total_proposals": total_proposals,
+            "by_status": {
+                status: bucket["count"] for status, bucket in status_totals.items()
+            },
+            "total_requested_sats": sum(
+                bucket["requested_sats"] for bucket in status_totals.values()
+            ),
+            "total_approved_sats": status_totals.get("approved", {}).get(
+                "requested_sats", 0
+            ),
             "approval_rate": 0.0,
             "average_requested_amount": 0,
         }
         
-        if not all_proposals:
+        if not total_proposals:
             return stats
         
-        # Count by status
-        for proposal in all_proposals:
-            status = proposal.status
-            stats["by_status"][status] = stats["by_status"].get(status, 0) + 1
-            stats["total_requested_sats"] += proposal.requested_amount_sats
-            
-            if status == "approved":
-                stats["total_approved_sats"] += proposal.requested_amount_sats
-        
         # Calculate approval rate using decided proposals only (approved + rejected)
         decided = stats["by_status"].get("approved", 0) + stats["by_status"].get("rejected", 0)
         if decided > 0:
             stats["approval_rate"] = stats["by_status"].get("approved", 0) / decided
         
         # Calculate average requested amount
-        stats["average_requested_amount"] = stats["total_requested_sats"] // len(all_proposals)
+        stats["average_requested_amount"] = (
+            stats["total_requested_sats"] // total_proposals
+        )
         
         return stats
     
@@ -243,7 +282,7 @@ class FundingProposalManager:
                               recent_performance: Dict) -> int:
         """Calculate expected return on investment."""
         # Base ROI of 5% over 30 days
-        base_roi_rate = 0.05
+        base_roi_rate = BASE_ROI_RATE
         
         # Adjust based on recent performance
         if recent_performance.get("daily_earnings", 0) > 0:
@@ -282,21 +321,12 @@ class FundingProposalManager:
     
     def _calculate_time_horizon(self, active_strategies: List[str]) -> int:
         """Calculate expected timeframe for ROI."""
-        if not active_strategies:
-            return 30  # Default 30 days
-        
-        # Different strategies have different time horizons
-        strategy_horizons = {
-            "market_making": 7,
-            "arbitrage": 1,
-            "yield_farming": 30,
-            "liquidity_provision": 14,
-        }
-        
-        # Use the longest horizon among active strategies
-        max_horizon = 30  # Default
-        for strategy in active_strategies:
-            horizon = strategy_horizons.get(strategy.lower(), 30)
-            max_horizon = max(max_horizon, horizon)
-        
-        return max_horizon
+        # Use the longest horizon among active strategies, never below the default
+        longest = max(
+            (
+                STRATEGY_HORIZON_DAYS.get(strategy.lower(), DEFAULT_HORIZON_DAYS)
+                for strategy in active_strategies
+            ),
+            default=DEFAULT_HORIZON_DAYS,
+        )
+        return max(longest, DEFAULT_HORIZON_DAYS)
@@ -3,16 +3,55 @@
 import hashlib
 import hmac
 import time
-from typing import Any, Dict, Optional
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 
 import httpx
 
 from ..config import Config
 from ..logging import get_logger
+from ..utils import json_dumps
 from .schema import FundingProposal
 
 logger = get_logger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Human-readable proposal text sent to n8n as "formatted_message"
+_PROPOSAL_MESSAGE_TEMPLATE = (
+    "🤖 FALCONER FUNDING REQUEST\n"
+    "\n"
+    "💰 Amount Requested: {requested_amount_sats:,} sats\n"
+    "💳 Current Balance: {current_balance_sats:,} sats\n"
+    "📊 Expected ROI: {expected_roi_sats:,} sats\n"
+    "⏱️ Time Horizon: {time_horizon_days} days\n"
+    "⚠️ Risk Level: {risk_assessment}\n"
+    "\n"
+    "📝 JUSTIFICATION:\n"
+    "{justification}\n"
+    "\n"
+    "🎯 INTENDED USE:\n"
+    "{intended_use}\n"
+    "\n"
+    "🚀 STRATEGIES TO EXECUTE:\n"
+    "{strategies}\n"
+    "\n"
+    "🆔 Proposal ID: {proposal_id}\n"
+    "📅 Created: {created_at:%Y-%m-%d %H:%M:%S UTC}\n"
+    "\n"
+    "Please approve or reject this funding request."
+)
+
+# Listed when a proposal names no strategies of its own
+_DEFAULT_STRATEGIES = ("Market making", "Arbitrage opportunities", "Yield farming")
+
+# Size of an HMAC-SHA256 digest; signatures arrive hex-encoded
+_SIGNATURE_BYTES = 32
+
+# Largest approval webhook body that will be hashed for signature verification
+MAX_WEBHOOK_BYTES = 64 * 1024
+
 
 class N8nAdapter:
     """Adapter for n8n webhook integration."""
@@ -24,6 +63,35 @@ class N8nAdapter:
         self.auth_token = config.n8n_webhook_auth_token
         self.secret = config.n8n_webhook_secret
         self.timeout = config.n8n_webhook_timeout_seconds
+        
+        # Keyed HMAC state, copied for each verification instead of re-keying
+        self._hmac = (
+            hmac.new(self.secret.encode(), digestmod=hashlib.sha256)
+            if self.secret
+            else None
+        )
+        
+        # Keep-alive client reused across sends, created on first use
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it if needed."""
+        if self._client is None or self._client.is_closed:
+            headers = {"User-Agent": "Falconer/1.0"}
+            if self.auth_token:
+                headers["Authorization"] = f"Bearer {self.auth_token}"
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                headers=headers,
+                limits=httpx.Limits(max_keepalive_connections=10),
+            )
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
     
     async def send_proposal(self, proposal: FundingProposal) -> Dict[str, Any]:
         """Send funding proposal to n8n webhook."""
@@ -41,57 +109,45 @@ class N8nAdapter:
             "risk_assessment": proposal.risk_assessment,
             "strategies_to_execute": proposal.strategies_to_execute,
             "time_horizon_days": proposal.time_horizon_days,
-            "created_at": proposal.created_at.isoformat(),
+            "created_at": proposal.created_at,
             "formatted_message": self.format_proposal_for_human(proposal),
         }
-        
-        # Prepare headers
-        headers = {
-            "Content-Type": "application/json",
-            "User-Agent": "Falconer/1.0",
-        }
-        
-        # Add authentication if configured
-        if self.auth_token:
-            headers["Authorization"] = f"Bearer {self.auth_token}"
+        body = json_dumps(payload)
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                logger.info(
-                    "Sending funding proposal to n8n",
-                    extra={
-                        "proposal_id": proposal.proposal_id,
-                        "webhook_url": self.webhook_url,
-                        "requested_amount_sats": proposal.requested_amount_sats,
-                    }
-                )
-                
-                response = await client.post(
-                    self.webhook_url,
-                    json=payload,
-                    headers=headers,
-                )
-                
-                response.raise_for_status()
-                
-                response_data = response.json() if response.content else {}
-                
-                logger.info(
-                    "Successfully sent funding proposal to n8n",
-                    extra={
-                        "proposal_id": proposal.proposal_id,
-                        "status_code": response.status_code,
-                        "response_data": response_data,
-                    }
-                )
-                
-                return {
-                    "success": True,
+            logger.info(
+                "Sending funding proposal to n8n",
+                extra={
+                    "proposal_id": proposal.proposal_id,
+                    "webhook_url": self.webhook_url,
+                    "requested_amount_sats": proposal.requested_amount_sats,
+                }
+            )
+            
+            response = await self._get_client().post(
+                self.webhook_url, content=body, headers=_JSON_HEADERS
+            )
+            
+            response.raise_for_status()
+            
+            response_data = response.json() if response.content else {}
+            
+            logger.info(
+                "Successfully sent funding proposal to n8n",
+                extra={
+                    "proposal_id": proposal.proposal_id,
                     "status_code": response.status_code,
-                    "workflow_id": response_data.get("workflow_id"),
                     "response_data": response_data,
                 }
-                
+            )
+            
+            return {
+                "success": True,
+                "status_code": response.status_code,
+                "workflow_id": response_data.get("workflow_id"),
+                "response_data": response_data,
+            }
+            
         except httpx.TimeoutException:
             logger.error(
                 "Timeout sending funding proposal to n8n",
@@ -148,23 +204,43 @@ class N8nAdapter:
                 )
                 return False
             
-            # Compute expected signature
-            message = timestamp.encode() + payload
-            expected_signature = hmac.new(
-                self.secret.encode(),
-                message,
-                hashlib.sha256
-            ).hexdigest()
+            # Refuse oversized bodies before spending any hashing work on them
+            if len(payload) > MAX_WEBHOOK_BYTES:
+                logger.warning(
+                    "Webhook payload too large",
+                    extra={
+                        "payload_bytes": len(payload),
+                        "max_bytes": MAX_WEBHOOK_BYTES,
+                    }
+                )
+                return False
             
-            # Constant-time comparison
-            is_valid = hmac.compare_digest(signature, expected_signature)
+            # Reject anything that is not a hex SHA-256 digest before hashing
+            try:
+                provided_signature = bytes.fromhex(signature)
+            except ValueError:
+                provided_signature = b""
+            if len(provided_signature) != _SIGNATURE_BYTES:
+                logger.warning(
+                    "Malformed webhook signature", extra={"signature": signature}
+                )
+                return False
+            
+            # Compute expected signature over timestamp + payload without joining them
+            mac = self._hmac.copy()
+            mac.update(timestamp.encode())
+            mac.update(payload)
+            expected_signature = mac.digest()
+            
+            # Constant-time comparison of the raw digests; never use == here
+            is_valid = hmac.compare_digest(provided_signature, expected_signature)
             
             if not is_valid:
                 logger.warning(
                     "Invalid webhook signature",
                     extra={
                         "provided_signature": signature,
-                        "expected_signature": expected_signature,
+                        "expected_signature": expected_signature.hex(),
                     }
                 )
             
@@ -183,38 +259,52 @@ class N8nAdapter:
     
     def format_proposal_for_human(self, proposal: FundingProposal) -> str:
         """Format proposal as human-readable text for n8n notification."""
-        lines = [
-            "🤖 FALCONER FUNDING REQUEST",
-            "",
-            f"💰 Amount Requested: {proposal.requested_amount_sats:,} sats",
-            f"💳 Current Balance: {proposal.current_balance_sats:,} sats",
-            f"📊 Expected ROI: {proposal.expected_roi_sats:,} sats",
-            f"⏱️ Time Horizon: {proposal.time_horizon_days} days",
-            f"⚠️ Risk Level: {proposal.risk_assessment.upper()}",
-            "",
-            "📝 JUSTIFICATION:",
+        fields = (
+            proposal.proposal_id,
+            proposal.created_at,
+            proposal.requested_amount_sats,
+            proposal.current_balance_sats,
+            proposal.expected_roi_sats,
+            proposal.time_horizon_days,
+            proposal.risk_assessment,
             proposal.justification,
-            "",
-            "🎯 INTENDED USE:",
             proposal.intended_use,
-            "",
-            "🚀 STRATEGIES TO EXECUTE:",
-        ]
-        
-        if proposal.strategies_to_execute:
-            for strategy in proposal.strategies_to_execute:
-                lines.append(f"  • {strategy}")
-        else:
-            lines.append("  • Market making")
-            lines.append("  • Arbitrage opportunities")
-            lines.append("  • Yield farming")
-        
-        lines.extend([
-            "",
-            f"🆔 Proposal ID: {proposal.proposal_id}",
-            f"📅 Created: {proposal.created_at.strftime('%Y-%m-%d %H:%M:%S UTC')}",
-            "",
-            "Please approve or reject this funding request.",
-        ])
-        
-        return "\n".join(lines)
+            tuple(proposal.strategies_to_execute),
+        )
+        # Pending proposals can still be edited, so only decided ones are memoized
+        if proposal.status == "pending":
+            return _format_proposal(*fields)
+        return _format_proposal_cached(*fields)
+
+
+def _format_proposal(
+    proposal_id: str,
+    created_at: datetime,
+    requested_amount_sats: int,
+    current_balance_sats: int,
+    expected_roi_sats: int,
+    time_horizon_days: int,
+    risk_assessment: str,
+    justification: str,
+    intended_use: str,
+    strategies_to_execute: Tuple[str, ...],
+) -> str:
+    """Render the human-readable proposal text from its displayed fields."""
+    return _PROPOSAL_MESSAGE_TEMPLATE.format(
+        proposal_id=proposal_id,
+        created_at=created_at,
+        requested_amount_sats=requested_amount_sats,
+        current_balance_sats=current_balance_sats,
+        expected_roi_sats=expected_roi_sats,
+        time_horizon_days=time_horizon_days,
+        risk_assessment=risk_assessment.upper(),
+        justification=justification,
+        intended_use=intended_use,
+        strategies="\n".join(
+            f"  • {strategy}"
+            for strategy in strategies_to_execute or _DEFAULT_STRATEGIES
+        ),
+    )
+
+
+_format_proposal_cached = lru_cache(maxsize=256)(_format_proposal)
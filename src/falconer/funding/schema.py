@@ -1,16 +1,31 @@
 """Pydantic models for funding proposals."""
 
+import os
+import time
 from datetime import datetime
-from typing import List, Optional
-from uuid import UUID, uuid4
+from typing import List, Literal, Optional
+from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+
+# Canonical lowercase UUID text, as produced by str(uuid7())
+PROPOSAL_ID_PATTERN = r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"
+
+
+def uuid7() -> UUID:
+    """Generate a time-ordered UUID (RFC 9562 version 7)."""
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    # Set the version (0b0111) and variant (0b10) bits
+    value = value & ~(0xF << 76) | (0x7 << 76)
+    value = value & ~(0x3 << 62) | (0x2 << 62)
+    return UUID(int=value)
 
 
 class FundingProposal(BaseModel):
     """Main funding proposal model."""
     
-    proposal_id: str = Field(default_factory=lambda: str(uuid4()))
+    proposal_id: str = Field(default_factory=lambda: str(uuid7()))
     created_at: datetime = Field(default_factory=datetime.utcnow)
     status: str = Field(default="pending")  # pending, approved, rejected, executed, expired
     requested_amount_sats: int = Field(gt=0, description="Amount of Bitcoin requested in satoshis")
@@ -28,14 +43,9 @@ class FundingProposal(BaseModel):
     approval_notes: Optional[str] = None
     executed_at: Optional[datetime] = None
     execution_txid: Optional[str] = None
+    expired_at: Optional[datetime] = None
     n8n_workflow_id: Optional[str] = None
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-            UUID: lambda v: str(v),
-        }
-
 
 class ProposalApproval(BaseModel):
     """Model for approval notifications from n8n."""
@@ -48,16 +58,25 @@ class ProposalApproval(BaseModel):
     signature: str = Field(description="HMAC signature for verification")
 
 
+class ApprovalWebhookPayload(BaseModel):
+    """Body of an approval webhook request from n8n."""
+    
+    proposal_id: str = Field(
+        pattern=PROPOSAL_ID_PATTERN,
+        description="ID of proposal being approved/rejected",
+    )
+    status: Literal["approved", "rejected"]
+    approved_by: str = Field(default="unknown", description="Human identifier")
+    approval_notes: Optional[str] = Field(default=None, description="Human comments")
+
+
 class ProposalSummary(BaseModel):
     """Lightweight model for listing proposals."""
     
+    model_config = ConfigDict(frozen=True)
+    
     proposal_id: str
     created_at: datetime
     status: str
     requested_amount_sats: int
     justification: str = Field(description="Truncated to 200 chars")
-
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
@@ -1,20 +1,139 @@
 """FastAPI-based webhook server for receiving approval notifications from n8n."""
 
-import json
-from typing import Dict, Any
+import asyncio
+import hashlib
+import re
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Callable, Dict, Any, List, TypeVar, Union
 
 from fastapi import FastAPI, Request, HTTPException, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+from pydantic import TypeAdapter, ValidationError
 import uvicorn
 
 from ..config import Config
 from ..logging import get_logger
+from ..utils import json_dumps
 from .manager import FundingProposalManager
-from .n8n_adapter import N8nAdapter
-from .schema import ProposalApproval
+from .n8n_adapter import MAX_WEBHOOK_BYTES, N8nAdapter
+from .schema import PROPOSAL_ID_PATTERN, ApprovalWebhookPayload, FundingProposal
 
 logger = get_logger(__name__)
 
+# Approved proposals waiting for an operator to create the PSBT
+APPROVAL_QUEUE_DIR = Path("data/approval_queue")
+
+# Fixed webhook rejections, encoded once instead of raised through the
+# exception handlers
+_ERROR_BODIES = {
+    "missing_auth": (401, json_dumps({"detail": "Missing authentication headers"})),
+    "invalid_signature": (401, json_dumps({"detail": "Invalid signature"})),
+    "invalid_json": (400, json_dumps({"detail": "Invalid JSON payload"})),
+    "invalid_payload": (400, json_dumps({"detail": "Invalid approval payload"})),
+    "not_found": (404, json_dumps({"detail": "Proposal not found"})),
+    "invalid_proposal_id": (400, json_dumps({"detail": "Invalid proposal ID"})),
+}
+
+# Malformed IDs are refused before any proposal lookup or approval queue path is built
+_PROPOSAL_ID_RE = re.compile(PROPOSAL_ID_PATTERN)
+
+
+# Validator for POST /webhook/approval/batch bodies, built once
+_APPROVAL_BATCH = TypeAdapter(List[ApprovalWebhookPayload])
+
+
+def _error_response(reason: str) -> Response:
+    """Build the response for one of the fixed rejections in ``_ERROR_BODIES``."""
+    status_code, body = _ERROR_BODIES[reason]
+    return Response(
+        content=body, status_code=status_code, media_type="application/json"
+    )
+
+
+async def _read_body(request: Request) -> bytes:
+    """Read the request body, refusing anything larger than MAX_WEBHOOK_BYTES."""
+    content_length = request.headers.get("content-length")
+    if content_length is not None and (
+        not content_length.isdigit() or int(content_length) > MAX_WEBHOOK_BYTES
+    ):
+        raise HTTPException(status_code=413, detail="Payload too large")
+    
+    # Chunked bodies carry no length, so also stop reading once over the limit
+    chunks = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > MAX_WEBHOOK_BYTES:
+            raise HTTPException(status_code=413, detail="Payload too large")
+        if chunk:
+            chunks.append(chunk)
+    # A single-chunk body is returned as-is rather than copied
+    return b"".join(chunks)
+
+
+T = TypeVar("T")
+
+
+async def _read_signed_payload(
+    request: Request, n8n_adapter: N8nAdapter, parse: Callable[[bytes], T]
+) -> Union[T, Response]:
+    """Authenticate a webhook request and parse its body.
+    
+    Args:
+        request: Incoming webhook request
+        n8n_adapter: Adapter holding the webhook secret
+        parse: Validator turning the raw body into the payload, e.g. model_validate_json
+        
+    Returns:
+        The parsed payload, or the error response to send back instead
+    """
+    # Extract signature and timestamp from headers
+    signature = request.headers.get("X-Signature")
+    timestamp = request.headers.get("X-Timestamp")
+    
+    if not signature or not timestamp:
+        logger.warning("Missing signature or timestamp in webhook request")
+        return _error_response("missing_auth")
+    
+    # Get raw body for signature verification
+    body = await _read_body(request)
+    
+    # Verify signature (HMAC-SHA256, compared in constant time by the adapter)
+    if not n8n_adapter.verify_webhook_signature(body, signature, timestamp):
+        logger.warning("Invalid webhook signature")
+        return _error_response("invalid_signature")
+    
+    # Parse and validate the payload in one pass over the raw body
+    try:
+        return parse(body)
+    except ValidationError as e:
+        logger.warning(f"Invalid approval payload: {e}")
+        if any(error["type"] == "json_invalid" for error in e.errors()):
+            return _error_response("invalid_json")
+        return _error_response("invalid_payload")
+
+
+def _proposal_etag(proposal: FundingProposal) -> str:
+    """Return a strong ETag over the proposal fields that change after creation."""
+    version = "|".join(
+        str(value)
+        for value in (
+            proposal.status,
+            proposal.approved_at,
+            proposal.approved_by,
+            proposal.executed_at,
+            proposal.execution_txid,
+        )
+    )
+    return '"%s"' % hashlib.blake2b(version.encode(), digest_size=8).hexdigest()
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag."""
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
 
 def create_webhook_app(
     config: Config,
@@ -23,164 +142,232 @@ def create_webhook_app(
 ) -> FastAPI:
     """Factory function to create configured FastAPI app with dependency injection."""
     
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        app.state.approval_queue_dir.mkdir(parents=True, exist_ok=True)
+        yield
+        await n8n_adapter.aclose()
+    
     app = FastAPI(
         title="Falconer Webhook Server",
         description="Webhook server for receiving funding proposal approvals from n8n",
         version="1.0.0",
+        lifespan=lifespan,
     )
     
     # Store dependencies in app state
     app.state.config = config
     app.state.proposal_manager = proposal_manager
     app.state.n8n_adapter = n8n_adapter
+    app.state.approval_queue_dir = APPROVAL_QUEUE_DIR
+    
+    async def apply_approval(approval: ApprovalWebhookPayload) -> Dict[str, Any]:
+        """Approve or reject a pending proposal and return the webhook result for it."""
+        proposal_manager = app.state.proposal_manager
+        proposal_id = approval.proposal_id
+        status = approval.status
+        approved_by = approval.approved_by
+        approval_notes = approval.approval_notes
+        
+        # Process approval/rejection
+        if status == "approved":
+            updated_proposal = proposal_manager.approve_proposal(
+                proposal_id, approved_by, approval_notes
+            )
+            logger.info(
+                "Proposal approved via webhook",
+                extra={
+                    "proposal_id": proposal_id,
+                    "approved_by": approved_by,
+                    "requested_amount_sats": updated_proposal.requested_amount_sats,
+                }
+            )
+            
+            # Initiate human handoff for PSBT creation
+            try:
+                # Log explicit instruction for operator
+                logger.info(
+                    "FUNDING PROPOSAL APPROVED - HUMAN HANDOFF REQUIRED",
+                    extra={
+                        "proposal_id": proposal_id,
+                        "requested_amount_sats": updated_proposal.requested_amount_sats,
+                        "action_required": (
+                            "Create and broadcast PSBT for approved funding"
+                        ),
+                        "cli_command": (
+                            f"falconer funding execute --proposal-id {proposal_id}"
+                        ),
+                    },
+                )
+                
+                # Persist a flag for CLI consumption
+                # This could be extended to create a dedicated task queue
+                approval_record = {
+                    "proposal_id": proposal_id,
+                    "approved_at": updated_proposal.approved_at.isoformat(),
+                    "approved_by": approved_by,
+                    "requested_amount_sats": updated_proposal.requested_amount_sats,
+                    "status": "pending_execution",
+                    "action_required": "create_psbt",
+                }
+                
+                # Store in persistence for CLI to consume
+                # This is a simple approach - in production you might use a proper
+                # task queue
+                approval_file = app.state.approval_queue_dir / f"{proposal_id}.json"
+                await asyncio.to_thread(
+                    approval_file.write_bytes, json_dumps(approval_record, indent=True)
+                )
+                
+                logger.info(
+                    "Approval record persisted for CLI consumption",
+                    extra={
+                        "proposal_id": proposal_id,
+                        "approval_file": str(approval_file),
+                    }
+                )
+                
+            except Exception as e:
+                logger.error(
+                    "Failed to initiate human handoff after approval",
+                    extra={
+                        "proposal_id": proposal_id,
+                        "error": str(e),
+                    }
+                )
+        else:  # rejected
+            reason = approval_notes or "Rejected via webhook"
+            updated_proposal = proposal_manager.reject_proposal(
+                proposal_id, approved_by, reason
+            )
+            logger.info(
+                "Proposal rejected via webhook",
+                extra={
+                    "proposal_id": proposal_id,
+                    "rejected_by": approved_by,
+                    "reason": reason,
+                }
+            )
+        
+        return {
+            "success": True,
+            "message": f"Proposal {status} successfully",
+            "proposal_id": proposal_id,
+            "status": updated_proposal.status,
+            "updated_at": (
+                updated_proposal.approved_at.isoformat()
+                if updated_proposal.approved_at
+                else (
+                    updated_proposal.rejected_at.isoformat()
+                    if updated_proposal.rejected_at
+                    else None
+                )
+            ),
+        }
     
     @app.post("/webhook/approval")
     async def receive_approval(request: Request):
         """Main endpoint to receive approval notifications from n8n."""
         try:
             # Get dependencies from app state
-            config = app.state.config
             proposal_manager = app.state.proposal_manager
-            n8n_adapter = app.state.n8n_adapter
-            
-            # Extract signature and timestamp from headers
-            signature = request.headers.get("X-Signature")
-            timestamp = request.headers.get("X-Timestamp")
-            
-            if not signature or not timestamp:
-                logger.warning("Missing signature or timestamp in webhook request")
-                raise HTTPException(status_code=401, detail="Missing authentication headers")
-            
-            # Get raw body for signature verification
-            body = await request.body()
             
-            # Verify signature
-            if not n8n_adapter.verify_webhook_signature(body, signature, timestamp):
-                logger.warning("Invalid webhook signature")
-                raise HTTPException(status_code=401, detail="Invalid signature")
-            
-            # Parse approval data
-            try:
-                approval_data = json.loads(body.decode())
-            except json.JSONDecodeError as e:
-                logger.error(f"Invalid JSON in webhook payload: {e}")
-                raise HTTPException(status_code=400, detail="Invalid JSON payload")
+            approval = await _read_signed_payload(
+                request,
+                app.state.n8n_adapter,
+                ApprovalWebhookPayload.model_validate_json,
+            )
+            if isinstance(approval, Response):
+                return approval
             
-            proposal_id = approval_data.get("proposal_id")
-            status = approval_data.get("status")
-            approved_by = approval_data.get("approved_by", "unknown")
-            approval_notes = approval_data.get("approval_notes")
+            # Load proposal
+            proposal = proposal_manager.get_proposal(approval.proposal_id)
+            if not proposal:
+                logger.warning(f"Proposal not found: {approval.proposal_id}")
+                return _error_response("not_found")
             
-            if not proposal_id or not status:
-                logger.warning("Missing required fields in approval data")
-                raise HTTPException(status_code=400, detail="Missing proposal_id or status")
+            if proposal.status != "pending":
+                logger.warning(
+                    f"Proposal not in pending status: {approval.proposal_id} "
+                    f"(status: {proposal.status})"
+                )
+                raise HTTPException(
+                    status_code=400,
+                    detail=(
+                        f"Proposal not in pending status (current: {proposal.status})"
+                    ),
+                )
             
-            if status not in ["approved", "rejected"]:
-                logger.warning(f"Invalid status in approval data: {status}")
-                raise HTTPException(status_code=400, detail="Status must be 'approved' or 'rejected'")
+            return JSONResponse(status_code=200, content=await apply_approval(approval))
             
-            # Load proposal
-            proposal = proposal_manager.get_proposal(proposal_id)
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error processing webhook approval: {e}")
+            raise HTTPException(status_code=500, detail="Internal server error")
+    
+    async def apply_batch_item(approval: ApprovalWebhookPayload) -> Dict[str, Any]:
+        """Apply one approval from a batch, reporting any failure in its result."""
+        def failed(detail: str) -> Dict[str, Any]:
+            return {
+                "success": False,
+                "proposal_id": approval.proposal_id,
+                "detail": detail,
+            }
+        
+        try:
+            proposal = app.state.proposal_manager.get_proposal(approval.proposal_id)
             if not proposal:
-                logger.warning(f"Proposal not found: {proposal_id}")
-                raise HTTPException(status_code=404, detail="Proposal not found")
+                logger.warning(f"Proposal not found: {approval.proposal_id}")
+                return failed("Proposal not found")
             
             if proposal.status != "pending":
-                logger.warning(f"Proposal not in pending status: {proposal_id} (status: {proposal.status})")
-                raise HTTPException(status_code=400, detail=f"Proposal not in pending status (current: {proposal.status})")
-            
-            # Process approval/rejection
-            if status == "approved":
-                updated_proposal = proposal_manager.approve_proposal(proposal_id, approved_by, approval_notes)
-                logger.info(
-                    "Proposal approved via webhook",
-                    extra={
-                        "proposal_id": proposal_id,
-                        "approved_by": approved_by,
-                        "requested_amount_sats": updated_proposal.requested_amount_sats,
-                    }
+                logger.warning(
+                    f"Proposal not in pending status: {approval.proposal_id} "
+                    f"(status: {proposal.status})"
                 )
-                
-                # Initiate human handoff for PSBT creation
-                try:
-                    # Log explicit instruction for operator
-                    logger.info(
-                        "FUNDING PROPOSAL APPROVED - HUMAN HANDOFF REQUIRED",
-                        extra={
-                            "proposal_id": proposal_id,
-                            "requested_amount_sats": updated_proposal.requested_amount_sats,
-                            "action_required": "Create and broadcast PSBT for approved funding",
-                            "cli_command": f"falconer funding execute --proposal-id {proposal_id}",
-                        }
-                    )
-                    
-                    # Persist a flag for CLI consumption
-                    # This could be extended to create a dedicated task queue
-                    approval_record = {
-                        "proposal_id": proposal_id,
-                        "approved_at": updated_proposal.approved_at.isoformat(),
-                        "approved_by": approved_by,
-                        "requested_amount_sats": updated_proposal.requested_amount_sats,
-                        "status": "pending_execution",
-                        "action_required": "create_psbt",
-                    }
-                    
-                    # Store in persistence for CLI to consume
-                    # This is a simple approach - in production you might use a proper task queue
-                    import json
-                    import os
-                    from pathlib import Path
-                    
-                    approval_queue_dir = Path("data/approval_queue")
-                    approval_queue_dir.mkdir(parents=True, exist_ok=True)
-                    
-                    approval_file = approval_queue_dir / f"{proposal_id}.json"
-                    with open(approval_file, "w") as f:
-                        json.dump(approval_record, f, indent=2)
-                    
-                    logger.info(
-                        "Approval record persisted for CLI consumption",
-                        extra={
-                            "proposal_id": proposal_id,
-                            "approval_file": str(approval_file),
-                        }
-                    )
-                    
-                except Exception as e:
-                    logger.error(
-                        "Failed to initiate human handoff after approval",
-                        extra={
-                            "proposal_id": proposal_id,
-                            "error": str(e),
-                        }
-                    )
-            else:  # rejected
-                reason = approval_notes or "Rejected via webhook"
-                updated_proposal = proposal_manager.reject_proposal(proposal_id, approved_by, reason)
-                logger.info(
-                    "Proposal rejected via webhook",
-                    extra={
-                        "proposal_id": proposal_id,
-                        "rejected_by": approved_by,
-                        "reason": reason,
-                    }
+                return failed(
+                    f"Proposal not in pending status (current: {proposal.status})"
                 )
             
+            return await apply_approval(approval)
+            
+        except Exception as e:
+            logger.error(
+                "Unexpected error processing batch approval "
+                f"{approval.proposal_id}: {e}"
+            )
+            return failed("Internal server error")
+    
+    @app.post("/webhook/approval/batch")
+    async def receive_approval_batch(request: Request):
+        """Receive several approval notifications in one signed JSON array.
+        
+        The signature is checked once over the whole body. Each approval is then
+        applied independently and gets its own entry in ``results``, so a failure
+        partway through never hides the approvals that were already applied.
+        """
+        try:
+            approvals = await _read_signed_payload(
+                request, app.state.n8n_adapter, _APPROVAL_BATCH.validate_json
+            )
+            if isinstance(approvals, Response):
+                return approvals
+            
+            results = [await apply_batch_item(approval) for approval in approvals]
+            
             return JSONResponse(
                 status_code=200,
                 content={
-                    "success": True,
-                    "message": f"Proposal {status} successfully",
-                    "proposal_id": proposal_id,
-                    "status": updated_proposal.status,
-                    "updated_at": updated_proposal.approved_at.isoformat() if updated_proposal.approved_at else updated_proposal.rejected_at.isoformat() if updated_proposal.rejected_at else None,
+                    "success": all(result["success"] for result in results),
+                    "results": results,
                 }
             )
             
         except HTTPException:
             raise
         except Exception as e:
-            logger.error(f"Unexpected error processing webhook approval: {e}")
+            logger.error(f"Unexpected error processing webhook approval batch: {e}")
             raise HTTPException(status_code=500, detail="Internal server error")
     
     @app.get("/webhook/health")
@@ -193,15 +380,24 @@ def create_webhook_app(
         }
     
     @app.get("/webhook/proposals/{proposal_id}")
-    async def get_proposal_status(proposal_id: str):
+    async def get_proposal_status(proposal_id: str, request: Request):
         """Query endpoint to check proposal status."""
         proposal_manager = app.state.proposal_manager
         
+        if not _PROPOSAL_ID_RE.fullmatch(proposal_id):
+            return _error_response("invalid_proposal_id")
+        
         proposal = proposal_manager.get_proposal(proposal_id)
         if not proposal:
-            raise HTTPException(status_code=404, detail="Proposal not found")
+            return _error_response("not_found")
         
-        return {
+        # Pollers that already hold the current version get an empty 304
+        etag = _proposal_etag(proposal)
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match and _etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        
+        content = {
             "proposal_id": proposal.proposal_id,
             "status": proposal.status,
             "created_at": proposal.created_at.isoformat(),
@@ -211,6 +407,7 @@ def create_webhook_app(
             "executed_at": proposal.executed_at.isoformat() if proposal.executed_at else None,
             "execution_txid": proposal.execution_txid,
         }
+        return JSONResponse(content=content, headers={"ETag": etag})
     
     return app
 
@@ -239,4 +436,6 @@ def run_webhook_server(
         port=config.webhook_server_port,
         reload=config.webhook_server_reload,
         log_level="info",
+        # Requests are already logged as structured events by the handlers
+        access_log=False,
     )
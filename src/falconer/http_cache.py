@@ -0,0 +1,83 @@
+"""On-disk cache for read-only backend responses."""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from .logging import get_logger
+from .utils import json_dumps, json_loads
+
+logger = get_logger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "falconer" / "responses"
+
+
+def cache_key(method: str, params: Any = None) -> str:
+    """Return the SHA256 hex digest identifying a request.
+
+    Args:
+        method: Backend method or URL being queried
+        params: JSON-serializable request parameters
+
+    Returns:
+        Hex digest used as the cache file name
+    """
+    payload = json.dumps(
+        {"method": method, "params": params}, sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _cache_path(method: str, params: Any, cache_dir: Optional[Path]) -> Path:
+    return (cache_dir or DEFAULT_CACHE_DIR) / f"{cache_key(method, params)}.json"
+
+
+def read_cached(
+    method: str, params: Any, ttl: float, cache_dir: Optional[Path] = None
+) -> Optional[Any]:
+    """Return a stored response if it is younger than ``ttl`` seconds.
+
+    Args:
+        method: Backend method or URL being queried
+        params: JSON-serializable request parameters
+        ttl: Maximum age of a cached response in seconds; 0 disables the cache
+        cache_dir: Directory holding cached responses
+
+    Returns:
+        The cached response, or None on a miss
+    """
+    if ttl <= 0:
+        return None
+    path = _cache_path(method, params, cache_dir)
+    try:
+        if time.time() - path.stat().st_mtime < ttl:
+            return json_loads(path.read_bytes())
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable cache entry", path=str(path), error=str(e))
+    return None
+
+
+def write_cached(
+    method: str, params: Any, value: Any, cache_dir: Optional[Path] = None
+) -> None:
+    """Store a response, replacing any previous entry atomically.
+
+    Args:
+        method: Backend method or URL being queried
+        params: JSON-serializable request parameters
+        value: JSON-serializable response
+        cache_dir: Directory holding cached responses
+    """
+    path = _cache_path(method, params, cache_dir)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(json_dumps(value))
+        os.replace(tmp_path, path)
+    except (OSError, TypeError) as e:
+        logger.warning("Failed to write cache entry", path=str(path), error=str(e))
@@ -15,10 +15,12 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> No
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional log file path
     """
-    # Configure structlog
+    level = getattr(logging, log_level.upper())
+
+    # Configure structlog; the filtering wrapper drops calls below the level
+    # before any processor runs
     structlog.configure(
         processors=[
-            structlog.stdlib.filter_by_level,
             structlog.stdlib.add_logger_name,
             structlog.stdlib.add_log_level,
             structlog.stdlib.PositionalArgumentsFormatter(),
@@ -30,7 +32,7 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> No
         ],
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         cache_logger_on_first_use=True,
     )
 
@@ -38,7 +40,7 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> No
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,
-        level=getattr(logging, log_level.upper()),
+        level=level,
     )
 
     # Set up file logging if specified
@@ -47,7 +49,7 @@ def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None) -> No
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
         file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(getattr(logging, log_level.upper()))
+        file_handler.setLevel(level)
         file_handler.setFormatter(logging.Formatter("%(message)s"))
 
         root_logger = logging.getLogger()
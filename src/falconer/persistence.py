@@ -1,13 +1,16 @@
 """Persistence layer for Falconer data."""
 
-import json
+import heapq
 import os
-from datetime import date, datetime, timedelta
+from collections import deque
+from datetime import date, datetime, timedelta, timezone
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
 
 from .logging import get_logger
 from .policy.schema import DailySpend, TransactionRequest
+from .utils import json_dumps, json_loads
 
 logger = get_logger(__name__)
 
@@ -18,6 +21,21 @@ except ImportError:
     # Handle case where funding module is not available
     FundingProposal = None
 
+# Most recent records kept in the append-only transaction and violation logs
+MAX_TRANSACTION_HISTORY = 1000
+MAX_POLICY_VIOLATIONS = 500
+# Read size when scanning a log backwards for its most recent records
+_TAIL_BLOCK_BYTES = 64 * 1024
+
+# FundingProposal fields stored as ISO 8601 strings
+_PROPOSAL_DATETIME_FIELDS = (
+    "created_at",
+    "approved_at",
+    "rejected_at",
+    "executed_at",
+    "expired_at",
+)
+
 
 class PersistenceManager:
     """Manages persistent storage for Falconer data."""
@@ -32,9 +50,22 @@ class PersistenceManager:
         self.data_dir.mkdir(exist_ok=True)
 
         self.daily_spends_file = self.data_dir / "daily_spends.json"
-        self.transaction_history_file = self.data_dir / "transaction_history.json"
-        self.policy_violations_file = self.data_dir / "policy_violations.json"
+        self.transaction_history_file = self.data_dir / "transaction_history.jsonl"
+        self.policy_violations_file = self.data_dir / "policy_violations.jsonl"
         self.funding_proposals_file = self.data_dir / "funding_proposals.json"
+        
+        # Parsed JSON files, reused while the file on disk is unchanged
+        self._json_cache: Dict[Path, Tuple[Tuple[int, int, int], Any]] = {}
+
+        # Funding proposal records grouped by status, for the parsed dict they came from
+        self._proposal_status_index: Optional[Tuple[Dict, Dict[str, List[Dict]]]] = None
+
+        # Known line counts of the append-only logs, used to schedule compaction
+        self._log_line_counts: Dict[Path, int] = {}
+
+        # Convert logs written by older versions as a single JSON array
+        for log_file in (self.transaction_history_file, self.policy_violations_file):
+            self._migrate_json_log(log_file.with_suffix(".json"), log_file)
 
     def save_daily_spend(self, daily_spend: DailySpend) -> None:
         """Save daily spend record.
@@ -49,8 +80,8 @@ class PersistenceManager:
             # Update or add the record
             daily_spends[daily_spend.date] = daily_spend.model_dump()
 
-            # Save back to file
-            self._save_json(self.daily_spends_file, daily_spends)
+            # Save back to file; the records are plain JSON values, so keep them cached
+            self._save_json(self.daily_spends_file, daily_spends, keep_cached=True)
 
             logger.info(
                 "Daily spend saved",
@@ -76,7 +107,8 @@ class PersistenceManager:
         try:
             daily_spends = self._load_daily_spends()
             if date_str in daily_spends:
-                return DailySpend(**daily_spends[date_str])
+                # Stored records were validated when saved; skip the date re-parse
+                return DailySpend.model_construct(**daily_spends[date_str])
             return None
 
         except Exception as e:
@@ -94,17 +126,24 @@ class PersistenceManager:
         """
         try:
             daily_spends = self._load_daily_spends()
-            cutoff_date = datetime.now().date()
-
-            result = []
-            for i in range(days):
-                check_date = cutoff_date - timedelta(days=i)
-                date_str = check_date.strftime("%Y-%m-%d")
-
-                if date_str in daily_spends:
-                    result.append(DailySpend(**daily_spends[date_str]))
-
-            return result
+            today = datetime.now().date()
+            first_str = (today - timedelta(days=days - 1)).isoformat()
+            today_str = today.isoformat()
+
+            # YYYY-MM-DD keys sort the same as the dates, so filter with one scan,
+            # newest first
+            date_strs = sorted(
+                (
+                    date_str
+                    for date_str in daily_spends
+                    if first_str <= date_str <= today_str
+                ),
+                reverse=True,
+            )
+            return [
+                DailySpend.model_construct(**daily_spends[date_str])
+                for date_str in date_strs
+            ]
 
         except Exception as e:
             logger.error("Failed to load daily spends", error=str(e))
@@ -120,13 +159,6 @@ class PersistenceManager:
             txid: Transaction ID if available
         """
         try:
-            # Load existing history
-            history = self._load_json(self.transaction_history_file, [])
-
-            # Ensure history is a list
-            if not isinstance(history, list):
-                history = []
-
             # Create transaction record
             transaction_record = {
                 "timestamp": request.created_at.isoformat(),
@@ -138,15 +170,12 @@ class PersistenceManager:
                 "status": "completed" if txid else "pending",
             }
 
-            # Add to history
-            history.append(transaction_record)
-
-            # Keep only last 1000 transactions
-            if len(history) > 1000:
-                history = history[-1000:]
-
-            # Save back to file
-            self._save_json(self.transaction_history_file, history)
+            # Append to history, keeping roughly the last 1000 transactions
+            self._append_jsonl(
+                self.transaction_history_file,
+                transaction_record,
+                MAX_TRANSACTION_HISTORY,
+            )
 
             logger.info(
                 "Transaction saved to history", txid=txid, amount=request.amount_sats
@@ -166,8 +195,7 @@ class PersistenceManager:
             List of transaction records
         """
         try:
-            history = self._load_json(self.transaction_history_file, [])
-            return history[-limit:] if limit else history
+            return self._load_jsonl(self.transaction_history_file, limit)
 
         except Exception as e:
             logger.error("Failed to load transaction history", error=str(e))
@@ -179,33 +207,35 @@ class PersistenceManager:
         Args:
             violation_data: Policy violation data
         """
-        try:
-            # Load existing violations
-            violations = self._load_json(self.policy_violations_file, [])
+        self.save_policy_violations([violation_data])
 
-            # Ensure violations is a list
-            if not isinstance(violations, list):
-                violations = []
+    def save_policy_violations(self, violations: List[Dict]) -> None:
+        """Save several policy violation records with a single write.
 
-            # Add timestamp
-            violation_data["timestamp"] = datetime.utcnow().isoformat()
-
-            # Add to violations
-            violations.append(violation_data)
-
-            # Keep only last 500 violations
-            if len(violations) > 500:
-                violations = violations[-500:]
+        Args:
+            violations: Policy violation data, one dict per violation
+        """
+        if not violations:
+            return
 
-            # Save back to file
-            self._save_json(self.policy_violations_file, violations)
+        try:
+            # Add timestamp
+            timestamp = datetime.now(timezone.utc).isoformat()
+            for violation_data in violations:
+                violation_data["timestamp"] = timestamp
 
-            logger.warning(
-                "Policy violation recorded",
-                violation_type=violation_data.get("violation_type"),
-                severity=violation_data.get("severity"),
+            # Append to violations, keeping roughly the last 500
+            self._append_jsonl_records(
+                self.policy_violations_file, violations, MAX_POLICY_VIOLATIONS
             )
 
+            for violation_data in violations:
+                logger.warning(
+                    "Policy violation recorded",
+                    violation_type=violation_data.get("violation_type"),
+                    severity=violation_data.get("severity"),
+                )
+
         except Exception as e:
             logger.error("Failed to save policy violation", error=str(e))
             raise
@@ -220,8 +250,7 @@ class PersistenceManager:
             List of policy violation records
         """
         try:
-            violations = self._load_json(self.policy_violations_file, [])
-            return violations[-limit:] if limit else violations
+            return self._load_jsonl(self.policy_violations_file, limit)
 
         except Exception as e:
             logger.error("Failed to load policy violations", error=str(e))
@@ -233,7 +262,7 @@ class PersistenceManager:
         Returns:
             Dictionary of daily spend records
         """
-        return self._load_json(self.daily_spends_file, {})
+        return self._load_cached_json(self.daily_spends_file, {})
 
     def _load_json(self, file_path: Path, default: any = None) -> any:
         """Load JSON data from file.
@@ -245,13 +274,11 @@ class PersistenceManager:
         Returns:
             Loaded JSON data or default value
         """
-        if not file_path.exists():
-            return default or {}
-
         try:
-            with open(file_path, "r") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
+            return json_loads(file_path.read_bytes())
+        except FileNotFoundError:
+            return default or {}
+        except (ValueError, IOError) as e:
             logger.warning(
                 "Failed to load JSON file, using default",
                 file=str(file_path),
@@ -259,39 +286,240 @@ class PersistenceManager:
             )
             return default or {}
 
-    def _save_json(self, file_path: Path, data: any) -> None:
+    def _load_cached_json(self, file_path: Path, default: Any) -> Any:
+        """Load JSON data from file, reusing the last parse while the file is unchanged.
+
+        The file's inode, mtime and size are checked on every call, so writes
+        from other processes are picked up. Callers may mutate the returned
+        object before passing it to ``_save_json``, which drops the cached copy.
+
+        Args:
+            file_path: Path to JSON file
+            default: Value returned if the file doesn't exist
+
+        Returns:
+            Loaded JSON data or default value
+        """
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            self._json_cache.pop(file_path, None)
+            return default
+
+        file_key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        cached = self._json_cache.get(file_path)
+        if cached is not None and cached[0] == file_key:
+            return cached[1]
+
+        data = self._load_json(file_path, default)
+        self._json_cache[file_path] = (file_key, data)
+        return data
+
+    def _save_json(self, file_path: Path, data: any, keep_cached: bool = False) -> None:
         """Save JSON data to file.
 
         Args:
             file_path: Path to JSON file
             data: Data to save
+            keep_cached: Serve ``data`` from the read cache until the file changes
+                again; only valid when it holds JSON-native values, so that it
+                matches what a reread would return
+        """
+        # The cached parse may have been mutated by the caller; reread after writing
+        self._json_cache.pop(file_path, None)
+
+        # Write a sibling temp file and swap it in, so readers and crashes only
+        # ever see the old or the new contents; datetimes are stored as ISO 8601
+        tmp_path = file_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(json_dumps(data, indent=True))
+                f.flush()
+                os.fsync(f.fileno())
+                # The rename keeps inode, mtime and size, so this is the key a reread
+                # would see
+                stat = os.fstat(f.fileno())
+            os.replace(tmp_path, file_path)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        if keep_cached:
+            file_key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            self._json_cache[file_path] = (file_key, data)
+
+    def _append_jsonl(self, file_path: Path, record: Dict, max_records: int) -> None:
+        """Append a record to a JSON Lines log, compacting it when it grows too long.
+
+        Args:
+            file_path: Path to JSONL file
+            record: Record to append
+            max_records: Number of most recent records to retain
+        """
+        self._append_jsonl_records(file_path, [record], max_records)
+
+    def _append_jsonl_records(
+        self, file_path: Path, records: List[Dict], max_records: int
+    ) -> None:
+        """Append records to a JSON Lines log in one write, compacting it when long.
+
+        The log is trimmed back to ``max_records`` once it holds twice that many
+        lines, so appends stay O(1) and the file size stays bounded.
+
+        Args:
+            file_path: Path to JSONL file
+            records: Records to append, oldest first
+            max_records: Number of most recent records to retain
+        """
+        line_count = self._log_line_counts.get(file_path)
+        if line_count is None:
+            line_count = self._count_lines(file_path)
+
+        with open(file_path, "ab") as f:
+            f.write(b"".join(json_dumps(record) + b"\n" for record in records))
+        line_count += len(records)
+
+        if line_count > 2 * max_records:
+            line_count = self._compact_jsonl(file_path, max_records)
+        self._log_line_counts[file_path] = line_count
+
+    def _load_jsonl(self, file_path: Path, limit: Optional[int] = None) -> List[Dict]:
+        """Load the most recent records from a JSON Lines log.
+
+        Args:
+            file_path: Path to JSONL file
+            limit: Maximum number of records to return; all records if falsy
+
+        Returns:
+            Records in chronological order
         """
         try:
-            # Create backup if file exists
-            if file_path.exists():
-                backup_path = file_path.with_suffix(".json.bak")
-                file_path.rename(backup_path)
+            with open(file_path, "rb") as f:
+                lines = self._tail_lines(f, limit) if limit else f.readlines()
+        except FileNotFoundError:
+            return []
 
-            # Write new data
-            def json_serializer(obj):
-                if isinstance(obj, datetime):
-                    return obj.isoformat()
-                raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+        records = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                records.append(json_loads(line))
+            except ValueError as e:
+                # A torn final line from an interrupted append
+                logger.warning(
+                    "Skipping unreadable log line", file=str(file_path), error=str(e)
+                )
+        return records
+
+    @staticmethod
+    def _tail_lines(f: BinaryIO, limit: int) -> List[bytes]:
+        """Read the last ``limit`` lines of a file, reading backwards from the end.
 
-            with open(file_path, "w") as f:
-                json.dump(data, f, indent=2, default=json_serializer)
+        Args:
+            f: File opened in binary mode
+            limit: Number of lines to return
 
-            # Remove backup if write was successful
-            backup_path = file_path.with_suffix(".json.bak")
-            if backup_path.exists():
-                backup_path.unlink()
+        Returns:
+            Up to ``limit`` lines in file order
+        """
+        pos = f.seek(0, os.SEEK_END)
+        blocks: List[bytes] = []
+        newlines = 0
+        # One newline more than needed proves the first kept line is complete
+        while pos > 0 and newlines <= limit:
+            size = min(_TAIL_BLOCK_BYTES, pos)
+            pos -= size
+            f.seek(pos)
+            block = f.read(size)
+            blocks.append(block)
+            newlines += block.count(b"\n")
+
+        lines = b"".join(reversed(blocks)).split(b"\n")
+        if pos > 0:
+            lines = lines[1:]
+        if lines and not lines[-1]:
+            lines.pop()
+        return lines[-limit:]
+
+    def _compact_jsonl(self, file_path: Path, max_records: int) -> int:
+        """Rewrite a JSON Lines log keeping only its last ``max_records`` lines.
+
+        Args:
+            file_path: Path to JSONL file
+            max_records: Number of most recent lines to keep
+
+        Returns:
+            Number of lines left in the log
+        """
+        try:
+            with open(file_path, "rb") as f:
+                lines = deque(f, maxlen=max_records)
+        except FileNotFoundError:
+            return 0
+
+        tmp_path = file_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.writelines(lines)
+        os.replace(tmp_path, file_path)
+        return len(lines)
+
+    @staticmethod
+    def _count_lines(file_path: Path) -> int:
+        """Count the lines in a file, treating a missing file as empty."""
+        try:
+            with open(file_path, "rb") as f:
+                return sum(1 for _ in f)
+        except FileNotFoundError:
+            return 0
+
+    def _migrate_json_log(self, legacy_path: Path, file_path: Path) -> None:
+        """Convert a log stored as a JSON array into JSON Lines.
+
+        The old file is only removed once its records are safely in the new
+        log. A file that does not parse as a JSON array is renamed to
+        ``*.corrupt`` and left for the operator. Errors are logged, never raised.
+
+        Args:
+            legacy_path: Path of the old JSON array file
+            file_path: Path of the JSONL file replacing it
+        """
+        if not legacy_path.exists() or file_path.exists():
+            return
+
+        try:
+            try:
+                records = json_loads(legacy_path.read_bytes())
+            except ValueError:
+                records = None
+            if not isinstance(records, list):
+                corrupt_path = legacy_path.with_suffix(".json.corrupt")
+                legacy_path.rename(corrupt_path)
+                logger.error(
+                    "Legacy log is not a JSON array, left unconverted",
+                    file=str(legacy_path),
+                    moved_to=str(corrupt_path),
+                )
+                return
+
+            tmp_path = file_path.with_suffix(f".{os.getpid()}.tmp")
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.writelines(json_dumps(record) + b"\n" for record in records)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, file_path)
+            except Exception:
+                tmp_path.unlink(missing_ok=True)
+                raise
+
+            legacy_path.unlink()
+            logger.info("Converted log to JSON Lines", file=str(file_path))
 
         except Exception as e:
-            # Restore backup if write failed
-            backup_path = file_path.with_suffix(".json.bak")
-            if backup_path.exists():
-                backup_path.rename(file_path)
-            raise
+            logger.error(
+                "Failed to convert legacy log", file=str(legacy_path), error=str(e)
+            )
 
     def cleanup_old_data(self, days: int = 90) -> None:
         """Clean up old data files.
@@ -302,14 +530,24 @@ class PersistenceManager:
         try:
             cutoff_date = datetime.now().date() - timedelta(days=days)
 
-            # Clean up old daily spends
+            # Clean up old daily spends; YYYY-MM-DD keys sort the same as the dates
+            cutoff_str = cutoff_date.isoformat()
             daily_spends = self._load_daily_spends()
             cleaned_spends = {
                 date_str: data
                 for date_str, data in daily_spends.items()
-                if datetime.strptime(date_str, "%Y-%m-%d").date() >= cutoff_date
+                if date_str >= cutoff_str
             }
-            self._save_json(self.daily_spends_file, cleaned_spends)
+            if len(cleaned_spends) < len(daily_spends):
+                self._save_json(self.daily_spends_file, cleaned_spends)
+
+            # Trim the append-only logs to their retention limits
+            self._log_line_counts[self.transaction_history_file] = self._compact_jsonl(
+                self.transaction_history_file, MAX_TRANSACTION_HISTORY
+            )
+            self._log_line_counts[self.policy_violations_file] = self._compact_jsonl(
+                self.policy_violations_file, MAX_POLICY_VIOLATIONS
+            )
 
             logger.info("Old data cleaned up", cutoff_date=cutoff_date.isoformat())
 
@@ -369,7 +607,7 @@ class PersistenceManager:
             proposal_data = proposals.get(proposal_id)
             
             if proposal_data:
-                return FundingProposal(**proposal_data)
+                return self._proposal_from_record(proposal_data)
             return None
             
         except Exception as e:
@@ -380,12 +618,20 @@ class PersistenceManager:
             )
             return None
 
-    def load_funding_proposals(self, status: Optional[str] = None, limit: int = 100) -> List["FundingProposal"]:
-        """Load funding proposals, optionally filtered by status.
+    def load_funding_proposals(
+        self,
+        status: Optional[str] = None,
+        limit: int = 100,
+        before: Optional[Tuple[datetime, str]] = None,
+    ) -> List["FundingProposal"]:
+        """Load funding proposals, newest first, optionally filtered by status.
         
         Args:
-            status: Optional status filter (pending, approved, rejected, executed, expired)
+            status: Optional status filter (pending, approved, rejected, executed,
+                expired)
             limit: Maximum number of proposals to return
+            before: Optional (created_at, proposal_id) key; only proposals ordered
+                after it (i.e. older) are returned, for keyset pagination
             
         Returns:
             List of FundingProposal objects
@@ -395,26 +641,165 @@ class PersistenceManager:
             return []
             
         try:
-            proposals = self._load_funding_proposals()
-            proposal_objects = []
-            
-            for proposal_data in proposals.values():
-                proposal = FundingProposal(**proposal_data)
-                
-                # Apply status filter if specified
-                if status is None or proposal.status == status:
-                    proposal_objects.append(proposal)
-            
-            # Sort by created_at descending
-            proposal_objects.sort(key=lambda p: p.created_at, reverse=True)
-            
-            # Apply limit
-            return proposal_objects[:limit]
+            rows = self._select_funding_proposals(status, limit, before)
+            return [
+                self._proposal_from_record(proposal_data) for _, proposal_data in rows
+            ]
             
         except Exception as e:
             logger.error("Failed to load funding proposals", error=str(e))
             return []
 
+    def load_funding_proposal_summaries(
+        self,
+        status: Optional[str] = None,
+        limit: int = 100,
+        before: Optional[Tuple[datetime, str]] = None,
+    ) -> List[Dict]:
+        """Load the listing fields of funding proposals, newest first.
+
+        Returns plain records instead of FundingProposal objects, so listing does
+        not pay for validating fields it never shows.
+
+        Args:
+            status: Optional status filter (pending, approved, rejected, executed,
+                expired)
+            limit: Maximum number of proposals to return
+            before: Optional (created_at, proposal_id) key; only older proposals
+                are returned
+
+        Returns:
+            List of dicts with proposal_id, created_at, status, requested_amount_sats
+            and justification
+        """
+        try:
+            return [
+                {
+                    "proposal_id": proposal_id,
+                    "created_at": created_at,
+                    "status": proposal_data["status"],
+                    "requested_amount_sats": proposal_data["requested_amount_sats"],
+                    "justification": proposal_data["justification"],
+                }
+                for (
+                    created_at,
+                    proposal_id,
+                ), proposal_data in self._select_funding_proposals(
+                    status, limit, before
+                )
+            ]
+
+        except Exception as e:
+            logger.error("Failed to load funding proposal summaries", error=str(e))
+            return []
+
+    def load_funding_proposal_ids(
+        self, status: Optional[str] = None, created_before: Optional[datetime] = None
+    ) -> List[str]:
+        """Load IDs of funding proposals matching the given filters.
+
+        Filters on the stored records directly, without building FundingProposal
+        objects for proposals that are not selected.
+
+        Args:
+            status: Optional status filter (pending, approved, rejected, executed,
+                expired)
+            created_before: Only include proposals created strictly before this time
+
+        Returns:
+            List of matching proposal IDs
+        """
+        try:
+            return [
+                proposal_data["proposal_id"]
+                for proposal_data in self._proposals_with_status(status)
+                if created_before is None
+                or datetime.fromisoformat(proposal_data["created_at"]) < created_before
+            ]
+
+        except Exception as e:
+            logger.error("Failed to load funding proposal IDs", error=str(e))
+            return []
+
+    def update_funding_proposal_status(
+        self, proposal_ids: List[str], status: str, **fields: Any
+    ) -> int:
+        """Set the status of several funding proposals in a single write.
+
+        Args:
+            proposal_ids: IDs of the proposals to update
+            status: New status for every listed proposal
+            **fields: Additional fields to set on every listed proposal, e.g. expired_at
+
+        Returns:
+            Number of proposals updated
+        """
+        if not proposal_ids:
+            return 0
+
+        try:
+            proposals = self._load_funding_proposals()
+            updated = 0
+            for proposal_id in proposal_ids:
+                proposal_data = proposals.get(proposal_id)
+                if proposal_data is not None:
+                    proposal_data["status"] = status
+                    proposal_data.update(fields)
+                    updated += 1
+
+            if updated:
+                self._save_json(self.funding_proposals_file, proposals)
+
+            logger.info(
+                "Funding proposal statuses updated", status=status, count=updated
+            )
+            return updated
+
+        except Exception as e:
+            logger.error(
+                "Failed to update funding proposal statuses",
+                status=status,
+                error=str(e),
+            )
+            raise
+
+    def count_proposals(self, status: Optional[str] = None) -> int:
+        """Count funding proposals, optionally filtered by status.
+
+        Args:
+            status: Optional status filter (pending, approved, rejected, executed,
+                expired)
+
+        Returns:
+            Number of matching proposals
+        """
+        try:
+            return len(self._proposals_with_status(status))
+
+        except Exception as e:
+            logger.error("Failed to count funding proposals", error=str(e))
+            return 0
+
+    def get_proposal_stats(self) -> Dict[str, Dict[str, int]]:
+        """Aggregate funding proposal counts and requested amounts by status.
+
+        Returns:
+            Mapping of status to {"count": ..., "requested_sats": ...}
+        """
+        try:
+            stats: Dict[str, Dict[str, int]] = {}
+            for proposal_data in self._load_funding_proposals().values():
+                bucket = stats.setdefault(
+                    proposal_data["status"], {"count": 0, "requested_sats": 0}
+                )
+                bucket["count"] += 1
+                bucket["requested_sats"] += proposal_data["requested_amount_sats"]
+            return stats
+
+        except Exception as e:
+            logger.error("Failed to aggregate funding proposals", error=str(e))
+            return {}
+
     def delete_funding_proposal(self, proposal_id: str) -> bool:
         """Delete a funding proposal by ID.
         
@@ -444,6 +829,84 @@ class PersistenceManager:
             )
             return False
 
+    @staticmethod
+    def _proposal_from_record(proposal_data: Dict) -> "FundingProposal":
+        """Build a FundingProposal from a stored record without re-validating it.
+        
+        Records are only ever written from validated models, so only the
+        timestamps need converting back from their ISO 8601 form.
+        
+        Args:
+            proposal_data: Stored proposal record
+            
+        Returns:
+            FundingProposal object
+        """
+        fields = dict(proposal_data)
+        for name in _PROPOSAL_DATETIME_FIELDS:
+            value = fields.get(name)
+            if isinstance(value, str):
+                fields[name] = datetime.fromisoformat(value)
+        return FundingProposal.model_construct(**fields)
+
+    def _select_funding_proposals(
+        self,
+        status: Optional[str],
+        limit: int,
+        before: Optional[Tuple[datetime, str]],
+    ) -> List[Tuple[Tuple[datetime, str], Dict]]:
+        """Filter and order stored proposal records without hydrating them.
+        
+        Args:
+            status: Optional status filter
+            limit: Maximum number of records to return
+            before: Optional (created_at, proposal_id) key to page after
+            
+        Returns:
+            ((created_at, proposal_id), record) pairs, newest first
+        """
+        def rows():
+            for proposal_data in self._proposals_with_status(status):
+                key = (
+                    datetime.fromisoformat(proposal_data["created_at"]),
+                    proposal_data["proposal_id"],
+                )
+                if before is not None and key >= before:
+                    continue
+                
+                yield key, proposal_data
+        
+        # Keep only the newest `limit` rows by (created_at, proposal_id) in a
+        # bounded heap
+        return heapq.nlargest(limit, rows(), key=itemgetter(0))
+
+    def _proposals_with_status(self, status: Optional[str]) -> List[Dict]:
+        """Return the stored proposal records with the given status.
+        
+        The records are grouped by status once per parse of the proposals
+        file, so repeated filters only touch the matching records.
+        
+        Args:
+            status: Status to select, or None for every proposal
+            
+        Returns:
+            Matching proposal records; callers must not modify the list
+        """
+        proposals = self._load_funding_proposals()
+        if status is None:
+            return list(proposals.values())
+        
+        # The cached dict is replaced, never reused, once the file changes or is saved
+        index = self._proposal_status_index
+        if index is None or index[0] is not proposals:
+            by_status: Dict[str, List[Dict]] = {}
+            for proposal_data in proposals.values():
+                by_status.setdefault(proposal_data.get("status"), []).append(
+                    proposal_data
+                )
+            index = self._proposal_status_index = (proposals, by_status)
+        return index[1].get(status, [])
+
     def _load_funding_proposals(self) -> Dict[str, Dict]:
         """Private helper to load proposals dict from file.
         
@@ -451,7 +914,7 @@ class PersistenceManager:
             Dictionary of proposal data keyed by proposal_id
         """
         try:
-            return self._load_json(self.funding_proposals_file)
+            return self._load_cached_json(self.funding_proposals_file, {})
         except Exception as e:
             logger.warning("Failed to load funding proposals file", error=str(e))
             return {}
@@ -21,6 +21,8 @@ class PolicyEngine:
         """
         self.policy = policy
         self.persistence = persistence_manager
+        # Set view of the allow-list for constant-time destination checks
+        self.allowed_destinations = frozenset(policy.allowed_destinations)
         self.daily_spends: List[DailySpend] = []
 
     def validate_transaction(
@@ -46,10 +48,6 @@ class PolicyEngine:
             )
             violations.append(violation)
 
-            # Log violation if persistence is available
-            if self.persistence:
-                self.persistence.save_policy_violation(violation.model_dump())
-
         # Check daily spending limit
         today_spent = self._get_daily_spend(datetime.utcnow().date())
         if today_spent + request.amount_sats > self.policy.max_daily_spend_sats:
@@ -61,14 +59,10 @@ class PolicyEngine:
             )
             violations.append(violation)
 
-            # Log violation if persistence is available
-            if self.persistence:
-                self.persistence.save_policy_violation(violation.model_dump())
-
         # Check allowed destinations
         if (
-            self.policy.allowed_destinations
-            and request.destination not in self.policy.allowed_destinations
+            self.allowed_destinations
+            and request.destination not in self.allowed_destinations
         ):
             violation = PolicyViolation(
                 violation_type="destination_not_allowed",
@@ -78,10 +72,6 @@ class PolicyEngine:
             )
             violations.append(violation)
 
-            # Log violation if persistence is available
-            if self.persistence:
-                self.persistence.save_policy_violation(violation.model_dump())
-
         # Check fee rate limit
         if (
             self.policy.max_fee_rate_sats_per_vbyte
@@ -97,8 +87,12 @@ class PolicyEngine:
             )
             violations.append(violation)
 
-            # Log violation (warnings are also logged)
-            self.persistence.save_policy_violation(violation.dict())
+        # Log all violations in one write if persistence is available (warnings
+        # are also logged)
+        if violations and self.persistence:
+            self.persistence.save_policy_violations(
+                [violation.model_dump() for violation in violations]
+            )
 
         return violations
 
@@ -112,7 +106,7 @@ class PolicyEngine:
             txid: Transaction ID if available
         """
         today = datetime.utcnow().date()
-        today_str = today.strftime("%Y-%m-%d")
+        today_str = today.isoformat()
 
         if self.persistence:
             # Load existing daily spend or create new one
@@ -167,7 +161,7 @@ class PolicyEngine:
         Returns:
             Total spending in satoshis for the date
         """
-        date_str = date.strftime("%Y-%m-%d")
+        date_str = date.isoformat()
 
         if self.persistence:
             daily_spend = self.persistence.load_daily_spend(date_str)
@@ -9,6 +9,7 @@ from ..adapters.bitcoind import BitcoinAdapter
 from ..adapters.electrs import ElectrsAdapter
 from ..config import Config
 from ..logging import get_logger
+from ..utils import dump_model_json
 
 logger = get_logger(__name__)
 
@@ -278,8 +279,8 @@ class FeeBriefTask:
             filename = f"fee_brief_{timestamp}.json"
 
         try:
-            with open(filename, "w") as f:
-                f.write(brief.json(indent=2))
+            with open(filename, "wb") as f:
+                f.write(dump_model_json(brief, indent=True))
 
             logger.info("Fee brief saved", filename=filename)
             return filename
@@ -1,17 +1,149 @@
 """Utility functions for Falconer."""
 
 import asyncio
+import atexit
+import json
+import threading
 import time
+from datetime import date, datetime
 from functools import wraps
-from typing import Any, Callable, Optional, Tuple, Type
+from typing import Any, Callable, Dict, Optional, Tuple, Type, Union
 
 import httpx
+from pydantic import BaseModel
 
 from .logging import get_logger
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, see the "speedups" extra
+    orjson = None
+
 logger = get_logger(__name__)
 
 
+def _json_default(obj: Any) -> str:
+    """Serialize datetimes the same way orjson does for the stdlib fallback."""
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON, using orjson when it is installed.
+
+    Args:
+        data: JSON document as bytes or str
+
+    Returns:
+        Parsed Python object
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize an object to UTF-8 JSON bytes, using orjson when it is installed.
+
+    Args:
+        obj: Object to serialize; datetime and date values become ISO 8601 strings
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        text = json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default)
+    else:
+        text = json.dumps(
+            obj, separators=(",", ":"), ensure_ascii=False, default=_json_default
+        )
+    return text.encode()
+
+
+def dump_model_json(model: BaseModel, indent: bool = False) -> bytes:
+    """Serialize a pydantic model to UTF-8 JSON bytes.
+
+    Uses orjson when it is installed so output matches ``json_dumps``;
+    otherwise pydantic's own serializer, which avoids the intermediate dict.
+
+    Args:
+        model: Model instance to serialize
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return json_dumps(model.model_dump(), indent=indent)
+    return model.model_dump_json(indent=2 if indent else None).encode()
+
+
+_shared_clients: Dict[Tuple[Any, ...], httpx.Client] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def get_shared_client(
+    base_url: str,
+    pool_size: int,
+    auth: Optional[Tuple[str, str]] = None,
+    headers: Optional[Dict[str, str]] = None,
+    timeout: float = 30.0,
+) -> httpx.Client:
+    """Return a process-wide pooled HTTP client for a backend.
+
+    Adapters created for the same backend and credentials share one client, so
+    keep-alive connections are reused instead of reconnecting per adapter.
+
+    Args:
+        base_url: Backend base URL
+        pool_size: Number of keep-alive connections to hold open
+        auth: Optional basic auth credentials
+        headers: Optional default request headers
+        timeout: Request timeout in seconds
+
+    Returns:
+        Shared httpx client, closed automatically at interpreter exit
+    """
+    key = (base_url, auth, tuple(sorted((headers or {}).items())), timeout, pool_size)
+    with _shared_clients_lock:
+        client = _shared_clients.get(key)
+        if client is None or client.is_closed:
+            transport = httpx.HTTPTransport(
+                retries=1,
+                limits=httpx.Limits(
+                    max_keepalive_connections=pool_size,
+                    max_connections=pool_size * 2,
+                ),
+            )
+            client = httpx.Client(
+                base_url=base_url,
+                auth=auth,
+                headers=headers,
+                timeout=timeout,
+                transport=transport,
+            )
+            _shared_clients[key] = client
+        return client
+
+
+def close_shared_clients() -> None:
+    """Close all pooled HTTP clients."""
+    with _shared_clients_lock:
+        for client in _shared_clients.values():
+            client.close()
+        _shared_clients.clear()
+
+
+atexit.register(close_shared_clients)
+
+
 def retry_on_network_error(
     max_attempts: int = 3,
     base_delay: float = 1.0,
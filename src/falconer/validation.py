@@ -1,10 +1,16 @@
 """Validation utilities for Falconer."""
 
 import re
+from functools import lru_cache
 from typing import List, Optional
 
 from .exceptions import AddressValidationError
 
+# Base58 for legacy, bech32 for native segwit
+_ADDRESS_RE = re.compile(
+    r"^[13][a-km-zA-HJ-NP-Z1-9]{25,34}$|^bc1[a-z0-9]{39,59}$|^tb1[a-z0-9]{39,59}$"
+)
+
 
 def validate_bitcoin_address(address: str, network: str = "mainnet") -> bool:
     """Validate a Bitcoin address.
@@ -22,15 +28,18 @@ def validate_bitcoin_address(address: str, network: str = "mainnet") -> bool:
     if not address or not isinstance(address, str):
         raise AddressValidationError("Address must be a non-empty string")
 
+    return _check_address(address, network)
+
+
+@lru_cache(maxsize=1024)
+def _check_address(address: str, network: str) -> bool:
+    """Check an address string; only successful checks are cached."""
     # Basic format validation
     if len(address) < 26 or len(address) > 62:
         raise AddressValidationError("Address length is invalid")
 
-    # Check for valid characters (Base58 for legacy, bech32 for native segwit)
-    if not re.match(
-        r"^[13][a-km-zA-HJ-NP-Z1-9]{25,34}$|^bc1[a-z0-9]{39,59}$|^tb1[a-z0-9]{39,59}$",
-        address,
-    ):
+    # Check for valid characters
+    if not _ADDRESS_RE.match(address):
         raise AddressValidationError("Address format is invalid")
 
     # Network-specific validation
@@ -295,6 +295,6 @@ class PSBTManager:
             return response.result
         except Exception as e:
             # Fallback to a configurable change address or raise error
-            if hasattr(self.config, "change_address") and self.config.change_address:
+            if self.config.change_address:
                 return self.config.change_address
             raise PSBTError(f"Failed to generate change address: {e}")
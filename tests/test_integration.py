@@ -44,6 +44,31 @@ class TestIntegration:
         if os.path.exists("test_data"):
             shutil.rmtree("test_data")
 
+    WEBHOOK_HEADERS = {"X-Signature": "00" * 32, "X-Timestamp": "0"}
+
+    def _make_proposal(self):
+        """Build a pending funding proposal for the n8n and webhook tests."""
+        from falconer.funding.schema import FundingProposal
+
+        return FundingProposal(
+            requested_amount_sats=42000,
+            current_balance_sats=1000,
+            justification="Low balance",
+            intended_use="Market making",
+            expected_roi_sats=2100,
+            time_horizon_days=30,
+        )
+
+    def _webhook_client(self, proposal_manager):
+        """Create a test client for the webhook app backed by ``proposal_manager``."""
+        from fastapi.testclient import TestClient
+
+        from falconer.funding.n8n_adapter import N8nAdapter
+        from falconer.funding.webhook_server import create_webhook_app
+
+        app = create_webhook_app(self.config, proposal_manager, N8nAdapter(self.config))
+        return TestClient(app)
+
     def test_policy_engine_with_persistence(self):
         """Test policy engine with persistence layer."""
         # Create a valid transaction request
@@ -237,6 +262,534 @@ class TestIntegration:
 
             assert tip_height == 800000
 
+    @pytest.mark.asyncio
+    async def test_mempool_adapter_reuses_client(self, monkeypatch):
+        """Test that repeated mempool queries share one keep-alive client."""
+        from unittest.mock import AsyncMock
+
+        from falconer.adapters.mempool import MempoolAdapter
+
+        monkeypatch.setenv("MEMPOOL_MODE", "lan")
+        monkeypatch.setenv("MEMPOOL_LAN_HOST_LOCAL", "mempool.local")
+
+        with patch("falconer.adapters.mempool.httpx.AsyncClient") as mock_client:
+            mock_response = Mock()
+            mock_response.text = "800000"
+            mock_response.headers = {"content-type": "text/plain"}
+            mock_response.raise_for_status.return_value = None
+            mock_client.return_value.is_closed = False
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
+            mock_client.return_value.aclose = AsyncMock()
+
+            adapter = MempoolAdapter()
+            assert await adapter.tip_height() == 800000
+            assert await adapter.tip_height() == 800000
+            await adapter.aclose()
+
+            mock_client.assert_called_once()
+            assert mock_client.return_value.get.await_count == 2
+            mock_client.return_value.aclose.assert_awaited_once()
+
+    def test_mempool_adapter_close_closes_clients(self, monkeypatch):
+        """Test that close() closes clients on the loop that created them."""
+        from unittest.mock import AsyncMock
+
+        from falconer.adapters.mempool import MempoolAdapter
+
+        monkeypatch.setenv("MEMPOOL_MODE", "lan")
+        monkeypatch.setenv("MEMPOOL_LAN_HOST_LOCAL", "mempool.local")
+
+        with patch("falconer.adapters.mempool.httpx.AsyncClient") as mock_client:
+            mock_response = Mock()
+            mock_response.text = "800000"
+            mock_response.headers = {"content-type": "text/plain"}
+            mock_response.raise_for_status.return_value = None
+            mock_client.return_value.is_closed = False
+            mock_client.return_value.get = AsyncMock(return_value=mock_response)
+            mock_client.return_value.aclose = AsyncMock()
+
+            adapter = MempoolAdapter()
+            loop = asyncio.new_event_loop()
+            try:
+                assert loop.run_until_complete(adapter.tip_height()) == 800000
+                adapter.close()
+            finally:
+                loop.close()
+
+            mock_client.return_value.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_n8n_adapter_reuses_client(self):
+        """Test that proposals sent to n8n share one keep-alive client."""
+        from unittest.mock import AsyncMock
+
+        from falconer.funding.n8n_adapter import N8nAdapter
+        from falconer.utils import json_loads
+
+        config = self.config.model_copy(
+            update={
+                "n8n_webhook_url": "https://n8n.local/webhook",
+                "n8n_webhook_auth_token": "token",
+            }
+        )
+        proposal = self._make_proposal()
+
+        with patch("falconer.funding.n8n_adapter.httpx.AsyncClient") as mock_client:
+            mock_response = Mock()
+            mock_response.content = b""
+            mock_response.status_code = 200
+            mock_response.raise_for_status.return_value = None
+            mock_client.return_value.is_closed = False
+            mock_client.return_value.post = AsyncMock(return_value=mock_response)
+            mock_client.return_value.aclose = AsyncMock()
+
+            adapter = N8nAdapter(config)
+            await adapter.send_proposal(proposal)
+            await adapter.send_proposal(proposal)
+            await adapter.aclose()
+
+            mock_client.assert_called_once()
+            assert (
+                mock_client.call_args.kwargs["headers"]["Authorization"]
+                == "Bearer token"
+            )
+            assert mock_client.return_value.post.await_count == 2
+            sent = mock_client.return_value.post.call_args.kwargs
+            assert sent["headers"]["Content-Type"] == "application/json"
+            assert (
+                json_loads(sent["content"])["created_at"]
+                == proposal.created_at.isoformat()
+            )
+            mock_client.return_value.aclose.assert_awaited_once()
+
+    def test_n8n_webhook_signature_verification(self):
+        """Test that webhook signatures are checked against timestamp + payload."""
+        import hashlib
+        import hmac
+        import time
+
+        from falconer.funding.n8n_adapter import MAX_WEBHOOK_BYTES, N8nAdapter
+
+        adapter = N8nAdapter(
+            self.config.model_copy(update={"n8n_webhook_secret": "s3cret"})
+        )
+        payload = b'{"proposal_id": "abc", "status": "approved"}'
+        timestamp = str(int(time.time()))
+        signature = hmac.new(
+            b"s3cret", timestamp.encode() + payload, hashlib.sha256
+        ).hexdigest()
+
+        assert adapter.verify_webhook_signature(payload, signature, timestamp)
+        assert adapter.verify_webhook_signature(payload, signature, timestamp)
+        assert not adapter.verify_webhook_signature(
+            payload + b" ", signature, timestamp
+        )
+        assert not adapter.verify_webhook_signature(payload, "not-hex", timestamp)
+        assert not adapter.verify_webhook_signature(payload, signature[:-2], timestamp)
+        assert not adapter.verify_webhook_signature(payload, "zz" * 32, timestamp)
+        assert not adapter.verify_webhook_signature(payload, signature, "yesterday")
+
+        oversized = b" " * (MAX_WEBHOOK_BYTES + 1)
+        oversized_signature = hmac.new(
+            b"s3cret", timestamp.encode() + oversized, hashlib.sha256
+        ).hexdigest()
+        assert not adapter.verify_webhook_signature(
+            oversized, oversized_signature, timestamp
+        )
+
+    def test_proposal_ids_are_time_ordered(self):
+        """Test that proposal IDs are UUIDv7 values sorting in creation order."""
+        import time
+        from uuid import UUID
+
+        from falconer.funding.schema import uuid7
+
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+
+        assert first.version == 7
+        assert UUID(str(first)) == first
+        assert str(first) < str(second)
+
+    def test_webhook_rejects_oversized_bodies(self):
+        """Test that the approval webhook refuses bodies over the size limit."""
+        from falconer.funding.n8n_adapter import MAX_WEBHOOK_BYTES
+
+        client = self._webhook_client(Mock())
+        headers = self.WEBHOOK_HEADERS
+        oversized = b" " * (MAX_WEBHOOK_BYTES + 1)
+
+        assert (
+            client.post(
+                "/webhook/approval", content=oversized, headers=headers
+            ).status_code
+            == 413
+        )
+        chunked = iter([oversized[:MAX_WEBHOOK_BYTES], b" "])
+        assert (
+            client.post(
+                "/webhook/approval", content=chunked, headers=headers
+            ).status_code
+            == 413
+        )
+
+    def test_webhook_validates_approval_payload(self):
+        """Test that approval bodies are validated against the payload model."""
+        proposal_manager = Mock()
+        proposal_manager.get_proposal.return_value = None
+        client = self._webhook_client(proposal_manager)
+        headers = self.WEBHOOK_HEADERS
+
+        proposal_id = "0190f7a2-5c1e-7000-8000-000000000001"
+
+        def post(body):
+            return client.post("/webhook/approval", content=body, headers=headers)
+
+        assert post(b"{not json").json()["detail"] == "Invalid JSON payload"
+        assert (
+            post(
+                b'{"proposal_id": "%s", "status": "maybe"}' % proposal_id.encode()
+            ).status_code
+            == 400
+        )
+        assert post(b'{"status": "approved"}').status_code == 400
+        assert (
+            post(
+                b'{"proposal_id": "../../etc/passwd", "status": "approved"}'
+            ).status_code
+            == 400
+        )
+        assert (
+            post(
+                b'{"proposal_id": "%s", "status": "approved"}' % proposal_id.encode()
+            ).status_code
+            == 404
+        )
+        proposal_manager.get_proposal.assert_called_once_with(proposal_id)
+
+    def test_webhook_applies_approval_batch(self, tmp_path):
+        """Test that a signed batch applies and reports each approval separately."""
+        found, missing = (
+            "0190f7a2-5c1e-7000-8000-000000000001",
+            "0190f7a2-5c1e-7000-8000-000000000002",
+        )
+        pending = Mock(status="pending")
+        proposal_manager = Mock()
+        proposal_manager.get_proposal.side_effect = lambda proposal_id: (
+            pending if proposal_id == found else None
+        )
+        proposal_manager.approve_proposal.return_value = Mock(
+            status="approved",
+            approved_at=datetime(2024, 1, 1),
+            requested_amount_sats=1000,
+        )
+        client = self._webhook_client(proposal_manager)
+        client.app.state.approval_queue_dir = tmp_path
+        headers = self.WEBHOOK_HEADERS
+
+        response = client.post(
+            "/webhook/approval/batch",
+            json=[
+                {"proposal_id": found, "status": "approved"},
+                {"proposal_id": missing, "status": "rejected"},
+            ],
+            headers=headers,
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["success"] is False
+        assert [result["success"] for result in body["results"]] == [True, False]
+        assert body["results"][1]["detail"] == "Proposal not found"
+        proposal_manager.approve_proposal.assert_called_once_with(
+            found, "unknown", None
+        )
+        assert (tmp_path / f"{found}.json").exists()
+
+        invalid = client.post(
+            "/webhook/approval/batch", json={"proposal_id": found}, headers=headers
+        )
+        assert invalid.status_code == 400
+
+        # A failure while applying one approval is reported in its result
+        proposal_manager.reject_proposal.side_effect = RuntimeError("disk full")
+        failing = client.post(
+            "/webhook/approval/batch",
+            json=[{"proposal_id": found, "status": "rejected"}],
+            headers=headers,
+        )
+        assert failing.status_code == 200
+        assert failing.json()["results"] == [
+            {"success": False, "proposal_id": found, "detail": "Internal server error"}
+        ]
+
+    def test_proposal_query_honours_etag(self):
+        """Test that polling with the current ETag returns 304 until it changes."""
+        proposal = self._make_proposal()
+        proposal_manager = Mock()
+        proposal_manager.get_proposal.return_value = proposal
+        client = self._webhook_client(proposal_manager)
+        url = f"/webhook/proposals/{proposal.proposal_id}"
+
+        assert client.get("/webhook/proposals/not-a-proposal-id").status_code == 400
+        proposal_manager.get_proposal.assert_not_called()
+
+        first = client.get(url)
+        assert first.status_code == 200
+        etag = first.headers["ETag"]
+
+        cached = client.get(url, headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+
+        proposal.status = "approved"
+        changed = client.get(url, headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.json()["status"] == "approved"
+        assert changed.headers["ETag"] != etag
+
+    def test_funding_proposal_amount_override(self):
+        """Test that an overridden proposal amount is persisted in a single write."""
+        from falconer.funding.manager import FundingProposalManager
+
+        persistence = Mock()
+        persistence.count_proposals.return_value = 0
+        manager = FundingProposalManager(self.config, persistence, Mock())
+
+        proposal = manager.generate_proposal(
+            {"current_balance_sats": 25000}, override_amount_sats=42000
+        )
+
+        assert proposal.requested_amount_sats == 42000
+        persistence.save_funding_proposal.assert_called_once_with(proposal)
+
+    def test_adapters_share_pooled_client(self):
+        """Test that adapters for the same backend reuse one pooled HTTP client."""
+        from falconer.adapters.bitcoind import BitcoinAdapter
+        from falconer.adapters.electrs import ElectrsAdapter
+
+        first = BitcoinAdapter(self.config)
+        first.close()
+        second = BitcoinAdapter(self.config)
+
+        assert second.client is first.client
+        assert not second.client.is_closed
+        assert ElectrsAdapter(self.config).client is not first.client
+
+    def test_dump_model_json_matches_without_orjson(self, monkeypatch):
+        """Test that model serialization is identical with and without orjson."""
+        import json
+
+        from falconer import utils
+        from falconer.policy.schema import TransactionRequest
+
+        request = TransactionRequest(
+            destination="bc1qtest", amount_sats=1000, description="caf\u00e9"
+        )
+        expected = json.loads(utils.dump_model_json(request, indent=True))
+
+        monkeypatch.setattr(utils, "orjson", None)
+        fallback = utils.dump_model_json(request, indent=True)
+
+        assert json.loads(fallback) == expected
+        assert fallback.startswith(b"{\n  ")
+
+    def test_adapter_registry_reuses_instances(self):
+        """Test that the adapter registry hands out one instance per adapter name."""
+        from falconer.adapters import BitcoinAdapter
+        from falconer.adapters.registry import AdapterRegistry
+
+        registry = AdapterRegistry(self.config)
+        bitcoin_adapter = registry.get("bitcoin")
+
+        assert isinstance(bitcoin_adapter, BitcoinAdapter)
+        assert registry.get("bitcoin") is bitcoin_adapter
+        assert registry.get("lnbits") is not bitcoin_adapter
+
+        registry.close_all()
+        assert registry.get("bitcoin") is not bitcoin_adapter
+
+        with pytest.raises(KeyError):
+            registry.get("unknown")
+
+    def test_bitcoin_adapter_batch_call(self):
+        """Test that batched RPC calls use one request and keep call order."""
+        from falconer.adapters.bitcoind import BitcoinAdapter
+
+        adapter = BitcoinAdapter(self.config)
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.json.return_value = [
+            {"result": {"size": 12}, "error": None, "id": "1"},
+            {"result": {"blocks": 800000}, "error": None, "id": "0"},
+        ]
+        adapter.client = Mock()
+        adapter.client.post.return_value = mock_response
+
+        results = adapter.batch_call(
+            [("getblockchaininfo", []), ("getmempoolinfo", [])]
+        )
+
+        assert results == [{"blocks": 800000}, {"size": 12}]
+        adapter.client.post.assert_called_once()
+        payload = adapter.client.post.call_args.kwargs["json"]
+        assert [call["method"] for call in payload] == [
+            "getblockchaininfo",
+            "getmempoolinfo",
+        ]
+
+    def test_bitcoin_adapter_batch_call_errors(self):
+        """Test that batches retry network errors and keep RPC error types."""
+        import httpx
+
+        from falconer.adapters.bitcoind import BitcoinAdapter
+        from falconer.exceptions import BitcoinAdapterError, BitcoinRPCError
+
+        adapter = BitcoinAdapter(self.config)
+        mock_response = Mock()
+        mock_response.raise_for_status.return_value = None
+        mock_response.json.return_value = [
+            {"result": {"blocks": 800000}, "error": None, "id": "0"}
+        ]
+        adapter.client = Mock()
+        adapter.client.post.side_effect = [httpx.ConnectError("down"), mock_response]
+
+        with patch("falconer.utils.time.sleep"):
+            assert adapter.batch_call([("getblockchaininfo", [])]) == [
+                {"blocks": 800000}
+            ]
+        assert adapter.client.post.call_count == 2
+
+        adapter.client.post.side_effect = None
+        adapter.client.post.return_value = mock_response
+        mock_response.json.return_value = [
+            {"result": None, "error": {"code": -1, "message": "boom"}, "id": "0"}
+        ]
+        with pytest.raises(BitcoinRPCError):
+            adapter.batch_call([("getblockchaininfo", [])])
+
+        mock_response.json.return_value = []
+        with pytest.raises(
+            BitcoinAdapterError, match="no result for getblockchaininfo"
+        ):
+            adapter.batch_call([("getblockchaininfo", [])])
+
+    def test_response_cache_reuses_fresh_entries(self, tmp_path):
+        """Test that cached responses are reused within the TTL for the same request."""
+        from falconer.http_cache import read_cached, write_cached
+
+        write_cached(
+            "market_data", {"mode": "lan"}, {"feerate": 0.0001}, cache_dir=tmp_path
+        )
+
+        assert read_cached("market_data", {"mode": "lan"}, 60, cache_dir=tmp_path) == {
+            "feerate": 0.0001
+        }
+        assert (
+            read_cached("market_data", {"mode": "tor"}, 60, cache_dir=tmp_path) is None
+        )
+        assert (
+            read_cached("market_data", {"mode": "lan"}, 0, cache_dir=tmp_path) is None
+        )
+
+    def test_policy_violation_error_pickles(self):
+        """Test that policy violation errors keep their violations across pickling."""
+        import pickle
+
+        error = PolicyViolationError("blocked", violations=["daily_limit_exceeded"])
+        restored = pickle.loads(pickle.dumps(error))
+
+        assert str(restored) == "blocked"
+        assert restored.violations == ["daily_limit_exceeded"]
+
+    def test_format_proposal_memoizes_decided_proposals(self):
+        """Test that human-readable text is cached only once a proposal is decided."""
+        from falconer.funding import n8n_adapter
+
+        adapter = n8n_adapter.N8nAdapter(self.config)
+        proposal = self._make_proposal()
+        pending_text = adapter.format_proposal_for_human(proposal)
+        assert "42,000 sats" in pending_text
+
+        cache = n8n_adapter._format_proposal_cached
+        hits_before = cache.cache_info().hits
+        proposal.status = "approved"
+        assert adapter.format_proposal_for_human(proposal) == pending_text
+        assert adapter.format_proposal_for_human(proposal) == pending_text
+        assert cache.cache_info().hits == hits_before + 1
+
+    def test_cli_reports_backend_errors_and_propagates_bugs(self):
+        """Test that backend failures are reported and unexpected errors propagate."""
+        from click.testing import CliRunner
+
+        from falconer import cli
+        from falconer.exceptions import BitcoinAdapterError
+
+        bitcoin_adapter = Mock()
+        lnbits_adapter = Mock()
+        lnbits_adapter.get_wallet_balance.return_value = {"balance": 0}
+        adapters = {"bitcoin": bitcoin_adapter, "lnbits": lnbits_adapter}
+        runner = CliRunner()
+
+        with patch.object(
+            cli, "_get_adapter", side_effect=lambda ctx, name: adapters[name]
+        ):
+            bitcoin_adapter.get_balance.side_effect = BitcoinAdapterError("node down")
+            result = runner.invoke(cli.main, ["balance"])
+            assert result.exit_code == 1
+            assert "Error: node down" in result.output
+
+            # asyncio.TimeoutError is distinct from the builtin before Python 3.11
+            bitcoin_adapter.get_balance.side_effect = asyncio.TimeoutError()
+            result = runner.invoke(cli.main, ["balance"])
+            assert result.exit_code == 1
+            assert "timed out" in result.output
+
+            bitcoin_adapter.get_balance.side_effect = KeyError("result")
+            result = runner.invoke(cli.main, ["balance"])
+            assert isinstance(result.exception, KeyError)
+
+    def test_cli_reports_without_abort(self):
+        """Test that proposal commands report failures without aborting."""
+        from click.testing import CliRunner
+
+        from falconer import cli
+
+        proposal_manager = Mock()
+        proposal_manager.approve_proposal.side_effect = ValueError("Proposal not found")
+
+        def get_proposal_manager(ctx):
+            ctx.obj["proposal_manager"] = proposal_manager
+            return proposal_manager
+
+        with patch.object(cli, "_get_proposal_manager", get_proposal_manager):
+            result = CliRunner().invoke(cli.main, ["proposals", "approve", "x"])
+
+        assert result.exit_code == 0
+        assert "Unexpected error: Proposal not found" in result.output
+
+    def test_cli_config_is_fresh_per_invocation(self, monkeypatch, tmp_path):
+        """Test that each CLI invocation gets its own Config from the environment."""
+        from falconer import cli
+
+        monkeypatch.setenv("VLLM_MODEL", "first")
+        first = cli._load_config(None, None)
+        first.vllm_model = "overridden"
+        monkeypatch.setenv("VLLM_MODEL", "second")
+        assert cli._load_config(None, None).vllm_model == "second"
+
+        # Already set, so load_dotenv leaves the process environment unchanged
+        monkeypatch.setenv("LOG_LEVEL", "INFO")
+        config_file = tmp_path / "falconer.env"
+        config_file.write_text("LOG_LEVEL=DEBUG\n")
+        mtime = config_file.stat().st_mtime
+        from_file = cli._load_config(str(config_file), mtime)
+        from_file.allowed_destinations.append("bc1qleak")
+        again = cli._load_config(str(config_file), mtime)
+        assert again is not from_file
+        assert "bc1qleak" not in again.allowed_destinations
+
 
 class TestConfigurationIntegration:
     """Test configuration integration."""
@@ -255,6 +808,42 @@ class TestConfigurationIntegration:
         ):
             Config(max_daily_spend_sats=5000, max_single_tx_sats=10000)
 
+    def test_config_fields_declared_once(self):
+        """Test that Config declares each setting exactly once."""
+        import ast
+        import inspect
+        from collections import Counter
+
+        class_def = ast.parse(inspect.getsource(Config)).body[0]
+        declared = Counter(
+            node.target.id for node in class_def.body if isinstance(node, ast.AnnAssign)
+        )
+
+        assert [name for name, count in declared.items() if count > 1] == []
+        assert {
+            "openclaw_enabled",
+            "change_address",
+            "ollama_model",
+            "ollama_host",
+        } <= set(Config.model_fields)
+
+    def test_service_urls_cached(self):
+        """Test that service URLs are built once and rebuilt on copy."""
+        config = Config(bitcoind_host_ip="10.0.0.2", bitcoind_port=18443)
+        assert config.bitcoind_url == "http://10.0.0.2:18443"
+        assert config.bitcoind_url is config.bitcoind_url
+        assert "bitcoind_url" not in config.model_dump()
+
+        copied = config.model_copy(update={"bitcoind_port": 8332})
+        assert copied.bitcoind_url == "http://10.0.0.2:8332"
+        assert config.bitcoind_url == "http://10.0.0.2:18443"
+
+        config.bitcoind_scheme = "https"
+        config.bitcoind_host_ip = "10.0.0.3"
+        config.bitcoind_port = 8332
+        assert config.bitcoind_url == "https://10.0.0.3:8332"
+        assert config.electrs_url == Config().electrs_url
+
     def test_allowed_destinations_parsing(self):
         """Test allowed destinations parsing from environment."""
         import os
@@ -44,6 +44,20 @@ class TestOpenClawAPIIntegration:
         data = response.json()
         assert data["echo"] == test_data
 
+    def test_echo_endpoint_invalid_body(self):
+        """Test that echo treats empty or malformed bodies as an empty object."""
+        response = self.client.post("/api/test/echo")
+        assert response.status_code == 200
+        assert response.json() == {"echo": {}}
+
+        response = self.client.post(
+            "/api/test/echo",
+            content=b"{not json",
+            headers={"Content-Type": "application/json"},
+        )
+        assert response.status_code == 200
+        assert response.json() == {"echo": {}}
+
     def test_bitcoin_endpoints_require_api_key(self):
         """Test that Bitcoin endpoints require API key when OpenClaw is enabled."""
         # Test without API key
@@ -108,6 +122,31 @@ class TestOpenClawAPIIntegration:
             assert data["size"] == 5000
             assert data["bytes"] == 1000000
 
+    def test_blockchain_info_conditional_get(self):
+        """Test that a matching If-None-Match returns 304 without hitting the node."""
+        with patch("falconer.api.test_endpoints.BitcoinAdapter") as mock_adapter_class:
+            mock_adapter = Mock()
+            mock_adapter.get_blockchain_info.return_value = {"blocks": 800000}
+            mock_adapter_class.return_value = mock_adapter
+
+            headers = {"X-API-Key": "test-api-key-123"}
+            response = self.client.get("/api/bitcoin/blockchain-info", headers=headers)
+            assert response.status_code == 200
+            data = response.json()
+            # Fields missing from the RPC result fall back to model defaults
+            assert data["chain"] == "main"
+            assert data["pruned"] is False
+            etag = response.headers["ETag"]
+
+            response = self.client.get(
+                "/api/bitcoin/blockchain-info",
+                headers={**headers, "If-None-Match": etag},
+            )
+            assert response.status_code == 304
+            assert response.content == b""
+            assert response.headers["ETag"] == etag
+            assert mock_adapter.get_blockchain_info.call_count == 1
+
     def test_fee_estimates_endpoint(self):
         """Test fee estimates endpoint."""
         with patch("falconer.api.test_endpoints.BitcoinAdapter") as mock_adapter_class:
@@ -242,6 +281,68 @@ class TestOpenClawAPIIntegration:
             assert data["status_code"] == 500
             assert "timestamp" in data
 
+    def test_upstream_failure_fails_fast(self):
+        """Test that a failed upstream call short-circuits later requests with 503."""
+        with patch("falconer.api.test_endpoints.BitcoinAdapter") as mock_adapter_class:
+            mock_adapter = Mock()
+            mock_adapter.get_blockchain_info.side_effect = Exception(
+                "Connection failed"
+            )
+            mock_adapter_class.return_value = mock_adapter
+
+            headers = {"X-API-Key": "test-api-key-123"}
+            response = self.client.get("/api/bitcoin/blockchain-info", headers=headers)
+            assert response.status_code == 500
+
+            response = self.client.get("/api/bitcoin/mempool-info", headers=headers)
+            assert response.status_code == 503
+            assert response.json()["error"] == "Upstream unavailable"
+            mock_adapter.get_mempool_info.assert_not_called()
+
+            # Once the backoff window has passed the upstream is tried again
+            self.app.state.neg_cache[
+                "bitcoind"
+            ] -= self.config.api_upstream_backoff_seconds
+            mock_adapter.get_mempool_info.return_value = {"size": 1}
+            response = self.client.get("/api/bitcoin/mempool-info", headers=headers)
+            assert response.status_code == 200
+            assert "bitcoind" not in self.app.state.neg_cache
+
+    def test_adapters_shared_across_requests(self):
+        """Test that endpoints reuse one adapter instance across requests."""
+        with patch("falconer.api.test_endpoints.BitcoinAdapter") as mock_adapter_class:
+            mock_adapter = Mock()
+            mock_adapter.get_mempool_info.return_value = {"size": 1}
+            mock_adapter.get_transaction.return_value = {"confirmations": 3}
+            mock_adapter_class.return_value = mock_adapter
+
+            headers = {"X-API-Key": "test-api-key-123"}
+            assert (
+                self.client.get(
+                    "/api/bitcoin/mempool-info", headers=headers
+                ).status_code
+                == 200
+            )
+            response = self.client.get(
+                "/api/bitcoin/transaction", params={"tx_id": "ab" * 32}, headers=headers
+            )
+            assert response.status_code == 200
+
+            mock_adapter_class.assert_called_once()
+            mock_adapter.close.assert_not_called()
+
+    def test_repeated_errors_keep_body_shape(self):
+        """Test that repeated errors return the same error body each time."""
+        for _ in range(3):
+            response = self.client.get("/api/bitcoin/blockchain-info")
+            assert response.status_code == 401
+            data = response.json()
+            assert data == {
+                "error": "API key required",
+                "status_code": 401,
+                "timestamp": data["timestamp"],
+            }
+
     def test_openclaw_disabled_allows_access(self):
         """Test that when OpenClaw is disabled, endpoints are accessible without API key."""
         # Create config with OpenClaw disabled
@@ -269,10 +370,35 @@ class TestOpenClawAPIIntegration:
 
     def test_cors_headers(self):
         """Test that CORS headers are properly configured."""
-        response = self.client.get("/api/health")
+        response = self.client.get(
+            "/api/health", headers={"Origin": "http://openclaw.local"}
+        )
         assert "access-control-allow-origin" in response.headers
         assert response.headers["access-control-allow-origin"] == "*"
 
+    def test_cors_preflight_explicit_lists(self):
+        """Test that preflight only allows the methods and headers OpenClaw uses."""
+        response = self.client.options(
+            "/api/bitcoin/blockchain-info",
+            headers={
+                "Origin": "http://openclaw.local",
+                "Access-Control-Request-Method": "GET",
+                "Access-Control-Request-Headers": "X-API-Key",
+            },
+        )
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-methods"] == "GET, POST"
+        assert "access-control-allow-credentials" not in response.headers
+
+        response = self.client.options(
+            "/api/bitcoin/blockchain-info",
+            headers={
+                "Origin": "http://openclaw.local",
+                "Access-Control-Request-Method": "DELETE",
+            },
+        )
+        assert response.status_code == 400
+
 
 class TestBitcoinMarketAnalyzerSkill:
     """Test the Bitcoin Market Analyzer skill for OpenClaw."""
@@ -387,4 +513,4 @@ def test_api_version_consistency():
     
     # Version should match package version
     from falconer import __version__
-    assert data["version"] == __version__
\ No newline at end of file
+    assert data["version"] == __version__
@@ -75,6 +75,25 @@ class TestPersistenceManager:
         assert loaded_spends[1].date == dates[1]  # Yesterday
         assert loaded_spends[2].date == dates[0]  # Day before yesterday
 
+    def test_daily_spends_window_excludes_other_dates(self):
+        """Test that only records within the last N days, up to today, are returned."""
+        today = datetime.now().date()
+        for offset in (-1, 0, 1, 2, 3):
+            self.persistence.save_daily_spend(
+                DailySpend(
+                    date=(today - timedelta(days=offset)).isoformat(),
+                    total_spent_sats=1000,
+                    transaction_count=1,
+                )
+            )
+
+        loaded_spends = self.persistence.load_daily_spends(days=3)
+
+        assert [spend.date for spend in loaded_spends] == [
+            (today - timedelta(days=offset)).isoformat() for offset in (0, 1, 2)
+        ]
+        assert self.persistence.load_daily_spends(days=0) == []
+
     def test_transaction_save_and_load(self):
         """Test saving and loading transaction history."""
         # Create a transaction request
@@ -156,6 +175,25 @@ class TestPersistenceManager:
         assert violations[1]["violation_type"] == "violation_3"
         assert violations[2]["violation_type"] == "violation_4"
 
+    def test_policy_violations_saved_in_one_write(self, monkeypatch):
+        """Test that a batch of violations is appended with a single write."""
+        writes = []
+        append = self.persistence._append_jsonl_records
+        monkeypatch.setattr(
+            self.persistence,
+            "_append_jsonl_records",
+            lambda *args: writes.append(args) or append(*args),
+        )
+
+        self.persistence.save_policy_violations(
+            [{"violation_type": "a"}, {"violation_type": "b"}]
+        )
+
+        assert len(writes) == 1
+        violations = self.persistence.load_policy_violations()
+        assert [v["violation_type"] for v in violations] == ["a", "b"]
+        assert violations[0]["timestamp"] == violations[1]["timestamp"]
+
     def test_data_cleanup(self):
         """Test data cleanup functionality."""
         # Create old data
@@ -259,3 +297,297 @@ class TestPersistenceManager:
         loaded = self.persistence.load_daily_spend("2024-01-01")
         assert loaded.total_spent_sats == 2000
         assert loaded.transaction_count == 2
+
+    def test_expire_funding_proposals_by_id(self):
+        """Test selecting stale pending proposal IDs and expiring them in one write."""
+        now = datetime.utcnow()
+        self.persistence._save_json(
+            self.persistence.funding_proposals_file,
+            {
+                "old": {
+                    "proposal_id": "old",
+                    "status": "pending",
+                    "created_at": now - timedelta(days=2),
+                },
+                "new": {"proposal_id": "new", "status": "pending", "created_at": now},
+                "done": {
+                    "proposal_id": "done",
+                    "status": "approved",
+                    "created_at": now - timedelta(days=2),
+                },
+            },
+        )
+
+        stale = self.persistence.load_funding_proposal_ids(
+            status="pending", created_before=now - timedelta(days=1)
+        )
+        assert stale == ["old"]
+
+        updated = self.persistence.update_funding_proposal_status(
+            stale + ["missing"], "expired", expired_at=now
+        )
+        assert updated == 1
+        stored = self.persistence._load_funding_proposals()
+        assert stored["old"]["status"] == "expired"
+        assert stored["old"]["expired_at"] == now.isoformat()
+        assert "expired_at" not in stored["new"]
+        assert stored["new"]["status"] == "pending"
+        assert stored["done"]["status"] == "approved"
+
+    def test_funding_proposals_keyset_pages(self, monkeypatch):
+        """Test paging through proposals with a (created_at, proposal_id) key."""
+        from falconer import persistence as persistence_module
+        from falconer.funding.manager import FundingProposalManager
+        from falconer.funding.schema import FundingProposal
+
+        monkeypatch.setattr(persistence_module, "FundingProposal", FundingProposal)
+        created_at = datetime(2024, 1, 1)
+        for i in range(5):
+            self.persistence.save_funding_proposal(
+                FundingProposal(
+                    proposal_id=f"p{i}",
+                    created_at=created_at + timedelta(hours=i // 2),
+                    requested_amount_sats=1000,
+                    current_balance_sats=0,
+                    justification="test",
+                    intended_use="test",
+                    expected_roi_sats=0,
+                    time_horizon_days=1,
+                )
+            )
+
+        manager = FundingProposalManager(None, self.persistence, None)
+        seen = []
+        cursor = None
+        while True:
+            page, cursor = manager.list_proposals(limit=2, cursor=cursor)
+            seen.extend(summary.proposal_id for summary in page)
+            if cursor is None:
+                break
+
+        assert seen == ["p4", "p3", "p2", "p1", "p0"]
+        with pytest.raises(ValueError):
+            manager.list_proposals(cursor="not-a-cursor")
+
+    def test_proposal_stats_aggregate_by_status(self):
+        """Test aggregating proposal counts and amounts without loading models."""
+        from falconer.funding.manager import FundingProposalManager
+
+        records = {}
+        for i, (status, amount) in enumerate(
+            [
+                ("approved", 1000),
+                ("approved", 3000),
+                ("rejected", 2000),
+                ("pending", 6000),
+            ]
+        ):
+            records[f"p{i}"] = {"status": status, "requested_amount_sats": amount}
+        self.persistence._save_json(self.persistence.funding_proposals_file, records)
+
+        assert self.persistence.get_proposal_stats()["approved"] == {
+            "count": 2,
+            "requested_sats": 4000,
+        }
+
+        stats = FundingProposalManager(
+            None, self.persistence, None
+        ).get_proposal_statistics()
+        assert stats["total_proposals"] == 4
+        assert stats["by_status"] == {"approved": 2, "rejected": 1, "pending": 1}
+        assert stats["total_requested_sats"] == 12000
+        assert stats["total_approved_sats"] == 4000
+        assert stats["approval_rate"] == pytest.approx(2 / 3)
+        assert stats["average_requested_amount"] == 3000
+
+    def test_count_proposals(self):
+        """Test counting proposals with and without a status filter."""
+        self.persistence._save_json(
+            self.persistence.funding_proposals_file,
+            {
+                "a": {"status": "pending"},
+                "b": {"status": "pending"},
+                "c": {"status": "expired"},
+            },
+        )
+
+        assert self.persistence.count_proposals() == 3
+        assert self.persistence.count_proposals(status="pending") == 2
+        assert self.persistence.count_proposals(status="approved") == 0
+
+    def test_proposal_status_index_follows_updates(self):
+        """Test that status filters see status changes and new proposals."""
+        self.persistence._save_json(
+            self.persistence.funding_proposals_file,
+            {
+                "a": {"proposal_id": "a", "status": "pending"},
+                "b": {"proposal_id": "b", "status": "pending"},
+            },
+        )
+        assert self.persistence.load_funding_proposal_ids(status="pending") == [
+            "a",
+            "b",
+        ]
+
+        self.persistence.update_funding_proposal_status(["a"], "expired")
+        assert self.persistence.load_funding_proposal_ids(status="pending") == ["b"]
+        assert self.persistence.load_funding_proposal_ids(status="expired") == ["a"]
+
+        # A write from another process is picked up as well
+        other = PersistenceManager(data_dir=self.test_dir)
+        other.update_funding_proposal_status(["b"], "expired")
+        assert self.persistence.count_proposals(status="pending") == 0
+        assert self.persistence.count_proposals(status="expired") == 2
+
+    def test_load_funding_proposal_round_trip(self, monkeypatch):
+        """Test that stored proposals load back with their datetime fields restored."""
+        from falconer import persistence as persistence_module
+        from falconer.funding.schema import FundingProposal
+
+        monkeypatch.setattr(persistence_module, "FundingProposal", FundingProposal)
+        proposal = FundingProposal(
+            requested_amount_sats=1000,
+            current_balance_sats=0,
+            justification="test",
+            intended_use="test",
+            expected_roi_sats=0,
+            time_horizon_days=1,
+            status="approved",
+            approved_at=datetime(2024, 1, 2, 3, 4, 5, 678),
+        )
+        self.persistence.save_funding_proposal(proposal)
+
+        loaded = self.persistence.load_funding_proposal(proposal.proposal_id)
+        assert loaded == proposal
+        assert isinstance(loaded.created_at, datetime)
+        assert loaded.rejected_at is None
+
+    def test_funding_proposals_file_parsed_once_until_changed(self, monkeypatch):
+        """Test that proposal reads reuse the parsed file until it changes on disk."""
+        self.persistence._save_json(
+            self.persistence.funding_proposals_file, {"a": {"status": "pending"}}
+        )
+        parses = []
+        load_json = self.persistence._load_json
+        monkeypatch.setattr(
+            self.persistence,
+            "_load_json",
+            lambda *args: parses.append(args) or load_json(*args),
+        )
+
+        assert self.persistence.count_proposals(status="pending") == 1
+        assert self.persistence.count_proposals(status="pending") == 1
+        assert len(parses) == 1
+
+        # A write from another process replaces the file and is picked up
+        other = PersistenceManager(data_dir=self.test_dir)
+        other.update_funding_proposal_status(["a"], "expired")
+        assert self.persistence.count_proposals(status="pending") == 0
+        assert len(parses) == 2
+
+    def test_daily_spends_cached_across_saves(self, monkeypatch):
+        """Test that daily spends are cached until another process writes."""
+        parses = []
+        load_json = self.persistence._load_json
+        monkeypatch.setattr(
+            self.persistence,
+            "_load_json",
+            lambda *args: parses.append(args) or load_json(*args),
+        )
+        spend = DailySpend(date="2024-01-01", total_spent_sats=100, transaction_count=1)
+        self.persistence.save_daily_spend(spend)
+        assert len(parses) == 0
+
+        assert self.persistence.load_daily_spend("2024-01-01").total_spent_sats == 100
+        spend.total_spent_sats = 250
+        self.persistence.save_daily_spend(spend)
+        assert self.persistence.load_daily_spend("2024-01-01").total_spent_sats == 250
+        assert len(parses) == 0
+
+        # A write from another process replaces the file and is picked up
+        other = PersistenceManager(data_dir=self.test_dir)
+        spend.total_spent_sats = 400
+        other.save_daily_spend(spend)
+        assert self.persistence.load_daily_spend("2024-01-01").total_spent_sats == 400
+        assert len(parses) == 1
+
+    def test_failed_save_keeps_previous_file(self):
+        """Test that a failed write leaves the old file and no temp file behind."""
+        file_path = Path(self.test_dir) / "state.json"
+        self.persistence._save_json(file_path, {"a": 1})
+
+        with pytest.raises(TypeError):
+            self.persistence._save_json(file_path, {"a": object()})
+
+        assert self.persistence._load_json(file_path, {}) == {"a": 1}
+        assert sorted(p.name for p in Path(self.test_dir).glob("state.*")) == [
+            "state.json"
+        ]
+
+    def test_logs_append_and_compact(self):
+        """Test that logs are appended line by line and trimmed once they double."""
+        log_file = Path(self.test_dir) / "log.jsonl"
+        for i in range(7):
+            self.persistence._append_jsonl(log_file, {"n": i}, max_records=3)
+
+        # The seventh append crosses 2 * 3 lines and trims back to the last 3
+        assert log_file.read_bytes().count(b"\n") == 3
+        assert self.persistence._load_jsonl(log_file) == [{"n": 4}, {"n": 5}, {"n": 6}]
+        assert self.persistence._load_jsonl(log_file, limit=2) == [{"n": 5}, {"n": 6}]
+
+    def test_log_tail_read_across_blocks(self, monkeypatch):
+        """Test that limited log reads from the end match a full read."""
+        from falconer import persistence as persistence_module
+
+        monkeypatch.setattr(persistence_module, "_TAIL_BLOCK_BYTES", 16)
+        log_file = Path(self.test_dir) / "log.jsonl"
+        for i in range(20):
+            self.persistence._append_jsonl(
+                log_file, {"n": i, "pad": "x" * i}, max_records=100
+            )
+
+        records = self.persistence._load_jsonl(log_file)
+        for limit in (1, 3, 19, 20, 50):
+            assert (
+                self.persistence._load_jsonl(log_file, limit=limit) == records[-limit:]
+            )
+
+    def test_legacy_json_logs_are_converted(self):
+        """Test that logs stored as a JSON array by older versions stay readable."""
+        legacy_file = Path(self.test_dir) / "transaction_history.json"
+        legacy_file.write_text(json.dumps([{"txid": "a"}, {"txid": "b"}]))
+
+        persistence = PersistenceManager(data_dir=self.test_dir)
+
+        assert not legacy_file.exists()
+        assert [tx["txid"] for tx in persistence.load_transaction_history()] == [
+            "a",
+            "b",
+        ]
+
+    def test_unreadable_legacy_log_is_kept(self):
+        """Test that a legacy log that does not parse is set aside, not deleted."""
+        legacy_file = Path(self.test_dir) / "transaction_history.json"
+        legacy_file.write_text('[{"txid": "a"}, {"tx')
+
+        persistence = PersistenceManager(data_dir=self.test_dir)
+
+        corrupt_file = legacy_file.with_suffix(".json.corrupt")
+        assert corrupt_file.read_text() == '[{"txid": "a"}, {"tx'
+        assert not persistence.transaction_history_file.exists()
+        assert persistence.load_transaction_history() == []
+
+    def test_failed_legacy_log_conversion_does_not_raise(self, monkeypatch):
+        """Test that a write error during conversion keeps the legacy log."""
+        legacy_file = Path(self.test_dir) / "transaction_history.json"
+        legacy_file.write_text(json.dumps([{"txid": "a"}]))
+
+        def fail_replace(*args):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "replace", fail_replace)
+        persistence = PersistenceManager(data_dir=self.test_dir)
+
+        assert legacy_file.exists()
+        assert not persistence.transaction_history_file.exists()
+        assert list(Path(self.test_dir).glob("*.tmp")) == []
@@ -160,6 +160,24 @@ class TestPolicyEngine:
         violations = engine.validate_transaction(request)
         assert len(violations) == 0
 
+    def test_allowed_destinations_lookup_set(self):
+        """Test that the allow-list is indexed once as a set."""
+        destinations = [f"bc1qallowed{i}" for i in range(1000)]
+        policy = Policy(
+            max_daily_spend_sats=10000,
+            max_single_tx_sats=5000,
+            allowed_destinations=destinations,
+        )
+        engine = PolicyEngine(policy)
+
+        assert engine.allowed_destinations == frozenset(destinations)
+        allowed = TransactionRequest(destination="bc1qallowed999", amount_sats=1000)
+        assert engine.validate_transaction(allowed) == []
+        denied = TransactionRequest(destination="bc1qallowed1000", amount_sats=1000)
+        assert [v.violation_type for v in engine.validate_transaction(denied)] == [
+            "destination_not_allowed"
+        ]
+
     def test_no_fee_rate_limit(self):
         """Test that no fee rate limit allows any fee rate."""
         policy = Policy(
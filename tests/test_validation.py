@@ -27,6 +27,20 @@ class TestBitcoinAddressValidation:
         for address in valid_addresses:
             assert validate_bitcoin_address(address, "mainnet") is True
 
+    def test_repeated_address_validation_is_cached(self):
+        """Test that a repeated address is validated once per network."""
+        from falconer.validation import _check_address
+
+        address = "bc1qw508d6qejxtdg4y5r3zarvary0c5xw7kv8f3t4"
+        _check_address.cache_clear()
+
+        for _ in range(3):
+            assert validate_bitcoin_address(address, "mainnet") is True
+        assert _check_address.cache_info().hits == 2
+
+        with pytest.raises(AddressValidationError, match="Mainnet address not allowed"):
+            validate_bitcoin_address(address, "testnet")
+
     def test_valid_testnet_addresses(self):
         """Test valid testnet addresses."""
         valid_addresses = [